@@ -13,7 +13,7 @@ import os
 import signal
 import sys
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 # Configuración de logging
 logging.basicConfig(
@@ -43,6 +43,8 @@ class CalendarAIBot:
         self.event_processor = None
         self.event_organizer = None
         self.llm_client = None
+        self.watch_manager = None
+        self.notification_receiver = None
         
         logger.info("Calendar AI Bot inicializado")
 
@@ -94,22 +96,93 @@ class CalendarAIBot:
         # para inicializar interfaces, procesadores, etc.
         logger.info("Componentes inicializados")
 
+    def _start_watch(self, calendars: List[str], jobs: Any) -> None:
+        """
+        Abre canales watch y el receptor de notificaciones si están configurados.
+
+        Args:
+            calendars: IDs de los calendarios a observar
+            jobs: Cola de trabajos de sincronización
+        """
+        watch_config = self.config.get("watch_config", {})
+        if not watch_config.get("enabled") or self.calendar_interface is None:
+            return
+        if not watch_config.get("address"):
+            logger.warning("watch_config.address no configurada; se usará sondeo")
+            return
+
+        from calendar_ai_bot.calendar.watch import NotificationReceiver, WatchManager
+
+        self.watch_manager = WatchManager(
+            self.calendar_interface,
+            watch_config["address"],
+            jobs,
+            renew_before_seconds=watch_config.get("renew_before_seconds", 3600)
+        )
+        self.notification_receiver = NotificationReceiver(
+            self.watch_manager.handle_notification,
+            host=watch_config.get("host", "0.0.0.0"),
+            port=watch_config.get("port", 8080)
+        )
+        self.notification_receiver.start()
+        for calendar_id in calendars:
+            self.watch_manager.watch(calendar_id)
+
+    def _sync_calendar(self, calendar_id: str) -> None:
+        """
+        Sincroniza un calendario tras una notificación o un ciclo de sondeo.
+
+        Args:
+            calendar_id: ID del calendario
+        """
+        if self.calendar_interface is None:
+            logger.info("Ciclo de procesamiento (placeholder)")
+            return
+        changes = self.calendar_interface.sync_events(calendar_id)
+        if changes is not None:
+            logger.info(f"Calendario sincronizado: {changes!r}")
+
     def run(self) -> None:
         """Ejecuta el bucle principal del bot."""
+        from calendar_ai_bot.calendar.watch import SyncJobQueue
+
         self._setup_signal_handlers()
         self.initialize_components()
         
         self.running = True
         polling_interval = self.config.get("app_config", {}).get("polling_interval_seconds", 300)
+        calendars = self.config.get("watch_config", {}).get("calendars", ["primary"])
+        jobs = SyncJobQueue()
         
         logger.info(f"Iniciando bucle principal con intervalo de {polling_interval} segundos")
         
         try:
+            self._start_watch(calendars, jobs)
+            # Sincronización inicial de todos los calendarios
+            for calendar_id in calendars:
+                jobs.put(calendar_id)
+            next_poll = time.monotonic() + polling_interval
+
             while self.running:
-                # Este bucle se implementará en futuras versiones
-                # para monitorear y procesar eventos de calendario
-                logger.info("Ciclo de procesamiento (placeholder)")
-                time.sleep(polling_interval)
+                # Sin canal watch activo, se recurre al sondeo periódico
+                polled = self.watch_manager.polled_calendars if self.watch_manager else calendars
+                now = time.monotonic()
+                if polled and now >= next_poll:
+                    for calendar_id in polled:
+                        jobs.put(calendar_id)
+                    next_poll = now + polling_interval
+
+                timeout = max(0.0, next_poll - now) if polled else polling_interval
+                if self.watch_manager:
+                    renewal = self.watch_manager.seconds_until_renewal()
+                    if renewal == 0:
+                        self.watch_manager.renew_expiring()
+                    elif renewal is not None:
+                        timeout = min(timeout, renewal)
+
+                calendar_id = jobs.get(timeout=timeout)
+                if calendar_id is not None:
+                    self._sync_calendar(calendar_id)
         except Exception as e:
             logger.error(f"Error en el bucle principal: {e}")
         finally:
@@ -118,7 +191,10 @@ class CalendarAIBot:
     def shutdown(self) -> None:
         """Realiza tareas de limpieza y cierre."""
         logger.info("Cerrando Calendar AI Bot...")
-        # Aquí se implementarán tareas de limpieza
+        if self.watch_manager is not None:
+            self.watch_manager.stop_all()
+        if self.notification_receiver is not None:
+            self.notification_receiver.stop()
         logger.info("Calendar AI Bot cerrado correctamente")
 
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compara los filtros y estadísticas de CalendarFilter con los de EventBatch.
+
+Genera eventos sintéticos repartidos en varios calendarios y mide
+`filter_by_date_range`, `filter_by_duration` y las estadísticas de duración
+sobre listas de objetos `Event` ya normalizados (bucles de Python) y sobre
+el lote columnar (numpy). La conversión a lote se mide aparte, porque se
+hace una sola vez al ingresar los datos.
+
+Uso:
+    python benchmarks/bench_event_batch.py [--events 1000000] [--calendars 20] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from calendar_ai_bot.calendar.batch import EventBatch  # noqa: E402
+from calendar_ai_bot.calendar.filters import CalendarFilter  # noqa: E402
+from calendar_ai_bot.calendar.models import Event  # noqa: E402
+
+TITLES = ['Reunión de equipo', 'Llamada con cliente', 'Trabajo en proyecto', 'Almuerzo', 'Revisión', 'Personal']
+
+
+def make_events(count, calendars, seed=0):
+    """Genera eventos normalizados en un rango de seis meses."""
+    rng = random.Random(seed)
+    base = int(datetime(2025, 1, 1).timestamp())
+    per_calendar = {f'cal{i}@example.com': [] for i in range(calendars)}
+    names = list(per_calendar)
+    for i in range(count):
+        start = base + 1800 * rng.randint(0, 48 * 180)
+        per_calendar[names[i % calendars]].append(Event(
+            id=f'e{i}', title=rng.choice(TITLES), start=start, end=start + 1800 * rng.randint(1, 6)
+        ))
+    return per_calendar
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def python_stats(events):
+    durations = [e.end - e.start for e in events if not e.all_day and e.start is not None and e.end is not None]
+    return statistics.mean(durations), statistics.median(durations), sum(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=1_000_000)
+    parser.add_argument('--calendars', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    per_calendar = make_events(args.events, args.calendars)
+    events = [event for calendar_events in per_calendar.values() for event in calendar_events]
+
+    start = time.perf_counter()
+    batch = EventBatch.from_calendars(per_calendar)
+    print(f"{args.events} eventos, {args.calendars} calendarios; conversión a lote: "
+          f"{time.perf_counter() - start:.2f} s")
+
+    calendar_filter = CalendarFilter()
+    window = ('2025-03-01T00:00:00-03:00', '2025-03-31T23:59:59-03:00')
+    cases = [
+        ('filter_by_date_range',
+         lambda: calendar_filter.filter_by_date_range(events, *window),
+         lambda: calendar_filter.filter_by_date_range(batch, *window)),
+        ('filter_by_duration',
+         lambda: calendar_filter.filter_by_duration(events, min_duration=timedelta(hours=1)),
+         lambda: calendar_filter.filter_by_duration(batch, min_duration=timedelta(hours=1))),
+        ('estadísticas de duración',
+         lambda: python_stats(events),
+         lambda: batch.duration_stats())
+    ]
+
+    for label, loop, vectorized in cases:
+        loop_time = best_of(args.repeat, loop)
+        vector_time = best_of(args.repeat, vectorized)
+        print(f"  {label:<26} listas={loop_time * 1000:9.1f} ms  lote={vector_time * 1000:8.2f} ms  "
+              f"aceleración={loop_time / vector_time:5.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmarks reproducibles de CalendarInterface contra el servidor local de Calendar.
+
+Mide latencia y throughput sin red ni credenciales reales: paginación con
+distintos tamaños de página, descarga paralela de varios calendarios y
+escrituras individuales frente a lotes. La latencia del servidor simula el
+tiempo de ida y vuelta de la API.
+
+Uso:
+    python benchmarks/bench_fake_calendar.py [--events 2000] [--calendars 8] [--latency-ms 20] [--qps 1000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from calendar_ai_bot.calendar.interface import CalendarInterface  # noqa: E402
+from calendar_ai_bot.calendar.quota import QuotaScheduler  # noqa: E402
+from calendar_ai_bot.testing import FakeCalendarServer  # noqa: E402
+
+
+def make_events(count, rng):
+    """Genera eventos con horarios aleatorios en un trimestre."""
+    events = []
+    for i in range(count):
+        start = datetime(2025, 3, 1, 8) + timedelta(hours=rng.randint(0, 24 * 90))
+        end = start + timedelta(minutes=30 * rng.randint(1, 4))
+        events.append({
+            'summary': f'Reunión {i}',
+            'start': {'dateTime': start.strftime('%Y-%m-%dT%H:%M:%S-03:00')},
+            'end': {'dateTime': end.strftime('%Y-%m-%dT%H:%M:%S-03:00')},
+            'attendees': [{'email': f'persona{j}@example.com'} for j in range(rng.randint(1, 5))]
+        })
+    return events
+
+
+def timed(label, func, requests_before, server):
+    """Ejecuta `func` e imprime su duración y las solicitudes a la API (en un lote cuentan todas)."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    requests = sum(server.request_counts.values()) - requests_before
+    print(f"{label:<42} {elapsed * 1000:9.1f} ms  {requests:5d} solicitudes  "
+          f"{requests / elapsed if elapsed else 0:8.1f} sol/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--calendars', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=50)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--qps', type=float, default=1000.0, help='cuota por usuario del planificador')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    latency = args.latency_ms / 1000
+
+    with FakeCalendarServer(latency=latency) as server, tempfile.TemporaryDirectory() as directory:
+        server.add_events('primary', make_events(args.events, rng))
+        calendar_ids = [f'equipo{i}@example.com' for i in range(args.calendars)]
+        for calendar_id in calendar_ids:
+            server.add_events(calendar_id, make_events(args.events // args.calendars, rng))
+
+        quota = QuotaScheduler(requests_per_second=args.qps, burst=args.qps,
+                               is_retryable=CalendarInterface._is_retryable_error)
+        interface = server.create_interface(directory, quota=quota)
+        count = lambda: sum(server.request_counts.values())  # noqa: E731
+
+        print(f"{args.events} eventos, {args.calendars} calendarios adicionales, "
+              f"latencia {args.latency_ms:.0f} ms por solicitud\n")
+
+        for page_size in (250, 2500):
+            timed(f"get_events (página de {page_size})",
+                  lambda: interface.get_events(max_results=None, fields='timing') if page_size == 2500
+                  else list(interface.iter_events(page_size=page_size, fields='timing')),
+                  count(), server)
+
+        for workers in (1, args.calendars):
+            timed(f"get_events_for_calendars ({workers} hilos)",
+                  lambda: interface.get_events_for_calendars(calendar_ids, max_workers=workers),
+                  count(), server)
+
+        writes = make_events(args.writes, rng)
+        timed(f"create_event x{args.writes} (secuencial)",
+              lambda: [interface.create_event('primary', event) for event in writes], count(), server)
+        timed(f"batch_create_events x{args.writes}",
+              lambda: interface.batch_create_events('primary', writes), count(), server)
+
+        timed("sync_events (completa)", lambda: interface.sync_events(), count(), server)
+        interface.create_event('primary', writes[0])
+        timed("sync_events (incremental, 1 cambio)", lambda: interface.sync_events(), count(), server)
+
+        wait = quota.metrics()['interactive']
+        print(f"\nespera en cola (interactiva): media {wait['avg_wait'] * 1000:.2f} ms, "
+              f"máxima {wait['max_wait'] * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
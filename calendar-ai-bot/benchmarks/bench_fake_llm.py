@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de LLMClient contra el proveedor LLM local (sin red ni claves reales).
+
+Compara resúmenes individuales frente a empaquetados, mide el tiempo hasta
+el primer valor JSON con y sin streaming, y el throughput con varios hilos
+sobre el pool compartido, con una distribución de latencias log-normal y una
+tasa configurable de errores 429 (que el SDK reintenta).
+
+Uso:
+    python benchmarks/bench_fake_llm.py [--events 40] [--latency-ms 150] [--tps 400] [--error-rate 0.05]
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from calendar_ai_bot.llm.client import LLMClient  # noqa: E402
+from calendar_ai_bot.testing import FakeLLMServer  # noqa: E402
+
+
+def make_events(count):
+    """Genera eventos sintéticos."""
+    return [
+        {
+            'id': f'evt{i}',
+            'summary': f'Reunión {i}',
+            'description': 'Revisión de avances y próximos pasos. ' * 3,
+            'start': {'dateTime': f'2025-03-{10 + i % 5:02d}T{9 + i % 8:02d}:00:00-03:00'},
+            'end': {'dateTime': f'2025-03-{10 + i % 5:02d}T{10 + i % 8:02d}:00:00-03:00'},
+            'attendees': [{'email': f'persona{j}@example.com'} for j in range(3)]
+        }
+        for i in range(count)
+    ]
+
+
+def packed_responder(messages, params):
+    """Responde con un resumen por evento cuando el prompt es empaquetado."""
+    prompt = messages[-1]['content']
+    keys = [line[1:line.index(']')] for line in prompt.splitlines() if line.startswith('[') and ']' in line]
+    if len(keys) > 1:
+        return '[' + ','.join(f'{{"id":"{key}","summary":"Resumen de {key}"}}' for key in keys) + ']'
+    if (params.get('response_format') or {}).get('type') == 'json_object':
+        return '{"total_events": 1, "recommendations": []}' + ' relleno' * 200
+    return 'Resumen individual del evento.'
+
+
+def timed(label, func):
+    """Ejecuta `func` e imprime su duración."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:9.1f} ms")
+    return result, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=40)
+    parser.add_argument('--latency-ms', type=float, default=150.0, help='mediana de la latencia al primer token')
+    parser.add_argument('--tps', type=float, default=400.0, help='tokens por segundo generados')
+    parser.add_argument('--error-rate', type=float, default=0.05)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mu = math.log(args.latency_ms / 1000)
+
+    with FakeLLMServer(latency=lambda: rng.lognormvariate(mu, 0.4), tokens_per_second=args.tps,
+                       error_rate=args.error_rate, responder=packed_responder, seed=args.seed) as server:
+        config = {'provider': 'openai', 'api_key': 'local', 'base_url': server.base_url,
+                  'model': 'modelo-local', 'max_tokens': 2048}
+        client = LLMClient(config)
+        events = make_events(args.events)
+
+        print(f"{args.events} eventos, latencia mediana {args.latency_ms:.0f} ms, "
+              f"{args.tps:.0f} tokens/s, {args.error_rate:.0%} de errores 429\n")
+
+        before = len(server.requests)
+        timed("resúmenes individuales", lambda: [client.generate_event_summary(e) for e in events[:10]])
+        individual = len(server.requests) - before
+        before = len(server.requests)
+        timed("resúmenes empaquetados (x10 eventos)", lambda: client.generate_event_summaries(events[:10]))
+        print(f"{'':<40} solicitudes: {individual} individuales vs {len(server.requests) - before} empaquetadas")
+
+        for streaming in (False, True):
+            client.stream_responses = streaming
+            timed(f"análisis JSON ({'streaming' if streaming else 'respuesta completa'})",
+                  lambda: client.analyze_schedule(events[:5]))
+        client.stream_responses = False
+
+        latencies = []
+
+        def one(event):
+            start = time.perf_counter()
+            client.generate_event_summary(event)
+            latencies.append(time.perf_counter() - start)
+
+        for workers in (1, args.workers):
+            latencies.clear()
+            _, elapsed = timed(f"{args.events} resúmenes con {workers} hilos",
+                               lambda: list(ThreadPoolExecutor(workers).map(one, events)))
+            p95 = sorted(latencies)[int(len(latencies) * 0.95) - 1]
+            print(f"{'':<40} {args.events / elapsed:6.1f} sol/s  p50 {statistics.median(latencies) * 1000:.0f} ms"
+                  f"  p95 {p95 * 1000:.0f} ms")
+
+        print(f"\nrespuestas del servidor: {dict(sorted(server.status_counts.items()))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Mide el ahorro de payload y de tiempo de parseo de las proyecciones de campos.
+
+Simula la respuesta de events().list para un calendario sintético y aplica
+localmente la misma proyección que la API aplicaría con el parámetro `fields`.
+
+Uso:
+    python benchmarks/bench_field_projection.py [--events 5000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from calendar_ai_bot.calendar.interface import CalendarInterface, FIELD_PRESETS  # noqa: E402
+
+
+def make_event(i, rng):
+    """Genera un evento con la forma completa que devuelve la API."""
+    start = datetime(2025, 3, 1, 8) + timedelta(hours=rng.randint(0, 24 * 90))
+    end = start + timedelta(minutes=30 * rng.randint(1, 4))
+    return {
+        'kind': 'calendar#event',
+        'etag': f'"{rng.getrandbits(64)}"',
+        'id': f'evt{i:06d}',
+        'status': 'confirmed',
+        'htmlLink': f'https://www.google.com/calendar/event?eid=evt{i:06d}',
+        'created': '2025-01-01T12:00:00.000Z',
+        'updated': '2025-02-01T12:00:00.000Z',
+        'summary': f'Reunión {i}',
+        'description': 'Agenda de la reunión. ' * rng.randint(5, 40),
+        'location': 'Sala 3, Edificio Central',
+        'creator': {'email': 'ana@example.com'},
+        'organizer': {'email': 'ana@example.com', 'self': True},
+        'start': {'dateTime': start.strftime('%Y-%m-%dT%H:%M:%S-03:00'), 'timeZone': 'America/Santiago'},
+        'end': {'dateTime': end.strftime('%Y-%m-%dT%H:%M:%S-03:00'), 'timeZone': 'America/Santiago'},
+        'iCalUID': f'evt{i:06d}@google.com',
+        'sequence': 0,
+        'attendees': [
+            {'email': f'persona{j}@example.com', 'responseStatus': 'accepted', 'displayName': f'Persona {j}'}
+            for j in range(rng.randint(1, 8))
+        ],
+        'hangoutLink': 'https://meet.google.com/abc-defg-hij',
+        'conferenceData': {
+            'entryPoints': [{'entryPointType': 'video', 'uri': 'https://meet.google.com/abc-defg-hij',
+                             'label': 'meet.google.com/abc-defg-hij'}],
+            'conferenceSolution': {'key': {'type': 'hangoutsMeet'}, 'name': 'Google Meet',
+                                   'iconUri': 'https://fonts.gstatic.com/s/i/productlogos/meet_2020q4/v6/web-512dp/logo_meet_2020q4_color_2x_web_512dp.png'},
+            'conferenceId': 'abc-defg-hij'
+        },
+        'reminders': {'useDefault': False, 'overrides': [{'method': 'popup', 'minutes': 10}]},
+        'attachments': [{'fileUrl': 'https://drive.google.com/file/d/xyz', 'title': 'Minuta.pdf',
+                         'mimeType': 'application/pdf'}],
+        'eventType': 'default'
+    }
+
+
+def parse_fields(spec):
+    """Convierte una especificación `fields` en un árbol {campo: subárbol | None}."""
+    tree, stack, name = {}, [], ''
+    current = tree
+    for char in spec + ',':
+        if char in ',()':
+            if name:
+                current[name.strip()] = {} if char == '(' else None
+            if char == '(':
+                stack.append(current)
+                current = current[name.strip()]
+            elif char == ')':
+                current = stack.pop()
+            name = ''
+        else:
+            name += char
+    return tree
+
+
+def project(value, tree):
+    """Aplica un árbol de campos a un recurso JSON."""
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if not isinstance(value, dict) or not tree:
+        return value
+    return {key: project(value[key], sub) for key, sub in tree.items() if key in value}
+
+
+def timed_parse(payload, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json.loads(payload)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    response = {'kind': 'calendar#events', 'items': [make_event(i, rng) for i in range(args.events)]}
+    full_payload = json.dumps(response)
+    full_time = timed_parse(full_payload, args.repeat)
+
+    print(f"Calendario sintético: {args.events} eventos")
+    print(f"{'preset':<14}{'bytes':>12}{'ahorro':>9}{'parseo ms':>12}{'acelera':>9}")
+    for preset in FIELD_PRESETS:
+        spec = CalendarInterface._resolve_fields(preset)
+        payload = json.dumps(project(response, parse_fields(spec))) if spec else full_payload
+        parse_time = timed_parse(payload, args.repeat)
+        print(f"{preset:<14}{len(payload):>12,}{1 - len(payload) / len(full_payload):>9.1%}"
+              f"{parse_time * 1000:>12.1f}{full_time / parse_time:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Mide el tiempo de importación del paquete con `python -X importtime`.
+
+Sale con código 1 si la mediana supera el presupuesto, para usarse como
+control de regresión en CI.
+
+Uso:
+    python benchmarks/bench_import_time.py [--runs 5] [--budget-ms 100]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+IMPORT_STATEMENT = (
+    "import calendar_ai_bot, calendar_ai_bot.calendar, calendar_ai_bot.llm, calendar_ai_bot.utils"
+)
+HEAVY_MODULES = ('groq', 'openai', 'googleapiclient', 'google.oauth2', 'google_auth_oauthlib')
+
+
+def measure_once():
+    """
+    Ejecuta un intérprete nuevo e interpreta la salida de -X importtime.
+
+    Returns:
+        Tupla (microsegundos totales, lista de (microsegundos acumulados, módulo))
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_STATEMENT],
+        cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+    total = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        cumulative_us = int(cumulative)
+        modules.append((cumulative_us, name.rstrip()))
+        # Solo cuentan las importaciones de nivel superior del paquete; el
+        # arranque del intérprete (site, encodings) queda fuera del presupuesto
+        if name.startswith(' calendar_ai_bot'):
+            total += cumulative_us
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=100.0)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+    totals_ms = [total / 1000 for total, _ in runs]
+    median_ms = statistics.median(totals_ms)
+
+    _, modules = runs[-1]
+    loaded_heavy = sorted({
+        name.strip() for _, name in modules
+        if name.strip().startswith(HEAVY_MODULES)
+    })
+
+    print(f"import calendar_ai_bot.*: mediana {median_ms:.1f} ms "
+          f"(min {min(totals_ms):.1f}, max {max(totals_ms):.1f}, {args.runs} ejecuciones)")
+    print(f"Presupuesto: {args.budget_ms:.1f} ms")
+    print("Módulos más lentos (acumulado, última ejecución):")
+    for cumulative_us, name in sorted(modules, reverse=True)[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name.strip()}")
+
+    if loaded_heavy:
+        print(f"SDK pesados importados de forma anticipada: {', '.join(loaded_heavy)}")
+        return 1
+    if median_ms > args.budget_ms:
+        print("Presupuesto de importación excedido")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
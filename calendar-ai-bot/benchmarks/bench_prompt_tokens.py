@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Mide el ahorro de tokens de los prompts compactos sobre un corpus sintético.
+
+Uso:
+    python benchmarks/bench_prompt_tokens.py [--events 200] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from calendar_ai_bot.llm.client import LLMClient  # noqa: E402
+
+TITLES = ['Reunión de equipo', 'Llamada con cliente', 'Revisión de proyecto',
+          'Planificación semanal', 'Almuerzo', 'Entrevista', '1:1', 'Demo de producto']
+DOMAINS = ['example.com', 'cliente.cl', 'partner.io']
+NAMES = ['ana', 'luis', 'sofia', 'pedro', 'camila', 'jorge', 'valentina', 'diego']
+
+
+def make_corpus(count, seed):
+    """Genera eventos sintéticos con forma de respuesta de la API."""
+    rng = random.Random(seed)
+    base = datetime(2025, 3, 10, 8, 0)
+    events = []
+    for i in range(count):
+        start = base + timedelta(days=rng.randint(0, 13), minutes=30 * rng.randint(0, 18))
+        end = start + timedelta(minutes=30 * rng.randint(1, 4))
+        attendees = [
+            {'email': f"{rng.choice(NAMES)}@{rng.choice(DOMAINS)}", 'responseStatus': 'accepted'}
+            for _ in range(rng.randint(1, 6))
+        ]
+        events.append({
+            'id': f"evt{i:05d}",
+            'summary': rng.choice(TITLES),
+            'description': 'Agenda:\n  - revisar avances\n  - próximos pasos' if rng.random() < 0.5 else '',
+            'start': {'dateTime': start.strftime('%Y-%m-%dT%H:%M:%S-03:00'), 'timeZone': 'America/Santiago'},
+            'end': {'dateTime': end.strftime('%Y-%m-%dT%H:%M:%S-03:00'), 'timeZone': 'America/Santiago'},
+            'attendees': attendees
+        })
+    return events
+
+
+def count_tokens(text):
+    """Cuenta tokens con tiktoken si está disponible; si no, estima 4 caracteres por token."""
+    try:
+        import tiktoken
+        return len(tiktoken.get_encoding('cl100k_base').encode(text))
+    except ImportError:
+        return LLMClient._estimate_tokens(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--events', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    events = make_corpus(args.events, args.seed)
+    verbose = LLMClient({'provider': 'groq', 'api_key': 'bench', 'compact_prompts': False})
+    compact = LLMClient({'provider': 'groq', 'api_key': 'bench', 'compact_prompts': True})
+    packed_items = [(e['id'], e) for e in events[:20]]
+
+    cases = [
+        ('resumen por evento (total)',
+         lambda c: sum(count_tokens(c._build_event_summary_prompt(e)) for e in events)),
+        ('análisis de agenda',
+         lambda c: count_tokens(c._build_schedule_analysis_prompt(events))),
+        ('resumen empaquetado (20 eventos)',
+         lambda c: count_tokens(c._build_packed_summary_prompt(packed_items))),
+    ]
+
+    print(f"Corpus: {len(events)} eventos sintéticos")
+    print(f"{'prompt':<36}{'verboso':>10}{'compacto':>10}{'ahorro':>9}")
+    for name, measure in cases:
+        before, after = measure(verbose), measure(compact)
+        print(f"{name:<36}{before:>10}{after:>10}{1 - after / before:>9.1%}")
+
+
+if __name__ == '__main__':
+    main()
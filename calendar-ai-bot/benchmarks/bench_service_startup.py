@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Mide el costo de crear instancias de CalendarInterface.
+
+Compara la construcción dinámica original (`discovery.build` en cada
+instancia) con el registro de servicios, que parsea el documento de
+descubrimiento estático una vez y comparte el servicio por credenciales.
+No realiza llamadas de red: el token es ficticio.
+
+Uso:
+    python benchmarks/bench_service_startup.py [--instances 200] [--users 4]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from googleapiclient import discovery  # noqa: E402
+from google.oauth2.credentials import Credentials  # noqa: E402
+
+from calendar_ai_bot.calendar.interface import CalendarInterface  # noqa: E402
+from calendar_ai_bot.calendar.service import CALENDAR_SCOPES, ServiceRegistry  # noqa: E402
+
+
+def write_tokens(directory, users):
+    """Crea archivos de token ficticios, uno por usuario."""
+    paths = []
+    for i in range(users):
+        path = os.path.join(directory, f'token_{i}.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'token': f't{i}', 'refresh_token': 'r', 'client_id': 'c', 'client_secret': 's'}, f)
+        paths.append(path)
+    return paths
+
+
+def legacy_build(token_path):
+    """Reproduce el `_build_service` anterior: credenciales + build dinámico."""
+    creds = Credentials.from_authorized_user_file(token_path, list(CALENDAR_SCOPES))
+    return discovery.build('calendar', 'v3', credentials=creds)
+
+
+def time_instances(factory, token_paths, instances):
+    """Devuelve la latencia (ms) de cada creación de instancia."""
+    timings = []
+    for i in range(instances):
+        start = time.perf_counter()
+        factory(token_paths[i % len(token_paths)])
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    print(f"{label:<28} primera={timings[0]:8.3f} ms  mediana={statistics.median(timings):8.3f} ms  "
+          f"total={sum(timings):9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--instances', type=int, default=200)
+    parser.add_argument('--users', type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        token_paths = write_tokens(directory, args.users)
+        sync_file = os.path.join(directory, 'sync_tokens.json')
+
+        legacy = time_instances(legacy_build, token_paths, args.instances)
+
+        registry = ServiceRegistry()
+        cached = time_instances(
+            lambda token_path: CalendarInterface('credentials.json', token_path, sync_file, services=registry),
+            token_paths, args.instances
+        )
+
+    print(f"{args.instances} instancias, {args.users} usuarios")
+    report('discovery.build por instancia', legacy)
+    report('registro de servicios', cached)
+    print(f"aceleración (mediana): {statistics.median(legacy) / statistics.median(cached):.0f}x")
+
+
+if __name__ == '__main__':
+    main()
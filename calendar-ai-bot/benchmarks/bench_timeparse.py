@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Mide el throughput del parseo de marcas de tiempo de eventos.
+
+Compara `dateutil.parser.parse` (la implementación anterior de
+`_parse_event_time`) con la ruta rápida de `utils.timeparse` sin caché y con
+la caché LRU, sobre marcas de tiempo con la forma que devuelve Calendar API.
+El conjunto "realista" repite horas como lo hace una agenda (inicios y fines
+en medias horas); el conjunto "único" no repite ninguna cadena.
+
+Uso:
+    python benchmarks/bench_timeparse.py [--count 1000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dateutil.parser import parse as dateutil_parse  # noqa: E402
+
+from calendar_ai_bot.utils.timeparse import (  # noqa: E402
+    clear_parse_cache, parse_event_time, parse_iso_datetime
+)
+
+
+def make_timestamps(count, unique, seed=0):
+    """Genera cadenas RFC 3339 con offset o en UTC ('Z')."""
+    rng = random.Random(seed)
+    base = datetime(2025, 3, 1, 8)
+    offsets = [timezone(timedelta(hours=-3)), timezone(timedelta(hours=-4)), timezone.utc]
+    result = []
+    for i in range(count):
+        if unique:
+            value = base + timedelta(seconds=i)
+        else:
+            value = base + timedelta(minutes=30 * rng.randint(0, 24 * 2 * 90))
+        tz = offsets[i % len(offsets)]
+        text = value.replace(tzinfo=tz).isoformat()
+        result.append(text.replace('+00:00', 'Z'))
+    return result
+
+
+def measure(label, func, timestamps):
+    start = time.perf_counter()
+    for text in timestamps:
+        func(text)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed:7.2f} s  {len(timestamps) / elapsed / 1e6:6.2f} M/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for label, unique in (('realista', False), ('único', True)):
+        timestamps = make_timestamps(args.count, unique)
+        print(f"{args.count} marcas de tiempo ({label}, {len(set(timestamps))} distintas)")
+        baseline = measure('dateutil.parser.parse', dateutil_parse, timestamps)
+        fast = measure('fromisoformat (sin caché)', parse_iso_datetime, timestamps)
+        clear_parse_cache()
+        cached = measure('parse_event_time (LRU)', parse_event_time, timestamps)
+        print(f"  aceleración: {baseline / fast:.0f}x sin caché, {baseline / cached:.0f}x con caché")
+
+
+if __name__ == '__main__':
+    main()
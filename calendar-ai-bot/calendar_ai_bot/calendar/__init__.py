@@ -3,13 +3,33 @@ Módulo de integración con Calendar.
 """
 
 from .interface import CalendarInterface
+from .models import Event, to_events
+from .batch import EventBatch
+from .async_interface import AsyncCalendarInterface
 from .processor import EventProcessor
 from .organizer import EventOrganizer
+from .recurrence import RecurrenceExpander
 from .filters import CalendarFilter
+from .etags import ETagStore
+from .store import EventStore
+from .sync import EventChangeSet, SyncTokenStore
+from .watch import NotificationReceiver, SyncJobQueue, WatchManager
 
 __all__ = [
     'CalendarInterface',
+    'Event',
+    'to_events',
+    'EventBatch',
+    'AsyncCalendarInterface',
     'EventProcessor',
     'EventOrganizer',
-    'CalendarFilter'
+    'RecurrenceExpander',
+    'CalendarFilter',
+    'ETagStore',
+    'EventChangeSet',
+    'EventStore',
+    'SyncTokenStore',
+    'NotificationReceiver',
+    'SyncJobQueue',
+    'WatchManager'
 ]
@@ -0,0 +1,343 @@
+"""
+Interfaz asíncrona para la API de Google Calendar sobre httpx.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Dict, Any, AsyncIterator, List, Optional
+from urllib.parse import quote
+
+from ..utils.lazy import lazy_import
+from .interface import MAX_PAGE_SIZE, RATE_LIMIT_REASONS, RETRYABLE_STATUSES, CalendarInterface
+
+httpx = lazy_import('httpx')
+
+logger = logging.getLogger(__name__)
+
+API_BASE_URL = 'https://www.googleapis.com/calendar/v3'
+
+class CalendarAPIError(Exception):
+    """
+    Error devuelto por la API de Calendar en la interfaz asíncrona.
+    """
+
+    def __init__(self, status: int, content: bytes):
+        """
+        Inicializa el error.
+
+        Args:
+            status: Código de estado HTTP
+            content: Cuerpo de la respuesta
+        """
+        super().__init__(f"HTTP {status}: {content[:200]!r}")
+        self.status = status
+        self.content = content
+
+class AsyncCalendarInterface:
+    """
+    Operaciones de Google Calendar API sin bloquear el bucle de eventos.
+
+    Todas las solicitudes comparten un cliente `httpx.AsyncClient` con pool
+    de conexiones keep-alive, por lo que muchas llamadas pequeñas pueden
+    solaparse entre sí (y con llamadas al LLM) con `asyncio.gather`. Las
+    cabeceras de autorización se obtienen de `CredentialsManager`.
+    """
+
+    def __init__(self,
+                 credentials: Any,
+                 client: Optional[Any] = None,
+                 base_url: str = API_BASE_URL,
+                 max_connections: int = 100,
+                 max_keepalive_connections: int = 20,
+                 timeout: float = 30.0,
+                 max_retries: int = 3,
+                 backoff_seconds: float = 1.0):
+        """
+        Inicializa la interfaz asíncrona.
+
+        Args:
+            credentials: CredentialsManager que provee las cabeceras de autorización
+            client: Cliente httpx.AsyncClient compartido (por defecto, uno propio)
+            base_url: URL base de la API
+            max_connections: Conexiones simultáneas máximas del pool propio
+            max_keepalive_connections: Conexiones inactivas que se mantienen abiertas
+            timeout: Tiempo máximo por solicitud en segundos
+            max_retries: Reintentos ante límites de tasa o errores del servidor
+            backoff_seconds: Espera base del backoff exponencial
+        """
+        self.credentials = credentials
+        self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._owns_client = client is None
+        self.client = client if client is not None else httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_keepalive_connections),
+            timeout=timeout
+        )
+        # El candado se crea dentro del bucle de eventos (ver `_auth_headers`):
+        # en Python 3.9 asyncio.Lock queda ligado al bucle activo al crearse
+        self._auth_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> 'AsyncCalendarInterface':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Cierra el cliente HTTP si fue creado por la interfaz.
+        """
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        """
+        Obtiene las cabeceras de autorización sin bloquear el bucle de eventos.
+
+        Returns:
+            Cabeceras HTTP de autorización
+        """
+        headers = self._valid_auth_headers()
+        if headers is not None:
+            return headers
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        # El refresco del token es bloqueante: se hace una vez, en un hilo
+        async with self._auth_lock:
+            # Otra corrutina pudo refrescar el token mientras se esperaba el candado
+            headers = self._valid_auth_headers()
+            if headers is not None:
+                return headers
+            return await asyncio.to_thread(self.credentials.get_auth_headers)
+
+    def _valid_auth_headers(self) -> Optional[Dict[str, str]]:
+        creds = getattr(self.credentials, 'credentials', None)
+        if creds is not None and getattr(creds, 'valid', False):
+            return {'Authorization': f'Bearer {creds.token}'}
+        return None
+
+    @staticmethod
+    def _is_retryable(status: int, content: bytes) -> bool:
+        if status in RETRYABLE_STATUSES:
+            return True
+        return status == 403 and any(reason in content.lower() for reason in RATE_LIMIT_REASONS)
+
+    async def _request(self, method: str, path: str,
+                       params: Optional[Dict[str, Any]] = None,
+                       json: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Envía una solicitud a la API con reintentos ante errores transitorios.
+
+        Args:
+            method: Método HTTP
+            path: Ruta relativa a la URL base
+            params: Parámetros de consulta (se omiten los None)
+            json: Cuerpo JSON
+
+        Returns:
+            Respuesta decodificada, o None si la respuesta no tiene cuerpo
+
+        Raises:
+            CalendarAPIError: Si la API responde con un error no recuperable
+        """
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+
+        for attempt in range(self.max_retries + 1):
+            response = await self.client.request(
+                method, f"{self.base_url}{path}", params=params, json=json,
+                headers=await self._auth_headers()
+            )
+            if response.status_code < 400:
+                return response.json() if response.content else None
+            if attempt < self.max_retries and self._is_retryable(response.status_code, response.content):
+                delay = self.backoff_seconds * (2 ** attempt) + random.uniform(0, self.backoff_seconds)
+                logger.warning(f"Error transitorio {response.status_code}; reintento en {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            raise CalendarAPIError(response.status_code, response.content)
+
+    @staticmethod
+    def _events_path(calendar_id: str, event_id: Optional[str] = None) -> str:
+        path = f"/calendars/{quote(calendar_id, safe='')}/events"
+        return f"{path}/{quote(event_id, safe='')}" if event_id else path
+
+    async def list_calendars(self) -> List[Dict[str, Any]]:
+        """
+        Lista todos los calendarios del usuario.
+
+        Returns:
+            Lista de calendarios
+        """
+        calendars = []
+        page_token = None
+        try:
+            while True:
+                response = await self._request('GET', '/users/me/calendarList', {'pageToken': page_token})
+                calendars.extend(response.get('items', []))
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    return calendars
+        except (CalendarAPIError, httpx.HTTPError) as error:
+            logger.error(f"Error al listar calendarios: {error}")
+            return calendars
+
+    async def get_event(self, calendar_id: str, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene un evento.
+
+        Args:
+            calendar_id: ID del calendario
+            event_id: ID del evento
+
+        Returns:
+            Evento o None si falla
+        """
+        try:
+            return await self._request('GET', self._events_path(calendar_id, event_id))
+        except (CalendarAPIError, httpx.HTTPError) as error:
+            logger.error(f"Error al obtener evento: {error}")
+            return None
+
+    async def iter_events(self, calendar_id: str = 'primary',
+                          time_min: Optional[str] = None,
+                          time_max: Optional[str] = None,
+                          page_size: int = MAX_PAGE_SIZE,
+                          fields: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Itera sobre los eventos de un calendario siguiendo la paginación.
+
+        Args:
+            calendar_id: ID del calendario (por defecto: primary)
+            time_min: Tiempo mínimo para los eventos
+            time_max: Tiempo máximo para los eventos
+            page_size: Eventos por página (máximo 2500)
+            fields: Proyección de campos o preset ('timing', 'participants', 'full')
+
+        Yields:
+            Eventos en orden de inicio
+        """
+        params = {
+            'timeMin': time_min,
+            'timeMax': time_max,
+            'maxResults': min(page_size, MAX_PAGE_SIZE),
+            'singleEvents': 'true',
+            'orderBy': 'startTime',
+            'fields': CalendarInterface._resolve_fields(fields)
+        }
+        page_token = None
+
+        while True:
+            try:
+                response = await self._request('GET', self._events_path(calendar_id),
+                                               {**params, 'pageToken': page_token})
+            except (CalendarAPIError, httpx.HTTPError) as error:
+                logger.error(f"Error al obtener eventos: {error}")
+                return
+
+            for event in response.get('items', []):
+                yield event
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
+
+    async def get_events(self, calendar_id: str = 'primary',
+                         time_min: Optional[str] = None,
+                         time_max: Optional[str] = None,
+                         max_results: Optional[int] = 10,
+                         fields: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene eventos de un calendario.
+
+        Args:
+            calendar_id: ID del calendario (por defecto: primary)
+            time_min: Tiempo mínimo para los eventos
+            time_max: Tiempo máximo para los eventos
+            max_results: Número máximo de resultados (None para todos)
+            fields: Proyección de campos o preset ('timing', 'participants', 'full')
+
+        Returns:
+            Lista de eventos
+        """
+        page_size = min(max_results, MAX_PAGE_SIZE) if max_results else MAX_PAGE_SIZE
+        events = []
+        async for event in self.iter_events(calendar_id, time_min, time_max, page_size, fields):
+            events.append(event)
+            if max_results and len(events) >= max_results:
+                break
+        return events
+
+    async def create_event(self, calendar_id: str, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Crea un nuevo evento en el calendario.
+
+        Args:
+            calendar_id: ID del calendario
+            event: Detalles del evento
+
+        Returns:
+            Evento creado o None si falla
+        """
+        try:
+            return await self._request('POST', self._events_path(calendar_id), json=event)
+        except (CalendarAPIError, httpx.HTTPError) as error:
+            logger.error(f"Error al crear evento: {error}")
+            return None
+
+    async def update_event(self, calendar_id: str, event_id: str,
+                           event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Reemplaza un evento existente.
+
+        Args:
+            calendar_id: ID del calendario
+            event_id: ID del evento
+            event: Detalles actualizados del evento
+
+        Returns:
+            Evento actualizado o None si falla
+        """
+        try:
+            return await self._request('PUT', self._events_path(calendar_id, event_id), json=event)
+        except (CalendarAPIError, httpx.HTTPError) as error:
+            logger.error(f"Error al actualizar evento: {error}")
+            return None
+
+    async def patch_event(self, calendar_id: str, event_id: str,
+                          changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Actualiza parcialmente un evento enviando solo los campos cambiados.
+
+        Args:
+            calendar_id: ID del calendario
+            event_id: ID del evento
+            changes: Campos a modificar (ver `compute_event_patch`)
+
+        Returns:
+            Evento actualizado o None si falla
+        """
+        try:
+            return await self._request('PATCH', self._events_path(calendar_id, event_id), json=changes)
+        except (CalendarAPIError, httpx.HTTPError) as error:
+            logger.error(f"Error al aplicar parche al evento: {error}")
+            return None
+
+    async def delete_event(self, calendar_id: str, event_id: str) -> bool:
+        """
+        Elimina un evento.
+
+        Args:
+            calendar_id: ID del calendario
+            event_id: ID del evento
+
+        Returns:
+            True si se eliminó correctamente
+        """
+        try:
+            await self._request('DELETE', self._events_path(calendar_id, event_id))
+            return True
+        except (CalendarAPIError, httpx.HTTPError) as error:
+            logger.error(f"Error al eliminar evento: {error}")
+            return False
@@ -0,0 +1,376 @@
+"""
+Representación columnar de lotes de eventos para análisis vectorizado (requiere numpy).
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence, Union
+
+import pytz
+
+from ..utils.timeparse import parse_event_time
+from .models import Event, EventLike, as_event
+
+logger = logging.getLogger(__name__)
+
+# Bits de categoría (un evento puede pertenecer a varias), con las mismas
+# palabras clave que EventProcessor.categorize_events
+CATEGORY_BITS = {
+    'all_day': 1,
+    'recurring': 2,
+    'meetings': 4,
+    'personal': 8,
+    'work': 16
+}
+
+CATEGORY_KEYWORDS = {
+    'meetings': ('meeting', 'reunión', 'call', 'llamada'),
+    'personal': ('personal', 'cumpleaños', 'vacaciones'),
+    'work': ('trabajo', 'work', 'project', 'proyecto')
+}
+
+# Valor de inicio/fin para eventos sin tiempo
+MISSING_TIME = -(2 ** 62)
+
+# Columnas con una fila por evento
+_COLUMNS = ('start', 'end', 'duration', 'calendar', 'title', 'category', 'all_day',
+            'has_start', 'has_time', 'row')
+
+def _numpy() -> Any:
+    """
+    Importa numpy en el primer uso.
+
+    Returns:
+        Módulo numpy
+
+    Raises:
+        ImportError: Si numpy no está instalado
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "EventBatch requiere numpy; instálalo con `pip install calendar_ai_bot[analytics]`"
+        ) from e
+    return numpy
+
+def _title_code(title_lower: str) -> int:
+    code = 0
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if any(keyword in title_lower for keyword in keywords):
+            code |= CATEGORY_BITS[category]
+    return code
+
+class EventBatch:
+    """
+    Lote de eventos en columnas de numpy.
+
+    Cada atributo numérico es un arreglo con una fila por evento: `start` y
+    `end` (segundos epoch, int64), `duration` (segundos), `calendar` (índice
+    en `calendars`), `title` (índice en `titles`), `category` (bits de
+    `CATEGORY_BITS`) y `all_day`. Las cadenas se guardan una sola vez, de
+    modo que filtrar o agregar meses de eventos de muchos calendarios son
+    operaciones vectorizadas en lugar de bucles sobre diccionarios.
+
+    Los filtros devuelven un nuevo lote con las filas seleccionadas (las
+    tablas de cadenas se comparten) y siguen la semántica de CalendarFilter.
+    """
+
+    def __init__(self,
+                 start: Any,
+                 end: Any,
+                 calendar: Any,
+                 title: Any,
+                 category: Any,
+                 all_day: Any,
+                 ids: Sequence[Optional[str]],
+                 calendars: Sequence[str],
+                 titles: Sequence[str],
+                 timezone: Union[str, Any] = 'America/Santiago',
+                 source: Optional[Sequence[EventLike]] = None,
+                 row: Any = None):
+        """
+        Inicializa el lote a partir de columnas ya construidas.
+
+        Args:
+            start: Inicios en segundos epoch (MISSING_TIME si no tiene)
+            end: Fines en segundos epoch (MISSING_TIME si no tiene)
+            calendar: Índices de calendario
+            title: Índices de título
+            category: Bits de categoría
+            all_day: Si cada evento es de día completo
+            ids: IDs de los eventos
+            calendars: Tabla de IDs de calendario
+            titles: Tabla de títulos
+            timezone: Zona horaria para límites sin zona
+            source: Eventos originales de cada fila (opcional)
+            row: Posición de cada fila en `ids` y `source` (por defecto, la
+                misma fila); los subconjuntos comparten ambas tablas
+        """
+        np = _numpy()
+        self.start = np.asarray(start, dtype=np.int64)
+        self.end = np.asarray(end, dtype=np.int64)
+        self.calendar = np.asarray(calendar, dtype=np.int32)
+        self.title = np.asarray(title, dtype=np.int32)
+        self.category = np.asarray(category, dtype=np.uint8)
+        self.all_day = np.asarray(all_day, dtype=bool)
+        self.calendars = tuple(calendars)
+        self.titles = tuple(titles)
+        self.timezone = pytz.timezone(timezone) if isinstance(timezone, str) else timezone
+        self._ids = ids
+        self._source = source
+        self.row = np.arange(len(self.start)) if row is None else np.asarray(row, dtype=np.int64)
+
+        self.has_start = self.start != MISSING_TIME
+        self.has_time = self.has_start & (self.end != MISSING_TIME)
+        self.duration = np.where(self.has_time, self.end - self.start, 0)
+
+    @classmethod
+    def from_calendars(cls, events_by_calendar: Mapping[str, Iterable[EventLike]],
+                       timezone: Union[str, Any] = 'America/Santiago',
+                       keep_source: bool = False) -> 'EventBatch':
+        """
+        Construye un lote con los eventos de varios calendarios.
+
+        Args:
+            events_by_calendar: Diccionario de ID de calendario a eventos
+                (diccionarios de la API o `Event`)
+            timezone: Zona horaria para fechas sin zona y días completos
+            keep_source: Si se conserva el evento original de cada fila
+
+        Returns:
+            Lote de eventos
+        """
+        if isinstance(timezone, str):
+            timezone = pytz.timezone(timezone)
+
+        starts: List[int] = []
+        ends: List[int] = []
+        calendar_codes: List[int] = []
+        title_codes: List[int] = []
+        categories: List[int] = []
+        all_day: List[bool] = []
+        ids: List[Optional[str]] = []
+        source: Optional[List[EventLike]] = [] if keep_source else None
+        titles: Dict[str, int] = {}
+        # Bits de categoría por título: las palabras clave se buscan una vez por título distinto
+        title_bits: List[int] = []
+
+        for calendar_index, events in enumerate(events_by_calendar.values()):
+            for event in events:
+                normalized = as_event(event, timezone)
+                starts.append(MISSING_TIME if normalized.start is None else normalized.start)
+                ends.append(MISSING_TIME if normalized.end is None else normalized.end)
+                calendar_codes.append(calendar_index)
+                title_code = titles.setdefault(normalized.title, len(titles))
+                if title_code == len(title_bits):
+                    title_bits.append(_title_code(normalized.title_lower))
+                title_codes.append(title_code)
+                categories.append(
+                    title_bits[title_code]
+                    | (CATEGORY_BITS['all_day'] if normalized.all_day else 0)
+                    | (CATEGORY_BITS['recurring'] if normalized.recurring else 0)
+                )
+                all_day.append(normalized.all_day)
+                ids.append(normalized.id)
+                if source is not None:
+                    source.append(event)
+
+        return cls(starts, ends, calendar_codes, title_codes, categories, all_day, ids,
+                   calendars=list(events_by_calendar), titles=list(titles),
+                   timezone=timezone, source=source)
+
+    @classmethod
+    def from_events(cls, events: Iterable[EventLike], calendar_id: str = 'primary',
+                    timezone: Union[str, Any] = 'America/Santiago',
+                    keep_source: bool = False) -> 'EventBatch':
+        """
+        Construye un lote con los eventos de un calendario.
+
+        Args:
+            events: Eventos (diccionarios de la API o `Event`)
+            calendar_id: ID del calendario de los eventos
+            timezone: Zona horaria para fechas sin zona y días completos
+            keep_source: Si se conserva el evento original de cada fila
+
+        Returns:
+            Lote de eventos
+        """
+        return cls.from_calendars({calendar_id: events}, timezone, keep_source)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def ids(self) -> List[Optional[str]]:
+        """
+        IDs de los eventos de cada fila.
+        """
+        return [self._ids[i] for i in self.row]
+
+    def take(self, selection: Any) -> 'EventBatch':
+        """
+        Obtiene un lote con las filas seleccionadas.
+
+        Args:
+            selection: Máscara booleana o arreglo de índices
+
+        Returns:
+            Nuevo lote (comparte las tablas de cadenas, IDs y eventos originales)
+        """
+        np = _numpy()
+        # Indexar con enteros es bastante más rápido que con máscaras en cada columna
+        index = np.flatnonzero(selection) if getattr(selection, 'dtype', None) == bool else selection
+
+        # Las columnas derivadas se copian en lugar de recalcularse en __init__
+        subset = EventBatch.__new__(EventBatch)
+        for column in _COLUMNS:
+            setattr(subset, column, getattr(self, column).take(index))
+        subset.calendars = self.calendars
+        subset.titles = self.titles
+        subset.timezone = self.timezone
+        subset._ids = self._ids
+        subset._source = self._source
+        return subset
+
+    def _bound(self, value: Optional[Union[str, datetime]]) -> Optional[float]:
+        if isinstance(value, str):
+            value = parse_event_time(value, self.timezone)
+        if not value:
+            return None
+        if value.tzinfo is None:
+            value = self.timezone.localize(value)
+        return value.timestamp()
+
+    def filter_by_date_range(self,
+                             start_date: Optional[Union[str, datetime]] = None,
+                             end_date: Optional[Union[str, datetime]] = None) -> 'EventBatch':
+        """
+        Filtra los eventos con hora cuyo inicio está dentro de un rango.
+
+        Args:
+            start_date: Fecha de inicio del rango (inclusive)
+            end_date: Fecha de fin del rango (inclusive)
+
+        Returns:
+            Lote con los eventos dentro del rango de fechas
+        """
+        mask = self.has_start & ~self.all_day
+        start_ts, end_ts = self._bound(start_date), self._bound(end_date)
+        if start_ts is not None:
+            mask &= self.start >= start_ts
+        if end_ts is not None:
+            mask &= self.start <= end_ts
+        return self.take(mask)
+
+    def filter_by_duration(self,
+                           min_duration: Optional[timedelta] = None,
+                           max_duration: Optional[timedelta] = None) -> 'EventBatch':
+        """
+        Filtra los eventos con hora por duración.
+
+        Args:
+            min_duration: Duración mínima del evento
+            max_duration: Duración máxima del evento
+
+        Returns:
+            Lote con los eventos dentro del rango de duración
+        """
+        mask = self.has_time & ~self.all_day
+        if min_duration is not None:
+            mask &= self.duration >= min_duration.total_seconds()
+        if max_duration is not None:
+            mask &= self.duration <= max_duration.total_seconds()
+        return self.take(mask)
+
+    def filter_by_calendar(self, calendar_id: str) -> 'EventBatch':
+        """
+        Filtra los eventos de un calendario.
+
+        Args:
+            calendar_id: ID del calendario
+
+        Returns:
+            Lote con los eventos del calendario
+        """
+        if calendar_id not in self.calendars:
+            return self.take(self.calendar < 0)
+        return self.take(self.calendar == self.calendars.index(calendar_id))
+
+    def filter_by_category(self, category: str) -> 'EventBatch':
+        """
+        Filtra los eventos de una categoría.
+
+        Args:
+            category: Nombre de la categoría (clave de CATEGORY_BITS)
+
+        Returns:
+            Lote con los eventos de la categoría
+        """
+        return self.take((self.category & CATEGORY_BITS[category]) != 0)
+
+    def duration_stats(self) -> Dict[str, float]:
+        """
+        Calcula estadísticas de duración de los eventos con hora.
+
+        Returns:
+            Diccionario con count, total, mean, median, p90, min y max (en segundos)
+        """
+        np = _numpy()
+        durations = self.duration[self.has_time & ~self.all_day]
+        if not len(durations):
+            return {'count': 0, 'total': 0.0, 'mean': 0.0, 'median': 0.0, 'p90': 0.0, 'min': 0.0, 'max': 0.0}
+
+        median, p90 = np.percentile(durations, [50, 90])
+        return {
+            'count': int(len(durations)),
+            'total': float(durations.sum()),
+            'mean': float(durations.mean()),
+            'median': float(median),
+            'p90': float(p90),
+            'min': float(durations.min()),
+            'max': float(durations.max())
+        }
+
+    def duration_stats_by_calendar(self) -> Dict[str, Dict[str, float]]:
+        """
+        Calcula número de eventos, duración total y media por calendario.
+
+        Returns:
+            Diccionario de ID de calendario a {'count', 'total', 'mean'} (en segundos)
+        """
+        np = _numpy()
+        mask = self.has_time & ~self.all_day
+        size = len(self.calendars)
+        counts = np.bincount(self.calendar[mask], minlength=size)
+        totals = np.bincount(self.calendar[mask], weights=self.duration[mask], minlength=size)
+        return {
+            calendar_id: {
+                'count': int(counts[i]),
+                'total': float(totals[i]),
+                'mean': float(totals[i] / counts[i]) if counts[i] else 0.0
+            }
+            for i, calendar_id in enumerate(self.calendars)
+        }
+
+    def to_events(self) -> List[EventLike]:
+        """
+        Obtiene los eventos de las filas del lote.
+
+        Returns:
+            Eventos originales si se conservaron; si no, objetos `Event`
+            reconstruidos a partir de las columnas
+        """
+        if self._source is not None:
+            return [self._source[i] for i in self.row]
+        return [
+            Event(
+                id=self._ids[self.row[i]],
+                title=self.titles[self.title[i]],
+                start=int(self.start[i]) if self.has_start[i] else None,
+                end=int(self.end[i]) if self.end[i] != MISSING_TIME else None,
+                all_day=bool(self.all_day[i]),
+                recurring=bool(self.category[i] & CATEGORY_BITS['recurring'])
+            )
+            for i in range(len(self))
+        ]
@@ -0,0 +1,108 @@
+"""
+Almacén de ETags y cuerpos de recursos para solicitudes condicionales.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class ETagStore:
+    """
+    Guarda el último ETag y cuerpo visto de cada recurso.
+
+    Permite enviar `If-None-Match` y reutilizar el cuerpo guardado cuando la API
+    responde 304 Not Modified. Las entradas menos usadas se descartan al
+    superar `max_size`; si se indica `store_file`, el contenido se persiste en JSON.
+    """
+
+    def __init__(self, max_size: int = 500, store_file: Optional[str] = None):
+        """
+        Inicializa el almacén.
+
+        Args:
+            max_size: Número máximo de recursos guardados
+            store_file: Archivo JSON opcional para persistir las entradas
+        """
+        self.max_size = max_size
+        self.store_file = store_file
+        self._lock = threading.Lock()
+        self.entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict(self._load_entries())
+
+    def _load_entries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Carga las entradas desde el archivo JSON, si existe.
+
+        Returns:
+            Diccionario de clave de recurso a {'etag', 'body'}
+        """
+        try:
+            if self.store_file and os.path.exists(self.store_file):
+                with open(self.store_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            return {}
+        except Exception as e:
+            logger.error(f"Error al cargar ETags: {e}")
+            return {}
+
+    def _save_entries(self) -> None:
+        """
+        Guarda las entradas en el archivo JSON, si está configurado.
+        """
+        if not self.store_file:
+            return
+        try:
+            with open(self.store_file, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, separators=(',', ':'))
+        except Exception as e:
+            logger.error(f"Error al guardar ETags: {e}")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene la entrada de un recurso.
+
+        Args:
+            key: Clave del recurso
+
+        Returns:
+            Diccionario {'etag', 'body'} o None si no hay entrada
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, etag: str, body: Any) -> None:
+        """
+        Guarda el ETag y el cuerpo de un recurso.
+
+        Args:
+            key: Clave del recurso
+            etag: ETag devuelto por la API
+            body: Cuerpo decodificado del recurso
+        """
+        with self._lock:
+            self.entries[key] = {'etag': etag, 'body': body}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+            self._save_entries()
+
+    def invalidate(self, key: str) -> None:
+        """
+        Elimina la entrada de un recurso.
+
+        Args:
+            key: Clave del recurso
+        """
+        with self._lock:
+            if self.entries.pop(key, None) is not None:
+                self._save_entries()
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -7,7 +7,10 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Callable, Optional, Union
 
 import pytz
-from dateutil.parser import parse
+
+from ..utils.timeparse import parse_event_time
+from .batch import EventBatch
+from .models import EventLike, as_event
 
 logger = logging.getLogger(__name__)
 
@@ -35,63 +38,72 @@ class CalendarFilter:
         Returns:
             Datetime con zona horaria o None
         """
-        if not time_str:
-            return None
-        
-        try:
-            dt = parse(time_str)
-            if dt.tzinfo is None:
-                dt = self.timezone.localize(dt)
-            return dt
-        except Exception as e:
-            logger.error(f"Error al parsear tiempo: {e}")
+        return parse_event_time(time_str, self.timezone)
+
+    def _to_timestamp(self, value: Optional[Union[str, datetime]]) -> Optional[float]:
+        """
+        Convierte un límite de rango a segundos epoch.
+
+        Args:
+            value: Cadena de tiempo o datetime
+
+        Returns:
+            Segundos epoch o None
+        """
+        if isinstance(value, str):
+            value = self._parse_event_time(value)
+        if not value:
             return None
+        if value.tzinfo is None:
+            value = self.timezone.localize(value)
+        return value.timestamp()
 
     def filter_by_date_range(self, 
-                              events: List[Dict[str, Any]], 
+                              events: Union[List[EventLike], EventBatch], 
                               start_date: Optional[Union[str, datetime]] = None, 
-                              end_date: Optional[Union[str, datetime]] = None) -> List[Dict[str, Any]]:
+                              end_date: Optional[Union[str, datetime]] = None) -> Union[List[EventLike], EventBatch]:
         """
         Filtra eventos dentro de un rango de fechas.
 
         Args:
-            events: Lista de eventos a filtrar
+            events: Lista de eventos (diccionarios de la API o `Event`) a
+                filtrar, o un `EventBatch` (filtrado vectorizado)
             start_date: Fecha de inicio del rango (inclusive)
             end_date: Fecha de fin del rango (inclusive)
 
         Returns:
-            Lista de eventos dentro del rango de fechas
+            Eventos dentro del rango de fechas (un `EventBatch` si se recibió uno)
         """
-        # Convertir fechas a datetime si son cadenas
-        if isinstance(start_date, str):
-            start_date = self._parse_event_time(start_date)
-        if isinstance(end_date, str):
-            end_date = self._parse_event_time(end_date)
+        if isinstance(events, EventBatch):
+            return events.filter_by_date_range(start_date, end_date)
 
         # Si no se proporcionan fechas, usar rango completo
-        if not start_date:
-            start_date = datetime.min.replace(tzinfo=self.timezone)
-        if not end_date:
-            end_date = datetime.max.replace(tzinfo=self.timezone)
+        start_ts = self._to_timestamp(start_date)
+        end_ts = self._to_timestamp(end_date)
+        if start_ts is None:
+            start_ts = float('-inf')
+        if end_ts is None:
+            end_ts = float('inf')
 
         filtered_events = []
         for event in events:
-            event_start = self._parse_event_time(event.get('start', {}).get('dateTime'))
+            normalized = as_event(event, self.timezone)
             
-            if event_start and start_date <= event_start <= end_date:
+            if (not normalized.all_day and normalized.start is not None
+                    and start_ts <= normalized.start <= end_ts):
                 filtered_events.append(event)
 
         return filtered_events
 
     def filter_by_title(self, 
-                        events: List[Dict[str, Any]], 
+                        events: List[EventLike], 
                         keywords: Union[str, List[str]], 
-                        case_sensitive: bool = False) -> List[Dict[str, Any]]:
+                        case_sensitive: bool = False) -> List[EventLike]:
         """
         Filtra eventos por palabras clave en el título.
 
         Args:
-            events: Lista de eventos a filtrar
+            events: Lista de eventos (diccionarios de la API o `Event`) a filtrar
             keywords: Palabra(s) clave a buscar
             case_sensitive: Si la búsqueda debe ser sensible a mayúsculas/minúsculas
 
@@ -108,10 +120,10 @@ class CalendarFilter:
 
         filtered_events = []
         for event in events:
-            title = event.get('summary', '')
+            normalized = as_event(event, self.timezone)
             
             # Ajustar título según sensibilidad de mayúsculas
-            check_title = title if case_sensitive else title.lower()
+            check_title = normalized.title if case_sensitive else normalized.title_lower
             
             # Verificar si alguna palabra clave está en el título
             if any(kw in check_title for kw in keywords):
@@ -120,13 +132,13 @@ class CalendarFilter:
         return filtered_events
 
     def filter_by_participants(self, 
-                                events: List[Dict[str, Any]], 
-                                participants: Union[str, List[str]]) -> List[Dict[str, Any]]:
+                                events: List[EventLike], 
+                                participants: Union[str, List[str]]) -> List[EventLike]:
         """
         Filtra eventos por participantes.
 
         Args:
-            events: Lista de eventos a filtrar
+            events: Lista de eventos (diccionarios de la API o `Event`) a filtrar
             participants: Correo(s) de participante(s)
 
         Returns:
@@ -138,19 +150,8 @@ class CalendarFilter:
 
         filtered_events = []
         for event in events:
-            event_participants = set()
-            
-            # Extraer correos de organizador
-            if event.get('organizer', {}).get('email'):
-                event_participants.add(event['organizer']['email'])
-            
-            # Extraer correos de asistentes
-            if event.get('attendees'):
-                event_participants.update(
-                    attendee['email'] 
-                    for attendee in event['attendees'] 
-                    if 'email' in attendee
-                )
+            # Correos de organizador y asistentes
+            event_participants = as_event(event, self.timezone).participants
 
             # Verificar si algún participante coincide
             if any(p in event_participants for p in participants):
@@ -159,38 +160,44 @@ class CalendarFilter:
         return filtered_events
 
     def filter_by_duration(self, 
-                            events: List[Dict[str, Any]], 
+                            events: Union[List[EventLike], EventBatch], 
                             min_duration: Optional[timedelta] = None, 
-                            max_duration: Optional[timedelta] = None) -> List[Dict[str, Any]]:
+                            max_duration: Optional[timedelta] = None) -> Union[List[EventLike], EventBatch]:
         """
         Filtra eventos por duración.
 
         Args:
-            events: Lista de eventos a filtrar
+            events: Lista de eventos (diccionarios de la API o `Event`) a
+                filtrar, o un `EventBatch` (filtrado vectorizado)
             min_duration: Duración mínima del evento
             max_duration: Duración máxima del evento
 
         Returns:
-            Lista de eventos dentro del rango de duración
+            Eventos dentro del rango de duración (un `EventBatch` si se recibió uno)
         """
+        if isinstance(events, EventBatch):
+            return events.filter_by_duration(min_duration, max_duration)
+
+        min_seconds = min_duration.total_seconds() if min_duration is not None else None
+        max_seconds = max_duration.total_seconds() if max_duration is not None else None
+
         filtered_events = []
         for event in events:
-            start = self._parse_event_time(event.get('start', {}).get('dateTime'))
-            end = self._parse_event_time(event.get('end', {}).get('dateTime'))
+            normalized = as_event(event, self.timezone)
             
-            if start and end:
-                duration = end - start
+            if not normalized.all_day and normalized.start is not None and normalized.end is not None:
+                duration = normalized.end - normalized.start
                 
                 # Verificar condiciones de duración
-                if ((min_duration is None or duration >= min_duration) and
-                    (max_duration is None or duration <= max_duration)):
+                if ((min_seconds is None or duration >= min_seconds) and
+                    (max_seconds is None or duration <= max_seconds)):
                     filtered_events.append(event)
 
         return filtered_events
 
     def filter_by_custom_rule(self, 
-                               events: List[Dict[str, Any]], 
-                               rule: Callable[[Dict[str, Any]], bool]) -> List[Dict[str, Any]]:
+                               events: List[EventLike], 
+                               rule: Callable[[EventLike], bool]) -> List[EventLike]:
         """
         Filtra eventos usando una regla personalizada.
 
@@ -2,65 +2,467 @@
 Interfaz para interactuar con la API de Google Calendar.
 """
 
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Container, List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import pytz
+
+from ..utils.lazy import lazy_import
+from ..utils.timeparse import parse_event_time
+from .etags import ETagStore
+from .patch import compute_event_patch
+from .quota import BACKGROUND, QuotaScheduler
+from .recurrence import RecurrenceExpander
+from .service import ServiceRegistry, default_service_registry
+from .sync import EventChangeSet, SyncTokenStore
+
+# Los SDK de Google se importan en el primer uso para acelerar el arranque
+errors = lazy_import('googleapiclient.errors')
 
 logger = logging.getLogger(__name__)
 
+# Tamaño máximo de página aceptado por events().list
+MAX_PAGE_SIZE = 2500
+
+# Proyecciones de campos de eventos para respuestas parciales (parámetro `fields`)
+FIELD_PRESETS = {
+    'timing': 'id,status,start,end',
+    'participants': 'id,status,start,end,summary,organizer(email),attendees(email,responseStatus)',
+    'full': None
+}
+
+# Campos adicionales necesarios para expandir eventos recurrentes localmente
+RECURRENCE_FIELDS = 'recurrence,recurringEventId,originalStartTime'
+
+# Número máximo de solicitudes por lote admitido por Calendar API
+BATCH_LIMIT = 50
+
+# Número máximo de calendarios por consulta freeBusy
+FREEBUSY_LIMIT = 50
+
+# Códigos HTTP de sub-solicitudes que pueden reintentarse
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+RATE_LIMIT_REASONS = (b'ratelimitexceeded', b'userratelimitexceeded', b'quotaexceeded')
+
+class _PendingBatch:
+    """
+    Lote de sub-solicitudes que se reenvía con las que quedaron pendientes.
+
+    Expone `execute` para pasar por `CalendarInterface._execute` como cualquier
+    otra solicitud: el planificador de cuota lo reintenta mientras falle con
+    un error reintentable, y cada reintento solo incluye esas sub-solicitudes.
+    """
+
+    def __init__(self, interface: 'CalendarInterface', request_factories: List[Callable[[], Any]],
+                 indices: Iterable[int], results: List[Optional[Dict[str, Any]]]):
+        self.interface = interface
+        self.request_factories = request_factories
+        self.pending = list(indices)
+        self.results = results
+        self._retry: List[Tuple[int, Exception]] = []
+
+    def _callback(self, request_id: str, response: Any, exception: Optional[Exception]) -> None:
+        index = int(request_id)
+        if exception is None:
+            self.results[index] = {'ok': True, 'response': response, 'status': None, 'error': None}
+            return
+        self.results[index] = {
+            'ok': False,
+            'response': None,
+            'status': self.interface._error_status(exception),
+            'error': str(exception)
+        }
+        if self.interface.quota.is_retryable(exception):
+            self._retry.append((index, exception))
+
+    def execute(self) -> None:
+        """
+        Envía las sub-solicitudes pendientes en una sola solicitud HTTP.
+
+        Raises:
+            Exception: El último error reintentable, si alguna sub-solicitud debe reenviarse
+        """
+        self._retry = []
+        batch = self.interface.service.new_batch_http_request(callback=self._callback)
+        for index in self.pending:
+            batch.add(self.request_factories[index](), request_id=str(index))
+        batch.execute()
+
+        self.pending = [index for index, _ in self._retry]
+        if self._retry:
+            raise self._retry[-1][1]
+
 class CalendarInterface:
     """
     Interfaz para operaciones con Google Calendar API.
     """
 
-    def __init__(self, credentials_path: str, token_path: str):
+    def __init__(self, credentials_path: str, token_path: str,
+                 sync_token_file: str = 'sync_tokens.json',
+                 busy_cache_ttl: int = 60,
+                 quota: Optional[QuotaScheduler] = None,
+                 quota_user: Optional[str] = None,
+                 services: Optional[ServiceRegistry] = None):
         """
         Inicializa la interfaz de Calendar.
 
         Args:
             credentials_path: Ruta al archivo de credenciales OAuth
             token_path: Ruta al archivo de token de acceso
+            sync_token_file: Ruta del archivo de tokens de sincronización incremental
+            busy_cache_ttl: Segundos que se reutilizan las consultas freeBusy
+            quota: Planificador de cuota (por defecto, el compartido del proceso)
+            quota_user: Usuario al que se imputa la cuota (por defecto, el token)
+            services: Registro de servicios compartidos (por defecto, el del proceso)
         """
         self.credentials_path = credentials_path
         self.token_path = token_path
-        self.service = self._build_service()
+        self.sync_tokens = SyncTokenStore(sync_token_file, account=token_path)
+        self.busy_cache_ttl = busy_cache_ttl
+        self.quota = quota if quota is not None else default_quota_scheduler
+        self.quota_user = quota_user or token_path
+        self.etags = ETagStore()
+        self._busy_cache: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, str]]]] = {}
+        self._thread_local = threading.local()
+        self.services = services if services is not None else default_service_registry
+        self.service = self.services.get_service(self.token_path)
 
     def _build_service(self):
         """
-        Construye el servicio de Google Calendar.
+        Construye un servicio de Google Calendar propio, sin compartirlo.
+
+        Usa el documento de descubrimiento ya parseado del registro, por lo que
+        solo se paga la carga de credenciales y la creación del cliente HTTP.
 
         Returns:
             Servicio de Google Calendar
         """
-        try:
-            creds = Credentials.from_authorized_user_file(self.token_path, 
-                ['https://www.googleapis.com/auth/calendar'])
-            return build('calendar', 'v3', credentials=creds)
-        except Exception as e:
-            logger.error(f"Error al construir servicio de Calendar: {e}")
-            raise
+        return self.services.build_service(self.token_path)
 
     def list_calendars(self) -> List[Dict[str, Any]]:
         """
         Lista todos los calendarios del usuario.
 
+        La lista se solicita de forma condicional con el último ETag visto;
+        si no cambió, se devuelve la copia local.
+
         Returns:
             Lista de calendarios
         """
         try:
-            results = self.service.calendarList().list().execute()
+            results = self._execute_conditional(self.service.calendarList().list(), 'calendarList')
             return results.get('items', [])
-        except HttpError as error:
+        except errors.HttpError as error:
             logger.error(f"Error al listar calendarios: {error}")
             return []
 
+    def get_event(self, calendar_id: str, event_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtiene un evento, reutilizando la copia local si no cambió (ETag).
+
+        Args:
+            calendar_id: ID del calendario
+            event_id: ID del evento
+
+        Returns:
+            Evento o None si falla
+        """
+        try:
+            return self._execute_conditional(
+                self.service.events().get(calendarId=calendar_id, eventId=event_id),
+                f"event:{calendar_id}:{event_id}"
+            )
+        except errors.HttpError as error:
+            logger.error(f"Error al obtener evento: {error}")
+            return None
+
+    def _execute(self, request: Any, cost: int = 1, priority: Optional[int] = None) -> Any:
+        """
+        Ejecuta una solicitud preparada de la API a través del planificador de cuota.
+
+        Args:
+            request: Solicitud de googleapiclient
+            cost: Unidades de cuota que consume (número de sub-solicitudes de un lote)
+            priority: Clase de prioridad (por defecto, la del hilo actual)
+
+        Returns:
+            Respuesta decodificada de la API
+        """
+        return self.quota.submit(request.execute, self.quota_user, priority=priority, cost=cost)
+
+    def _execute_conditional(self, request: Any, key: str) -> Any:
+        """
+        Ejecuta una lectura condicional con If-None-Match.
+
+        Args:
+            request: Solicitud GET de googleapiclient
+            key: Clave del recurso en el almacén de ETags
+
+        Returns:
+            Respuesta de la API, o el cuerpo guardado si la API responde 304
+        """
+        cached = self.etags.get(key)
+        if cached:
+            request.headers['If-None-Match'] = cached['etag']
+
+        try:
+            response = self._execute(request)
+        except errors.HttpError as error:
+            if cached and self._error_status(error) == 304:
+                logger.debug(f"Recurso sin cambios (304): {key}")
+                return cached['body']
+            raise
+
+        if isinstance(response, dict) and response.get('etag'):
+            self.etags.set(key, response['etag'], response)
+        return response
+
+    @staticmethod
+    def _resolve_fields(fields: Optional[str]) -> Optional[str]:
+        """
+        Construye el parámetro `fields` para listar eventos.
+
+        Args:
+            fields: Nombre de un preset ('timing', 'participants', 'full'), una
+                lista de campos de evento (p. ej. 'id,start,end') o una
+                proyección completa que ya incluye 'items(...)'
+
+        Returns:
+            Valor del parámetro `fields`, o None para descargar el recurso completo
+        """
+        if fields is None:
+            return None
+        item_fields = FIELD_PRESETS.get(fields, fields)
+        if item_fields is None:
+            return None
+        if 'items(' in item_fields:
+            return item_fields
+        return f"nextPageToken,nextSyncToken,items({item_fields})"
+
+    def iter_events(self, calendar_id: str = 'primary',
+                    time_min: Optional[str] = None,
+                    time_max: Optional[str] = None,
+                    page_size: int = MAX_PAGE_SIZE,
+                    fields: Optional[str] = None,
+                    single_events: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Itera sobre los eventos de un calendario siguiendo la paginación.
+
+        Las páginas se solicitan de forma diferida: cada evento se entrega en
+        cuanto llega su página, y solo se mantiene una página en memoria.
+
+        Args:
+            calendar_id: ID del calendario (por defecto: primary)
+            time_min: Tiempo mínimo para los eventos
+            time_max: Tiempo máximo para los eventos
+            page_size: Eventos por página (máximo 2500)
+            fields: Proyección de campos o preset ('timing', 'participants', 'full')
+            single_events: Si la API debe expandir los eventos recurrentes; con
+                False se obtienen los maestros y sus excepciones, sin orden
+
+        Yields:
+            Eventos (en orden de inicio si single_events es True)
+        """
+        return self._iter_events(self.service, calendar_id, time_min, time_max, page_size, fields,
+                                 single_events)
+
+    def _iter_events(self, service: Any, calendar_id: str,
+                     time_min: Optional[str], time_max: Optional[str],
+                     page_size: int, fields: Optional[str],
+                     single_events: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Implementación de `iter_events` sobre un servicio concreto.
+
+        Args:
+            service: Servicio de Google Calendar a utilizar
+            calendar_id: ID del calendario
+            time_min: Tiempo mínimo para los eventos
+            time_max: Tiempo máximo para los eventos
+            page_size: Eventos por página
+            fields: Proyección de campos o preset
+            single_events: Si la API debe expandir los eventos recurrentes
+
+        Yields:
+            Eventos (en orden de inicio si single_events es True)
+        """
+        page_token = None
+        params = {
+            'calendarId': calendar_id,
+            'timeMin': time_min,
+            'timeMax': time_max,
+            'maxResults': min(page_size, MAX_PAGE_SIZE),
+            'singleEvents': single_events
+        }
+        if single_events:
+            # orderBy=startTime solo está permitido con singleEvents
+            params['orderBy'] = 'startTime'
+        elif FIELD_PRESETS.get(fields):
+            fields = f"{FIELD_PRESETS[fields]},{RECURRENCE_FIELDS}"
+        projection = self._resolve_fields(fields)
+        if projection:
+            params['fields'] = projection
+
+        while True:
+            try:
+                response = self._execute(service.events().list(pageToken=page_token, **params))
+            except errors.HttpError as error:
+                logger.error(f"Error al obtener eventos: {error}")
+                return
+
+            page_token = response.get('nextPageToken')
+            yield from response.get('items', [])
+
+            if not page_token:
+                return
+
+    @staticmethod
+    def _error_status(error: Exception) -> Optional[int]:
+        """
+        Obtiene el código HTTP de un error de la API.
+
+        Args:
+            error: Excepción lanzada por googleapiclient
+
+        Returns:
+            Código de estado HTTP o None si no está disponible
+        """
+        resp = getattr(error, 'resp', None)
+        status = getattr(resp, 'status', None)
+        return int(status) if status is not None else None
+
+    @classmethod
+    def _is_retryable_error(cls, error: Exception) -> bool:
+        """
+        Indica si un error de la API es transitorio (límite de tasa o error del servidor).
+
+        Args:
+            error: Excepción lanzada por googleapiclient
+
+        Returns:
+            True si la solicitud puede reintentarse
+        """
+        status = cls._error_status(error)
+        if status in RETRYABLE_STATUSES:
+            return True
+        content = getattr(error, 'content', b'') or b''
+        return status == 403 and any(reason in content.lower() for reason in RATE_LIMIT_REASONS)
+
+    def sync_events(self, calendar_id: str = 'primary',
+                    token_store: Optional[SyncTokenStore] = None,
+                    known_ids: Optional[Container[str]] = None) -> Optional[EventChangeSet]:
+        """
+        Sincroniza un calendario de forma incremental usando syncToken.
+
+        Con un token guardado solo se descargan los eventos cambiados o
+        eliminados desde la última sincronización. Si no hay token, o la API
+        responde 410 Gone (token caducado), se realiza una sincronización
+        completa y el conjunto de cambios se marca con `full_resync`.
+
+        Args:
+            calendar_id: ID del calendario
+            token_store: Almacén de tokens (por defecto el de la interfaz)
+            known_ids: IDs de eventos ya conocidos localmente, para distinguir
+                eventos agregados de actualizados
+
+        Returns:
+            Conjunto de cambios, o None si la sincronización falla
+        """
+        store = token_store if token_store is not None else self.sync_tokens
+        sync_token = store.get(calendar_id)
+        changes = EventChangeSet(calendar_id, full_resync=sync_token is None)
+        page_token = None
+
+        while True:
+            params = {
+                'calendarId': calendar_id,
+                'maxResults': MAX_PAGE_SIZE,
+                'pageToken': page_token,
+                'singleEvents': True,
+                'showDeleted': True
+            }
+            if sync_token:
+                params['syncToken'] = sync_token
+
+            try:
+                response = self._execute(self.service.events().list(**params), priority=BACKGROUND)
+            except errors.HttpError as error:
+                if self._error_status(error) == 410 and sync_token:
+                    logger.warning(f"Token de sincronización caducado para {calendar_id}, "
+                                   f"realizando sincronización completa")
+                    store.clear(calendar_id)
+                    return self.sync_events(calendar_id, store, known_ids)
+                logger.error(f"Error al sincronizar eventos: {error}")
+                return None
+
+            for event in response.get('items', []):
+                known = event.get('id') in known_ids if known_ids is not None else None
+                changes.add(event, known)
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                changes.sync_token = response.get('nextSyncToken')
+                break
+
+        if changes.sync_token:
+            store.set(calendar_id, changes.sync_token)
+        return changes
+
+    def watch_events(self, calendar_id: str, address: str, channel_id: str,
+                     token: Optional[str] = None,
+                     ttl_seconds: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Abre un canal de notificaciones push para los eventos de un calendario.
+
+        Args:
+            calendar_id: ID del calendario
+            address: URL HTTPS que recibirá las notificaciones
+            channel_id: Identificador único del canal
+            token: Valor que se devolverá en X-Goog-Channel-Token
+            ttl_seconds: Duración solicitada del canal
+
+        Returns:
+            Canal creado (incluye `resourceId` y `expiration` en ms), o None si falla
+        """
+        body = {'id': channel_id, 'type': 'web_hook', 'address': address}
+        if token:
+            body['token'] = token
+        if ttl_seconds:
+            body['params'] = {'ttl': str(ttl_seconds)}
+        try:
+            return self._execute(self.service.events().watch(calendarId=calendar_id, body=body))
+        except errors.HttpError as error:
+            logger.error(f"Error al abrir canal de notificaciones: {error}")
+            return None
+
+    def stop_channel(self, channel_id: str, resource_id: str) -> bool:
+        """
+        Cierra un canal de notificaciones push.
+
+        Args:
+            channel_id: Identificador del canal
+            resource_id: ID del recurso observado devuelto al abrir el canal
+
+        Returns:
+            True si se cerró correctamente
+        """
+        try:
+            self._execute(self.service.channels().stop(body={'id': channel_id, 'resourceId': resource_id}),
+                          priority=BACKGROUND)
+            return True
+        except errors.HttpError as error:
+            logger.error(f"Error al cerrar canal de notificaciones: {error}")
+            return False
+
     def get_events(self, calendar_id: str = 'primary', 
                    time_min: Optional[str] = None, 
                    time_max: Optional[str] = None, 
-                   max_results: int = 10) -> List[Dict[str, Any]]:
+                   max_results: Optional[int] = 10,
+                   fields: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Obtiene eventos de un calendario.
 
@@ -68,25 +470,194 @@ class CalendarInterface:
             calendar_id: ID del calendario (por defecto: primary)
             time_min: Tiempo mínimo para los eventos
             time_max: Tiempo máximo para los eventos
-            max_results: Número máximo de resultados
+            max_results: Número máximo de resultados (None para todos)
+            fields: Proyección de campos o preset ('timing', 'participants', 'full')
 
         Returns:
             Lista de eventos
         """
-        try:
-            events_result = self.service.events().list(
-                calendarId=calendar_id, 
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            return events_result.get('items', [])
-        except HttpError as error:
-            logger.error(f"Error al obtener eventos: {error}")
+        page_size = min(max_results, MAX_PAGE_SIZE) if max_results else MAX_PAGE_SIZE
+        events = self.iter_events(calendar_id, time_min, time_max, page_size=page_size, fields=fields)
+        return list(islice(events, max_results))
+
+    def get_recurring_events(self, calendar_id: str = 'primary',
+                             time_min: Optional[str] = None,
+                             time_max: Optional[str] = None,
+                             fields: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene los eventos sin expandir: maestros recurrentes, excepciones y eventos simples.
+
+        Una serie diaria de un año ocupa un solo elemento en lugar de 365, y
+        el resultado puede expandirse localmente para cualquier ventana con
+        `RecurrenceExpander` sin nuevas llamadas a la API.
+
+        Args:
+            calendar_id: ID del calendario (por defecto: primary)
+            time_min: Tiempo mínimo para los eventos
+            time_max: Tiempo máximo para los eventos
+            fields: Proyección de campos o preset ('timing', 'participants', 'full')
+
+        Returns:
+            Lista de eventos sin expandir
+        """
+        return list(self.iter_events(calendar_id, time_min, time_max, fields=fields, single_events=False))
+
+    def get_expanded_events(self, calendar_id: str = 'primary',
+                            time_min: Optional[str] = None,
+                            time_max: Optional[str] = None,
+                            fields: Optional[str] = None,
+                            expander: Optional[RecurrenceExpander] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene eventos con las recurrencias expandidas localmente.
+
+        Equivale a `get_events(..., max_results=None)` con `singleEvents=True`,
+        pero descarga cada serie una sola vez.
+
+        Args:
+            calendar_id: ID del calendario (por defecto: primary)
+            time_min: Tiempo mínimo para los eventos
+            time_max: Tiempo máximo para los eventos
+            fields: Proyección de campos o preset ('timing', 'participants', 'full')
+            expander: Expansor a utilizar (reutilizarlo conserva las reglas parseadas)
+
+        Returns:
+            Lista de eventos e instancias en orden de inicio
+        """
+        expander = expander or RecurrenceExpander()
+        events = self.get_recurring_events(calendar_id, time_min, time_max, fields=fields)
+        return expander.expand(events, time_min, time_max)
+
+    def _thread_service(self) -> Any:
+        """
+        Obtiene un servicio exclusivo del hilo actual.
+
+        httplib2 no es seguro entre hilos, por lo que cada hilo trabajador
+        construye y reutiliza su propio servicio.
+
+        Returns:
+            Servicio de Google Calendar del hilo actual
+        """
+        service = getattr(self._thread_local, 'service', None)
+        if service is None:
+            service = self._build_service()
+            self._thread_local.service = service
+        return service
+
+    def get_events_for_calendars(self,
+                                 calendar_ids: List[str],
+                                 time_min: Optional[str] = None,
+                                 time_max: Optional[str] = None,
+                                 fields: Optional[str] = None,
+                                 max_workers: int = 4,
+                                 timezone: str = 'America/Santiago') -> List[Dict[str, Any]]:
+        """
+        Obtiene eventos de varios calendarios en paralelo, ordenados por inicio.
+
+        Cada calendario se descarga en un hilo del pool (con su propio servicio)
+        y los resultados, ya ordenados por calendario, se combinan con una
+        mezcla k-way sobre un heap.
+
+        Args:
+            calendar_ids: IDs de los calendarios
+            time_min: Tiempo mínimo para los eventos
+            time_max: Tiempo máximo para los eventos
+            fields: Proyección de campos o preset ('timing', 'participants', 'full')
+            max_workers: Número máximo de descargas simultáneas
+            timezone: Zona horaria para ordenar eventos de día completo
+
+        Returns:
+            Eventos de todos los calendarios ordenados por hora de inicio
+        """
+        tz = pytz.timezone(timezone)
+
+        def start_key(event: Dict[str, Any]) -> float:
+            start = event.get('start', {})
+            dt = parse_event_time(start.get('dateTime') or start.get('date'), tz)
+            return dt.timestamp() if dt is not None else float('inf')
+
+        def fetch(calendar_id: str) -> List[Dict[str, Any]]:
+            try:
+                return list(self._iter_events(self._thread_service(), calendar_id,
+                                              time_min, time_max, MAX_PAGE_SIZE, fields))
+            except Exception as e:
+                logger.error(f"Error al obtener eventos del calendario {calendar_id}: {e}")
+                return []
+
+        if not calendar_ids:
             return []
 
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calendar_ids))) as executor:
+            per_calendar = list(executor.map(fetch, calendar_ids))
+
+        return list(heapq.merge(*per_calendar, key=start_key))
+
+    def get_busy_intervals(self,
+                           emails: List[str],
+                           time_min: str,
+                           time_max: str,
+                           failures: Optional[Dict[str, Any]] = None) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Obtiene los intervalos ocupados de varios calendarios con freeBusy.
+
+        Es mucho más barato que listar eventos: solo se transfieren los
+        intervalos ocupados. Las consultas se agrupan de a 50 calendarios y los
+        resultados se reutilizan durante `busy_cache_ttl` segundos.
+
+        Args:
+            emails: Correos o IDs de calendario de los participantes
+            time_min: Inicio del rango (RFC3339)
+            time_max: Fin del rango (RFC3339)
+            failures: Diccionario opcional donde se registra, por correo, el error
+                de los calendarios cuya disponibilidad no se pudo consultar
+
+        Returns:
+            Diccionario de correo a lista de intervalos {'start', 'end'}. Los
+            calendarios con error se omiten: su disponibilidad es desconocida,
+            no libre
+        """
+        now = time.monotonic()
+        busy: Dict[str, List[Dict[str, str]]] = {}
+        missing = []
+
+        for email in dict.fromkeys(emails):
+            cached = self._busy_cache.get((email, time_min, time_max))
+            if cached and cached[0] > now:
+                busy[email] = cached[1]
+            else:
+                missing.append(email)
+
+        for offset in range(0, len(missing), FREEBUSY_LIMIT):
+            chunk = missing[offset:offset + FREEBUSY_LIMIT]
+            try:
+                response = self._execute(self.service.freebusy().query(body={
+                    'timeMin': time_min,
+                    'timeMax': time_max,
+                    'items': [{'id': email} for email in chunk]
+                }))
+            except errors.HttpError as error:
+                logger.error(f"Error al consultar disponibilidad: {error}")
+                if failures is not None:
+                    for email in chunk:
+                        failures[email] = error
+                continue
+
+            calendars = response.get('calendars', {})
+            for email in chunk:
+                info = calendars.get(email, {})
+                if info.get('errors'):
+                    logger.warning(f"Disponibilidad no disponible para {email}: {info['errors']}")
+                    if failures is not None:
+                        failures[email] = info['errors']
+                    continue
+                busy[email] = info.get('busy', [])
+                self._busy_cache[(email, time_min, time_max)] = (
+                    now + self.busy_cache_ttl, busy[email]
+                )
+
+        # Purgar entradas caducadas para acotar el caché
+        self._busy_cache = {k: v for k, v in self._busy_cache.items() if v[0] > now}
+        return {email: busy[email] for email in dict.fromkeys(emails) if email in busy}
+
     def create_event(self, calendar_id: str, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Crea un nuevo evento en el calendario.
@@ -99,12 +670,12 @@ class CalendarInterface:
             Evento creado o None si falla
         """
         try:
-            created_event = self.service.events().insert(
+            created_event = self._execute(self.service.events().insert(
                 calendarId=calendar_id, 
                 body=event
-            ).execute()
+            ))
             return created_event
-        except HttpError as error:
+        except errors.HttpError as error:
             logger.error(f"Error al crear evento: {error}")
             return None
 
@@ -121,16 +692,77 @@ class CalendarInterface:
             Evento actualizado o None si falla
         """
         try:
-            updated_event = self.service.events().update(
+            updated_event = self._execute(self.service.events().update(
                 calendarId=calendar_id, 
                 eventId=event_id, 
                 body=event
-            ).execute()
+            ))
             return updated_event
-        except HttpError as error:
+        except errors.HttpError as error:
             logger.error(f"Error al actualizar evento: {error}")
             return None
 
+    def patch_event(self, calendar_id: str, event_id: str,
+                    changes: Dict[str, Any],
+                    etag: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Actualiza parcialmente un evento enviando solo los campos cambiados.
+
+        Con `etag` se envía If-Match: si el evento cambió desde que se leyó, la
+        API responde 412 y no se aplica el parche.
+
+        Args:
+            calendar_id: ID del calendario
+            event_id: ID del evento
+            changes: Campos a modificar (ver `compute_event_patch`)
+            etag: ETag de la versión sobre la que se calcularon los cambios
+
+        Returns:
+            Evento actualizado, o None si falla o hay un conflicto de concurrencia
+        """
+        try:
+            request = self.service.events().patch(
+                calendarId=calendar_id,
+                eventId=event_id,
+                body=changes
+            )
+            if etag:
+                request.headers['If-Match'] = etag
+            patched_event = self._execute(request)
+        except errors.HttpError as error:
+            if self._error_status(error) == 412:
+                logger.warning(f"El evento {event_id} cambió desde su lectura; parche descartado")
+            else:
+                logger.error(f"Error al aplicar parche al evento: {error}")
+            return None
+
+        if isinstance(patched_event, dict) and patched_event.get('etag'):
+            self.etags.set(f"event:{calendar_id}:{event_id}", patched_event['etag'], patched_event)
+        return patched_event
+
+    def patch_event_from(self, calendar_id: str,
+                         old_event: Dict[str, Any],
+                         new_event: Dict[str, Any],
+                         check_etag: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Aplica a un evento la diferencia mínima entre dos versiones.
+
+        Args:
+            calendar_id: ID del calendario
+            old_event: Versión actual del evento (con `id` y `etag`)
+            new_event: Versión deseada del evento; los campos omitidos no se
+                modifican y los marcados con `patch.DELETED` se borran
+            check_etag: Usar el ETag de `old_event` para control de concurrencia
+
+        Returns:
+            Evento actualizado, `old_event` si no hay cambios, o None si falla
+        """
+        changes = compute_event_patch(old_event, new_event)
+        if not changes:
+            return old_event
+        etag = old_event.get('etag') if check_etag else None
+        return self.patch_event(calendar_id, old_event['id'], changes, etag=etag)
+
     def delete_event(self, calendar_id: str, event_id: str) -> bool:
         """
         Elimina un evento.
@@ -143,11 +775,104 @@ class CalendarInterface:
             True si se eliminó con éxito, False en caso contrario
         """
         try:
-            self.service.events().delete(
+            self._execute(self.service.events().delete(
                 calendarId=calendar_id, 
                 eventId=event_id
-            ).execute()
+            ))
+            self.etags.invalidate(f"event:{calendar_id}:{event_id}")
             return True
-        except HttpError as error:
+        except errors.HttpError as error:
             logger.error(f"Error al eliminar evento: {error}")
             return False
+
+    def _execute_batch(self, request_factories: List[Callable[[], Any]]) -> List[Dict[str, Any]]:
+        """
+        Ejecuta solicitudes en lotes HTTP, reintentando solo las sub-solicitudes fallidas.
+
+        Los reintentos los hace únicamente el planificador de cuota: cada lote
+        se envía con `_execute`, y mientras queden sub-solicitudes con errores
+        reintentables el lote falla con ese error para que el planificador
+        espere y lo reenvíe solo con ellas.
+
+        Args:
+            request_factories: Funciones que construyen cada solicitud (se vuelven
+                a invocar al reintentar)
+
+        Returns:
+            Resultados en el mismo orden que las solicitudes, cada uno con las
+            claves `ok`, `response`, `status` y `error`
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(request_factories)
+
+        for offset in range(0, len(request_factories), BATCH_LIMIT):
+            indices = range(offset, min(offset + BATCH_LIMIT, len(request_factories)))
+            batch = _PendingBatch(self, request_factories, indices, results)
+            try:
+                self._execute(batch, cost=len(indices))
+            except errors.HttpError as error:
+                logger.error(f"Error al ejecutar lote de solicitudes: {error}")
+                for index in batch.pending:
+                    if results[index] is None:
+                        results[index] = {'ok': False, 'response': None,
+                                          'status': self._error_status(error), 'error': str(error)}
+
+        return results
+
+    def batch_create_events(self, calendar_id: str,
+                            events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Crea varios eventos usando solicitudes por lotes.
+
+        Args:
+            calendar_id: ID del calendario
+            events: Detalles de los eventos a crear
+
+        Returns:
+            Resultado por evento (`response` contiene el evento creado)
+        """
+        events_resource = self.service.events()
+        return self._execute_batch([
+            lambda event=event: events_resource.insert(calendarId=calendar_id, body=event)
+            for event in events
+        ])
+
+    def batch_update_events(self, calendar_id: str,
+                            updates: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Actualiza varios eventos usando solicitudes por lotes.
+
+        Args:
+            calendar_id: ID del calendario
+            updates: Pares (ID del evento, detalles actualizados)
+
+        Returns:
+            Resultado por evento (`response` contiene el evento actualizado)
+        """
+        events_resource = self.service.events()
+        return self._execute_batch([
+            lambda event_id=event_id, event=event: events_resource.update(
+                calendarId=calendar_id, eventId=event_id, body=event
+            )
+            for event_id, event in updates
+        ])
+
+    def batch_delete_events(self, calendar_id: str, event_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Elimina varios eventos usando solicitudes por lotes.
+
+        Args:
+            calendar_id: ID del calendario
+            event_ids: IDs de los eventos a eliminar
+
+        Returns:
+            Resultado por evento
+        """
+        events_resource = self.service.events()
+        return self._execute_batch([
+            lambda event_id=event_id: events_resource.delete(calendarId=calendar_id, eventId=event_id)
+            for event_id in event_ids
+        ])
+
+# Planificador compartido por todas las interfaces del proceso, de modo que la
+# cuota de cada usuario se respeta aunque haya varias instancias
+default_quota_scheduler = QuotaScheduler(is_retryable=CalendarInterface._is_retryable_error)
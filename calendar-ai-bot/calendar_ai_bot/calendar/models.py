@@ -0,0 +1,197 @@
+"""
+Modelo compacto de eventos de calendario con tiempos preprocesados.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+
+import pytz
+
+from ..utils.timeparse import parse_event_time
+
+logger = logging.getLogger(__name__)
+
+EventLike = Union['Event', Dict[str, Any]]
+
+class Event:
+    """
+    Evento normalizado construido una sola vez al ingresar los datos.
+
+    Guarda el inicio y el fin como segundos epoch (enteros), de modo que
+    filtrar, ordenar o detectar conflictos no vuelve a parsear las cadenas
+    ISO de la API. Con `__slots__` y sin el diccionario original (`raw`),
+    ocupa una fracción de la memoria del evento de Google Calendar.
+
+    `CalendarFilter`, `EventProcessor` y `EventOrganizer` aceptan
+    indistintamente estos objetos o los diccionarios de la API.
+    """
+
+    __slots__ = ('id', 'title', 'title_lower', 'start', 'end', 'all_day',
+                 'participants', 'recurring', 'raw')
+
+    def __init__(self,
+                 id: Optional[str] = None,
+                 title: str = '',
+                 start: Optional[int] = None,
+                 end: Optional[int] = None,
+                 all_day: bool = False,
+                 participants: Tuple[str, ...] = (),
+                 recurring: bool = False,
+                 raw: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el evento.
+
+        Args:
+            id: ID del evento
+            title: Título del evento
+            start: Inicio en segundos epoch (None si no tiene)
+            end: Fin en segundos epoch (None si no tiene)
+            all_day: Si es un evento de día completo
+            participants: Correos del organizador y asistentes, sin duplicados
+            recurring: Si el evento tiene reglas de recurrencia
+            raw: Diccionario original de la API (opcional)
+        """
+        self.id = id
+        self.title = title
+        self.title_lower = title.lower()
+        self.start = start
+        self.end = end
+        self.all_day = all_day
+        self.participants = participants
+        self.recurring = recurring
+        self.raw = raw
+
+    @staticmethod
+    def _timestamp(value: Dict[str, Any], timezone: Any) -> Tuple[Optional[int], bool]:
+        """
+        Convierte un `start`/`end` de la API a segundos epoch.
+
+        Args:
+            value: Diccionario con `dateTime` o `date`
+            timezone: Zona horaria para fechas y horas sin zona
+
+        Returns:
+            Tupla (segundos epoch o None, es_día_completo)
+        """
+        time_str = value.get('dateTime')
+        all_day = False
+        if not time_str:
+            time_str = value.get('date')
+            all_day = bool(time_str)
+        if not time_str:
+            return None, False
+
+        dt = parse_event_time(time_str, timezone)
+        if dt is None:
+            return None, all_day
+        return int(dt.timestamp()), all_day
+
+    @classmethod
+    def from_api(cls, event: Dict[str, Any],
+                 timezone: Union[str, Any] = 'America/Santiago',
+                 keep_raw: bool = False) -> 'Event':
+        """
+        Construye un evento a partir del diccionario de Google Calendar.
+
+        Args:
+            event: Evento de Google Calendar
+            timezone: Zona horaria (nombre o pytz) para fechas sin zona y días completos
+            keep_raw: Si se conserva el diccionario original en `raw`
+
+        Returns:
+            Evento normalizado
+        """
+        if isinstance(timezone, str):
+            timezone = pytz.timezone(timezone)
+
+        start, all_day = cls._timestamp(event.get('start', {}), timezone)
+        end, _ = cls._timestamp(event.get('end', {}), timezone)
+
+        participants = []
+        organizer = event.get('organizer', {}).get('email')
+        if organizer:
+            participants.append(organizer)
+        for attendee in event.get('attendees') or ():
+            if 'email' in attendee:
+                participants.append(attendee['email'])
+
+        return cls(
+            id=event.get('id'),
+            title=event.get('summary') or '',
+            start=start,
+            end=end,
+            all_day=all_day,
+            participants=tuple(dict.fromkeys(participants)),
+            recurring=bool(event.get('recurrence')),
+            raw=event if keep_raw else None
+        )
+
+    @property
+    def duration(self) -> Optional[timedelta]:
+        """
+        Duración del evento, o None si le falta el inicio o el fin.
+        """
+        if self.start is None or self.end is None:
+            return None
+        return timedelta(seconds=self.end - self.start)
+
+    def start_datetime(self, timezone: Any) -> Optional[datetime]:
+        """
+        Obtiene el inicio como datetime en una zona horaria.
+
+        Args:
+            timezone: Zona horaria (pytz)
+
+        Returns:
+            Datetime con zona horaria o None
+        """
+        return datetime.fromtimestamp(self.start, timezone) if self.start is not None else None
+
+    def end_datetime(self, timezone: Any) -> Optional[datetime]:
+        """
+        Obtiene el fin como datetime en una zona horaria.
+
+        Args:
+            timezone: Zona horaria (pytz)
+
+        Returns:
+            Datetime con zona horaria o None
+        """
+        return datetime.fromtimestamp(self.end, timezone) if self.end is not None else None
+
+    def __repr__(self) -> str:
+        return f"Event(id={self.id!r}, title={self.title!r}, start={self.start}, end={self.end})"
+
+def as_event(event: EventLike, timezone: Union[str, Any] = 'America/Santiago') -> Event:
+    """
+    Obtiene la vista normalizada de un evento, sin reconstruirla si ya lo es.
+
+    Args:
+        event: Evento normalizado o diccionario de la API
+        timezone: Zona horaria para fechas sin zona y días completos
+
+    Returns:
+        Evento normalizado
+    """
+    if isinstance(event, Event):
+        return event
+    return Event.from_api(event, timezone)
+
+def to_events(events: Iterable[Dict[str, Any]],
+              timezone: Union[str, Any] = 'America/Santiago',
+              keep_raw: bool = False) -> List[Event]:
+    """
+    Normaliza una lista de eventos de la API al ingresarlos.
+
+    Args:
+        events: Eventos de Google Calendar
+        timezone: Zona horaria para fechas sin zona y días completos
+        keep_raw: Si se conserva cada diccionario original en `raw`
+
+    Returns:
+        Lista de eventos normalizados
+    """
+    if isinstance(timezone, str):
+        timezone = pytz.timezone(timezone)
+    return [Event.from_api(event, timezone, keep_raw) for event in events]
@@ -4,10 +4,12 @@ Organizador de eventos de calendario con capacidades de optimización.
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 import pytz
-from dateutil.parser import parse
+
+from ..utils.timeparse import parse_event_time
+from .models import EventLike, as_event
 
 logger = logging.getLogger(__name__)
 
@@ -35,20 +37,10 @@ class EventOrganizer:
         Returns:
             Datetime con zona horaria o None
         """
-        if not time_str:
-            return None
-        
-        try:
-            dt = parse(time_str)
-            if dt.tzinfo is None:
-                dt = self.timezone.localize(dt)
-            return dt
-        except Exception as e:
-            logger.error(f"Error al parsear tiempo: {e}")
-            return None
+        return parse_event_time(time_str, self.timezone)
 
     def find_optimal_time_slot(self, 
-                                events: List[Dict[str, Any]], 
+                                events: List[EventLike], 
                                 duration: timedelta, 
                                 days_ahead: int = 7, 
                                 min_time: str = '09:00', 
@@ -57,7 +49,7 @@ class EventOrganizer:
         Encuentra un espacio de tiempo óptimo para un nuevo evento.
 
         Args:
-            events: Lista de eventos existentes
+            events: Lista de eventos existentes (diccionarios de la API o `Event`)
             duration: Duración del nuevo evento
             days_ahead: Número de días a buscar
             min_time: Hora mínima para programar eventos
@@ -78,10 +70,12 @@ class EventOrganizer:
                               second=0, 
                               microsecond=0)
 
-        # Ordenar eventos existentes
+        # Ordenar eventos existentes (cada uno se normaliza una sola vez)
+        normalized_events = [as_event(e, self.timezone) for e in events]
         sorted_events = sorted(
-            [e for e in events if self._parse_event_time(e.get('start', {}).get('dateTime'))],
-            key=lambda e: self._parse_event_time(e.get('start', {}).get('dateTime'))
+            [(e.start_datetime(self.timezone), e.end_datetime(self.timezone))
+             for e in normalized_events if not e.all_day and e.start is not None],
+            key=lambda times: times[0]
         )
 
         # Buscar espacios libres
@@ -92,8 +86,7 @@ class EventOrganizer:
 
             # Verificar si el día está completamente libre
             if not sorted_events or all(
-                self._parse_event_time(e.get('start', {}).get('dateTime')).date() != current_day 
-                for e in sorted_events
+                start.date() != current_day for start, _ in sorted_events
             ):
                 return {
                     'start': day_start.isoformat(),
@@ -103,8 +96,7 @@ class EventOrganizer:
 
             # Buscar espacios entre eventos
             for i in range(len(sorted_events)):
-                event_start = self._parse_event_time(sorted_events[i].get('start', {}).get('dateTime'))
-                event_end = self._parse_event_time(sorted_events[i].get('end', {}).get('dateTime'))
+                event_start, event_end = sorted_events[i]
 
                 # Verificar espacio antes del primer evento
                 if i == 0 and event_start and event_start.date() == current_day:
@@ -119,7 +111,7 @@ class EventOrganizer:
 
                 # Verificar espacios entre eventos
                 if i < len(sorted_events) - 1:
-                    next_event_start = self._parse_event_time(sorted_events[i+1].get('start', {}).get('dateTime'))
+                    next_event_start = sorted_events[i+1][0]
                     
                     if (event_end and next_event_start and 
                         event_end.date() == current_day and 
@@ -148,12 +140,99 @@ class EventOrganizer:
 
         return None
 
-    def group_events_by_category(self, events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    def find_optimal_time_slot_from_busy(self,
+                                         busy_intervals: Union[Dict[str, List[Dict[str, str]]],
+                                                               List[Dict[str, str]]],
+                                         duration: timedelta,
+                                         days_ahead: int = 7,
+                                         min_time: str = '09:00',
+                                         max_time: str = '17:00') -> Optional[Dict[str, Any]]:
+        """
+        Encuentra un espacio de tiempo a partir de intervalos ocupados (freeBusy).
+
+        Args:
+            busy_intervals: Intervalos {'start', 'end'}, o un diccionario de
+                participante a intervalos como el de `CalendarInterface.get_busy_intervals`
+            duration: Duración del nuevo evento
+            days_ahead: Número de días a buscar
+            min_time: Hora mínima para programar eventos
+            max_time: Hora máxima para programar eventos
+
+        Returns:
+            Diccionario con información del espacio de tiempo óptimo o None
+        """
+        if isinstance(busy_intervals, dict):
+            intervals = [i for per_person in busy_intervals.values() for i in per_person]
+        else:
+            intervals = busy_intervals
+
+        # Unir intervalos solapados: un participante puede estar ocupado
+        # dentro del intervalo de otro, así que no basta mirar vecinos
+        merged = []
+        for start, end in sorted(self._busy_bounds(intervals)):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        now = datetime.now(self.timezone)
+        min_hour, min_minute = (int(part) for part in min_time.split(':'))
+        max_hour, max_minute = (int(part) for part in max_time.split(':'))
+
+        # Recorrer los huecos libres de cada día dentro de [min_time, max_time]
+        for day in range(days_ahead):
+            current_day = now.date() + timedelta(days=day)
+            day_start = self.timezone.localize(
+                datetime.combine(current_day, datetime.min.time()).replace(hour=min_hour, minute=min_minute)
+            )
+            day_end = self.timezone.localize(
+                datetime.combine(current_day, datetime.min.time()).replace(hour=max_hour, minute=max_minute)
+            )
+
+            cursor = day_start
+            for busy_start, busy_end in merged:
+                if busy_end <= cursor:
+                    continue
+                if busy_start >= day_end:
+                    break
+                if busy_start - cursor >= duration:
+                    break
+                cursor = busy_end
+
+            if day_end - cursor >= duration:
+                return {
+                    'start': cursor.isoformat(),
+                    'end': (cursor + duration).isoformat(),
+                    'date': current_day.isoformat()
+                }
+
+        return None
+
+    def _busy_bounds(self, intervals: List[Dict[str, str]]) -> List[Tuple[datetime, datetime]]:
+        """
+        Convierte intervalos {'start', 'end'} en pares de datetime de la zona local.
+
+        Args:
+            intervals: Intervalos ocupados con cadenas ISO
+
+        Returns:
+            Lista de tuplas (inicio, fin); se omiten los intervalos inválidos
+        """
+        bounds = []
+        for interval in intervals:
+            start = self._parse_event_time(interval.get('start'))
+            end = self._parse_event_time(interval.get('end'))
+            if start is None or end is None:
+                continue
+            bounds.append((start.astimezone(self.timezone), end.astimezone(self.timezone)))
+        return bounds
+
+    def group_events_by_category(self, events: List[EventLike]) -> Dict[str, List[EventLike]]:
         """
         Agrupa eventos por categorías.
 
         Args:
-            events: Lista de eventos a agrupar
+            events: Lista de eventos (diccionarios de la API o `Event`) a agrupar
 
         Returns:
             Diccionario de eventos agrupados por categoría
@@ -167,15 +246,17 @@ class EventOrganizer:
         }
 
         for event in events:
+            normalized = as_event(event, self.timezone)
+
             # Categorización por tipo de evento
-            if event.get('start', {}).get('date') and not event.get('start', {}).get('dateTime'):
+            if normalized.all_day:
                 categories['all_day'].append(event)
             
-            if event.get('recurrence'):
+            if normalized.recurring:
                 categories['recurring'].append(event)
             
             # Categorización por título o descripción
-            title = event.get('summary', '').lower()
+            title = normalized.title_lower
             if any(keyword in title for keyword in ['meeting', 'reunión', 'call', 'llamada']):
                 categories['meetings'].append(event)
             
@@ -187,12 +268,12 @@ class EventOrganizer:
 
         return categories
 
-    def optimize_schedule(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def optimize_schedule(self, events: List[EventLike]) -> Dict[str, Any]:
         """
         Optimiza la programación de eventos.
 
         Args:
-            events: Lista de eventos a optimizar
+            events: Lista de eventos (diccionarios de la API o `Event`) a optimizar
 
         Returns:
             Diccionario con información de optimización
@@ -0,0 +1,62 @@
+"""
+Cálculo de parches mínimos entre versiones de un evento.
+"""
+
+from typing import Dict, Any
+
+class _Deleted:
+    """
+    Marcador de un campo que debe borrarse en el parche.
+    """
+
+    def __repr__(self) -> str:
+        return 'DELETED'
+
+# Valor que se asigna en `new` a un campo para enviarlo como null y borrarlo
+DELETED = _Deleted()
+
+# Campos administrados por la API que nunca se envían en un parche
+READ_ONLY_FIELDS = frozenset({
+    'kind', 'etag', 'id', 'htmlLink', 'created', 'updated', 'iCalUID',
+    'creator', 'hangoutLink', 'privateCopy', 'locked', 'recurringEventId'
+})
+
+def compute_event_patch(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Calcula el cuerpo mínimo de un PATCH que transforma `old` en `new`.
+
+    Sigue la semántica de PATCH de Google APIs: los objetos anidados se
+    combinan campo a campo (solo se envían los subcampos cambiados) y las
+    listas se reemplazan completas. Solo se comparan los campos presentes en
+    `new`: los que faltan no se tocan. Para borrar un campo, se le asigna
+    `DELETED` y se envía como None (null); por ejemplo, al pasar a día
+    completo: `{'start': {'date': '2025-03-10', 'dateTime': DELETED}}`.
+
+    Args:
+        old: Evento actual (p. ej. el devuelto por la API)
+        new: Evento deseado, o solo los campos a cambiar
+
+    Returns:
+        Cuerpo del parche; vacío si no hay cambios
+    """
+    return _diff(old, new, top_level=True)
+
+def _diff(old: Dict[str, Any], new: Dict[str, Any], top_level: bool = False) -> Dict[str, Any]:
+    patch: Dict[str, Any] = {}
+
+    for key, value in new.items():
+        if top_level and key in READ_ONLY_FIELDS:
+            continue
+        if value is DELETED:
+            if key in old:
+                patch[key] = None
+        elif key not in old:
+            patch[key] = _diff({}, value) if isinstance(value, dict) else value
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            nested = _diff(old[key], value)
+            if nested:
+                patch[key] = nested
+        elif value != old[key]:
+            patch[key] = value
+
+    return patch
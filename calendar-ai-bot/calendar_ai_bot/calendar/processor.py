@@ -2,12 +2,15 @@
 Procesador de eventos de calendario con capacidades de análisis.
 """
 
+import heapq
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
 import pytz
-from dateutil.parser import parse
+
+from ..utils.timeparse import parse_event_time
+from .models import EventLike, as_event
 
 logger = logging.getLogger(__name__)
 
@@ -35,74 +38,82 @@ class EventProcessor:
         Returns:
             Datetime con zona horaria o None
         """
-        if not time_str:
-            return None
-        
-        try:
-            dt = parse(time_str)
-            if dt.tzinfo is None:
-                dt = self.timezone.localize(dt)
-            return dt
-        except Exception as e:
-            logger.error(f"Error al parsear tiempo: {e}")
-            return None
+        return parse_event_time(time_str, self.timezone)
 
-    def calculate_event_duration(self, event: Dict[str, Any]) -> Optional[timedelta]:
+    def calculate_event_duration(self, event: EventLike) -> Optional[timedelta]:
         """
         Calcula la duración de un evento.
 
         Args:
-            event: Diccionario de evento de Google Calendar
+            event: Diccionario de evento de Google Calendar o `Event`
 
         Returns:
             Duración del evento como timedelta o None
         """
-        try:
-            start = self.parse_event_time(event.get('start', {}).get('dateTime'))
-            end = self.parse_event_time(event.get('end', {}).get('dateTime'))
-            
-            if start and end:
-                return end - start
-            return None
-        except Exception as e:
-            logger.error(f"Error al calcular duración del evento: {e}")
+        normalized = as_event(event, self.timezone)
+        if normalized.all_day:
             return None
+        return normalized.duration
+
+    def iter_event_conflicts(self, events: Iterable[EventLike],
+                             include_all_day: bool = False) -> Iterator[Tuple[EventLike, EventLike]]:
+        """
+        Genera los conflictos de horarios entre eventos con un barrido (sweep line).
+
+        Los eventos se normalizan y ordenan una sola vez por inicio; un heap
+        mantiene los eventos activos ordenados por fin, de modo que cada
+        evento solo se compara con los que aún no terminan cuando empieza:
+        O(n log n + k) para k conflictos, en lugar de comparar todos los pares.
+
+        Args:
+            events: Eventos (diccionarios de la API o `Event`) a comparar
+            include_all_day: Si los eventos de día completo entran en conflicto
+                con los eventos con hora; si es False, solo se comparan entre sí
 
-    def detect_event_conflicts(self, events: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        Yields:
+            Tuplas (evento que empieza antes, evento que se solapa con él), en
+            orden de inicio del segundo evento
+        """
+        timeline = []
+        for event in events:
+            normalized = as_event(event, self.timezone)
+            if normalized.start is None or normalized.end is None:
+                continue
+            group = normalized.all_day and not include_all_day
+            timeline.append((normalized.start, len(timeline), normalized.end, group, event))
+        timeline.sort(key=lambda item: (item[0], item[1]))
+
+        # Eventos activos por grupo (con hora / día completo), ordenados por fin
+        active: Dict[bool, List[Tuple[int, int, EventLike]]] = {False: [], True: []}
+        for start, order, end, group, event in timeline:
+            heap = active[group]
+            while heap and heap[0][0] <= start:
+                heapq.heappop(heap)
+            for _, _, earlier in heap:
+                yield earlier, event
+            heapq.heappush(heap, (end, order, event))
+
+    def detect_event_conflicts(self, events: List[EventLike],
+                               include_all_day: bool = False) -> List[Tuple[EventLike, EventLike]]:
         """
         Detecta conflictos de horarios entre eventos.
 
         Args:
-            events: Lista de eventos a comparar
+            events: Lista de eventos (diccionarios de la API o `Event`) a comparar
+            include_all_day: Si los eventos de día completo entran en conflicto
+                con los eventos con hora
 
         Returns:
             Lista de tuplas con eventos en conflicto
         """
-        conflicts = []
-        sorted_events = sorted(events, key=lambda e: self.parse_event_time(e.get('start', {}).get('dateTime')))
-
-        for i in range(len(sorted_events)):
-            for j in range(i + 1, len(sorted_events)):
-                event1 = sorted_events[i]
-                event2 = sorted_events[j]
-
-                start1 = self.parse_event_time(event1.get('start', {}).get('dateTime'))
-                end1 = self.parse_event_time(event1.get('end', {}).get('dateTime'))
-                start2 = self.parse_event_time(event2.get('start', {}).get('dateTime'))
-                end2 = self.parse_event_time(event2.get('end', {}).get('dateTime'))
-
-                if start1 and end1 and start2 and end2:
-                    if start2 < end1:
-                        conflicts.append((event1, event2))
+        return list(self.iter_event_conflicts(events, include_all_day))
 
-        return conflicts
-
-    def categorize_events(self, events: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    def categorize_events(self, events: List[EventLike]) -> Dict[str, List[EventLike]]:
         """
         Categoriza eventos por diferentes criterios.
 
         Args:
-            events: Lista de eventos a categorizar
+            events: Lista de eventos (diccionarios de la API o `Event`) a categorizar
 
         Returns:
             Diccionario de eventos categorizados
@@ -116,15 +127,17 @@ class EventProcessor:
         }
 
         for event in events:
+            normalized = as_event(event, self.timezone)
+
             # Categorización por tipo de evento
-            if event.get('start', {}).get('date') and not event.get('start', {}).get('dateTime'):
+            if normalized.all_day:
                 categories['all_day'].append(event)
             
-            if event.get('recurrence'):
+            if normalized.recurring:
                 categories['recurring'].append(event)
             
             # Categorización por título o descripción
-            title = event.get('summary', '').lower()
+            title = normalized.title_lower
             if any(keyword in title for keyword in ['meeting', 'reunión', 'call', 'llamada']):
                 categories['meetings'].append(event)
             
@@ -136,50 +149,41 @@ class EventProcessor:
 
         return categories
 
-    def extract_event_participants(self, event: Dict[str, Any]) -> List[str]:
+    def extract_event_participants(self, event: EventLike) -> List[str]:
         """
         Extrae los participantes de un evento.
 
         Args:
-            event: Evento de Google Calendar
+            event: Evento de Google Calendar o `Event`
 
         Returns:
-            Lista de correos electrónicos de participantes
-        """
-        participants = []
-        
-        # Extraer organizador
-        if event.get('organizer', {}).get('email'):
-            participants.append(event['organizer']['email'])
-        
-        # Extraer asistentes
-        if event.get('attendees'):
-            participants.extend([
-                attendee['email'] 
-                for attendee in event['attendees'] 
-                if 'email' in attendee
-            ])
-        
-        return list(set(participants))  # Eliminar duplicados
-
-    def analyze_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+            Lista de correos electrónicos de participantes (organizador y
+            asistentes, sin duplicados)
+        """
+        return list(as_event(event, self.timezone).participants)
+
+    def analyze_event(self, event: EventLike) -> Dict[str, Any]:
         """
         Realiza un análisis completo de un evento.
 
         Args:
-            event: Evento de Google Calendar
+            event: Evento de Google Calendar o `Event` (la descripción solo
+                está disponible si conserva `raw`)
 
         Returns:
             Diccionario con información analizada del evento
         """
+        normalized = as_event(event, self.timezone)
+        raw = event if isinstance(event, dict) else (normalized.raw or {})
+        timed = not normalized.all_day
         return {
-            'id': event.get('id'),
-            'title': event.get('summary', 'Sin título'),
-            'start_time': self.parse_event_time(event.get('start', {}).get('dateTime')),
-            'end_time': self.parse_event_time(event.get('end', {}).get('dateTime')),
-            'duration': self.calculate_event_duration(event),
-            'participants': self.extract_event_participants(event),
-            'is_recurring': bool(event.get('recurrence')),
-            'is_all_day': bool(event.get('start', {}).get('date')),
-            'description': event.get('description', '')
+            'id': normalized.id,
+            'title': normalized.title or 'Sin título',
+            'start_time': normalized.start_datetime(self.timezone) if timed else None,
+            'end_time': normalized.end_datetime(self.timezone) if timed else None,
+            'duration': normalized.duration if timed else None,
+            'participants': list(normalized.participants),
+            'is_recurring': normalized.recurring,
+            'is_all_day': normalized.all_day,
+            'description': raw.get('description', '')
         }
@@ -0,0 +1,258 @@
+"""
+Planificador de solicitudes a Calendar API con control de cuota por usuario.
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Clases de prioridad: un número menor se atiende antes
+INTERACTIVE = 0
+BACKGROUND = 1
+
+PRIORITY_NAMES = {INTERACTIVE: 'interactive', BACKGROUND: 'background'}
+
+class TokenBucket:
+    """
+    Cubeta de tokens que se recarga a tasa constante hasta su capacidad.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa la cubeta llena.
+
+        Args:
+            rate: Tokens agregados por segundo
+            capacity: Número máximo de tokens acumulables (ráfaga)
+            clock: Reloj monótono en segundos
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, cost: float = 1.0) -> float:
+        """
+        Intenta consumir tokens.
+
+        Args:
+            cost: Tokens a consumir (se limita a la capacidad)
+
+        Returns:
+            0 si se consumieron, o los segundos que faltan para disponer de ellos
+        """
+        cost = min(cost, self.capacity)
+        self._refill()
+        if self._tokens >= cost:
+            self._tokens -= cost
+            return 0.0
+        return (cost - self._tokens) / self.rate
+
+class QuotaScheduler:
+    """
+    Punto único por el que pasan las solicitudes a Calendar API.
+
+    Cada usuario tiene su propia cubeta de tokens (la cuota de Calendar se
+    aplica por usuario y minuto). Las solicitudes esperan en una cola por
+    prioridad, de modo que las interactivas se atienden antes que las de
+    sincronización en segundo plano, y las respuestas de límite de tasa se
+    reintentan con backoff exponencial con jitter en lugar de descartarse.
+    """
+
+    def __init__(self,
+                 requests_per_second: float = 10.0,
+                 burst: Optional[float] = None,
+                 max_retries: int = 5,
+                 backoff_seconds: float = 1.0,
+                 max_backoff_seconds: float = 32.0,
+                 is_retryable: Optional[Callable[[Exception], bool]] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Inicializa el planificador.
+
+        Args:
+            requests_per_second: Tasa sostenida de solicitudes por usuario
+            burst: Solicitudes que pueden enviarse de inmediato (por defecto, la tasa)
+            max_retries: Reintentos máximos ante errores de límite de tasa
+            backoff_seconds: Espera base del backoff exponencial
+            max_backoff_seconds: Espera máxima entre reintentos
+            is_retryable: Función que indica si un error puede reintentarse
+            clock: Reloj monótono en segundos
+            sleep: Función de espera (inyectable en pruebas)
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst is not None else max(1.0, requests_per_second)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.is_retryable = is_retryable or (lambda error: False)
+        self._clock = clock
+        self._sleep = sleep
+        self._condition = threading.Condition()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._waiting: Dict[str, List[Tuple[int, int]]] = {}
+        self._sequence = itertools.count()
+        self._local = threading.local()
+        self._metrics = {
+            name: {'requests': 0, 'retries': 0, 'failures': 0,
+                   'total_wait': 0.0, 'max_wait': 0.0}
+            for name in PRIORITY_NAMES.values()
+        }
+
+    def _bucket(self, user: str) -> TokenBucket:
+        bucket = self._buckets.get(user)
+        if bucket is None:
+            bucket = TokenBucket(self.requests_per_second, self.burst, self._clock)
+            self._buckets[user] = bucket
+        return bucket
+
+    @contextmanager
+    def priority(self, priority: int) -> Iterator[None]:
+        """
+        Fija la prioridad por defecto de las solicitudes del hilo actual.
+
+        Args:
+            priority: INTERACTIVE o BACKGROUND
+        """
+        previous = getattr(self._local, 'priority', INTERACTIVE)
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def current_priority(self) -> int:
+        """
+        Obtiene la prioridad por defecto del hilo actual.
+
+        Returns:
+            Prioridad vigente (INTERACTIVE si no se fijó otra)
+        """
+        return getattr(self._local, 'priority', INTERACTIVE)
+
+    def acquire(self, user: str = 'default', priority: Optional[int] = None, cost: float = 1.0) -> float:
+        """
+        Espera turno y tokens para enviar una solicitud.
+
+        Solo la solicitud al frente de la cola del usuario (menor prioridad,
+        luego orden de llegada) puede consumir tokens.
+
+        Args:
+            user: Usuario al que se imputa la cuota
+            priority: Clase de prioridad (por defecto, la del hilo actual)
+            cost: Tokens que consume la solicitud (p. ej. tamaño de un lote)
+
+        Returns:
+            Segundos que la solicitud esperó en cola
+        """
+        if priority is None:
+            priority = self.current_priority()
+        ticket = (priority, next(self._sequence))
+        started = self._clock()
+
+        with self._condition:
+            queue = self._waiting.setdefault(user, [])
+            heapq.heappush(queue, ticket)
+            try:
+                while True:
+                    if queue[0] == ticket:
+                        delay = self._bucket(user).try_acquire(cost)
+                        if delay == 0:
+                            break
+                    else:
+                        delay = None
+                    self._condition.wait(delay)
+            finally:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+                self._condition.notify_all()
+
+            waited = self._clock() - started
+            stats = self._metrics[PRIORITY_NAMES.get(priority, 'background')]
+            stats['requests'] += 1
+            stats['total_wait'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+        return waited
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * (2 ** attempt))
+        return delay + random.uniform(0, self.backoff_seconds)
+
+    def submit(self, func: Callable[[], T], user: str = 'default',
+               priority: Optional[int] = None, cost: float = 1.0) -> T:
+        """
+        Ejecuta una llamada respetando la cuota y reintentando límites de tasa.
+
+        Args:
+            func: Llamada a ejecutar (p. ej. `request.execute`)
+            user: Usuario al que se imputa la cuota
+            priority: Clase de prioridad (por defecto, la del hilo actual)
+            cost: Tokens que consume la llamada
+
+        Returns:
+            Resultado de la llamada
+
+        Raises:
+            Exception: El último error si no es reintentable o se agotan los reintentos
+        """
+        if priority is None:
+            priority = self.current_priority()
+        name = PRIORITY_NAMES.get(priority, 'background')
+
+        for attempt in range(self.max_retries + 1):
+            self.acquire(user, priority, cost)
+            try:
+                return func()
+            except Exception as error:
+                if not self.is_retryable(error) or attempt == self.max_retries:
+                    with self._condition:
+                        self._metrics[name]['failures'] += 1
+                    raise
+                delay = self._backoff(attempt)
+                with self._condition:
+                    self._metrics[name]['retries'] += 1
+                logger.warning(f"Límite de tasa de Calendar API para {user}; reintento en {delay:.1f}s")
+                self._sleep(delay)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene las métricas de cola por clase de prioridad.
+
+        Returns:
+            Por prioridad: solicitudes, reintentos, fallos, espera media y máxima
+            (segundos) y solicitudes en cola en este momento
+        """
+        with self._condition:
+            queued = {name: 0 for name in PRIORITY_NAMES.values()}
+            for queue in self._waiting.values():
+                for priority, _ in queue:
+                    queued[PRIORITY_NAMES.get(priority, 'background')] += 1
+
+            snapshot = {}
+            for name, stats in self._metrics.items():
+                requests = stats['requests']
+                snapshot[name] = {
+                    'requests': requests,
+                    'retries': stats['retries'],
+                    'failures': stats['failures'],
+                    'avg_wait': stats['total_wait'] / requests if requests else 0.0,
+                    'max_wait': stats['max_wait'],
+                    'queued': queued[name]
+                }
+            return snapshot
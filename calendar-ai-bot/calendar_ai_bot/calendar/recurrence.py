@@ -0,0 +1,324 @@
+"""
+Expansión local de eventos recurrentes (RRULE, EXRULE, RDATE, EXDATE).
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+
+from dateutil import rrule
+from dateutil import tz as dateutil_tz
+
+from ..utils.timeparse import parse_event_time
+
+logger = logging.getLogger(__name__)
+
+TimeValue = Union[str, datetime, None]
+
+_UNTIL = re.compile(r'UNTIL=([0-9TZ]+)')
+
+class RecurrenceExpander:
+    """
+    Expande eventos recurrentes maestros en vistas livianas de sus instancias.
+
+    Con `CalendarInterface.get_recurring_events` la API devuelve una sola vez
+    cada evento maestro (con su lista `recurrence`) y las excepciones
+    (instancias modificadas o canceladas); este expansor genera localmente las
+    instancias de cualquier ventana de tiempo, aplicando las excepciones, sin
+    nuevas llamadas a la API. Las reglas parseadas se reutilizan mientras el
+    evento maestro no cambie.
+
+    Cada instancia es una copia superficial del maestro (los valores anidados,
+    como `attendees`, se comparten) con `id`, `start`, `end`,
+    `recurringEventId` y `originalStartTime` propios, igual que las instancias
+    que devuelve la API con `singleEvents=True`.
+    """
+
+    def __init__(self, timezone: str = 'America/Santiago'):
+        """
+        Inicializa el expansor.
+
+        Args:
+            timezone: Zona horaria por defecto para eventos sin `timeZone`
+        """
+        self.timezone = timezone
+        self._rules: Dict[Tuple[str, str], rrule.rruleset] = {}
+
+    def _tz(self, event: Dict[str, Any]) -> Any:
+        name = event.get('start', {}).get('timeZone') or self.timezone
+        return dateutil_tz.gettz(name) or dateutil_tz.gettz(self.timezone)
+
+    def _to_datetime(self, value: TimeValue) -> Optional[datetime]:
+        """
+        Convierte un límite de ventana a datetime con zona horaria.
+
+        Args:
+            value: Cadena ISO o datetime
+
+        Returns:
+            Datetime con zona horaria, o None
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return parse_event_time(value, dateutil_tz.gettz(self.timezone))
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dateutil_tz.gettz(self.timezone))
+        return value
+
+    @staticmethod
+    def _parse_date_values(line: str, tzinfo: Any, all_day: bool) -> List[datetime]:
+        """
+        Interpreta una línea RDATE/EXDATE.
+
+        Args:
+            line: Línea iCalendar (p. ej. 'EXDATE;TZID=America/Santiago:20250312T090000')
+            tzinfo: Zona horaria del evento (para valores sin zona)
+            all_day: Si el evento es de día completo
+
+        Returns:
+            Fechas de la línea, en el mismo tipo que las instancias generadas
+        """
+        head, _, values = line.partition(':')
+        params = dict(p.split('=', 1) for p in head.split(';')[1:] if '=' in p)
+        value_tz = dateutil_tz.gettz(params['TZID']) if 'TZID' in params else tzinfo
+
+        result = []
+        for value in values.split(','):
+            value = value.strip()
+            if not value:
+                continue
+            if len(value) == 8:
+                parsed = datetime.strptime(value, '%Y%m%d')
+                result.append(parsed if all_day else parsed.replace(tzinfo=tzinfo))
+                continue
+            if value.endswith('Z'):
+                parsed = datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=dt_timezone.utc)
+            else:
+                parsed = datetime.strptime(value, '%Y%m%dT%H%M%S').replace(tzinfo=value_tz)
+            result.append(parsed.replace(tzinfo=None) if all_day else parsed.astimezone(tzinfo))
+        return result
+
+    @staticmethod
+    def _normalize_rule(line: str, dtstart: datetime) -> str:
+        """
+        Ajusta UNTIL para que sea compatible con DTSTART (dateutil exige UTC si DTSTART tiene zona).
+
+        Args:
+            line: Línea RRULE/EXRULE
+            dtstart: Inicio de la serie
+
+        Returns:
+            Línea con UNTIL normalizado
+        """
+        match = _UNTIL.search(line)
+        if not match:
+            return line
+        until = match.group(1)
+        if dtstart.tzinfo is None:
+            normalized = until.rstrip('Z')
+            if len(normalized) > 8 and until.endswith('Z'):
+                normalized = datetime.strptime(until, '%Y%m%dT%H%M%SZ').strftime('%Y%m%dT%H%M%S')
+        elif until.endswith('Z'):
+            return line
+        elif len(until) == 8:
+            end_of_day = datetime.strptime(until, '%Y%m%d').replace(
+                hour=23, minute=59, second=59, tzinfo=dtstart.tzinfo)
+            normalized = end_of_day.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        else:
+            local = datetime.strptime(until, '%Y%m%dT%H%M%S').replace(tzinfo=dtstart.tzinfo)
+            normalized = local.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        return line[:match.start(1)] + normalized + line[match.end(1):]
+
+    def _series(self, master: Dict[str, Any]) -> Optional[Tuple[rrule.rruleset, datetime, timedelta, bool]]:
+        """
+        Obtiene (o construye) el conjunto de reglas de un evento maestro.
+
+        Args:
+            master: Evento maestro con `recurrence`
+
+        Returns:
+            Tupla (reglas, inicio, duración, es_día_completo), o None si no es válido
+        """
+        start, end = master.get('start', {}), master.get('end', {})
+        all_day = 'date' in start and 'dateTime' not in start
+        tzinfo = self._tz(master)
+
+        if all_day:
+            dtstart = parse_event_time(start['date'])
+            dtend = parse_event_time(end.get('date'))
+            if dtstart is not None and dtend is None:
+                dtend = dtstart + timedelta(days=1)
+        elif start.get('dateTime'):
+            dtstart = parse_event_time(start['dateTime'], tzinfo)
+            dtend = parse_event_time(end.get('dateTime'), tzinfo) or dtstart
+            if dtstart is not None:
+                dtstart, dtend = dtstart.astimezone(tzinfo), dtend.astimezone(tzinfo)
+        else:
+            return None
+        if dtstart is None:
+            return None
+
+        key = (master.get('id', ''), master.get('etag') or master.get('updated') or '')
+        rules = self._rules.get(key)
+        if rules is None:
+            rules = rrule.rruleset()
+            try:
+                for line in master.get('recurrence', []):
+                    name = line.split(':', 1)[0].split(';', 1)[0].upper()
+                    if name in ('RRULE', 'EXRULE'):
+                        rule = rrule.rrulestr(self._normalize_rule(line.split(':', 1)[1], dtstart), dtstart=dtstart)
+                        (rules.rrule if name == 'RRULE' else rules.exrule)(rule)
+                    elif name in ('RDATE', 'EXDATE'):
+                        for value in self._parse_date_values(line, tzinfo, all_day):
+                            (rules.rdate if name == 'RDATE' else rules.exdate)(value)
+            except (ValueError, TypeError) as e:
+                logger.error(f"Regla de recurrencia inválida en {master.get('id')}: {e}")
+                return None
+            # La primera instancia es siempre DTSTART, aunque la regla no la genere
+            rules.rdate(dtstart)
+            self._rules[key] = rules
+
+        return rules, dtstart, dtend - dtstart, all_day
+
+    @staticmethod
+    def _instance_key(value: Dict[str, Any]) -> Optional[Union[str, float]]:
+        """
+        Clave de comparación de un `start`/`originalStartTime`: fecha o timestamp.
+        """
+        if value.get('dateTime'):
+            dt = parse_event_time(value['dateTime'])
+            return dt.timestamp() if dt is not None else None
+        return value.get('date')
+
+    def _instances(self, master: Dict[str, Any], window_start: Optional[datetime],
+                   window_end: Optional[datetime], exceptions: Dict[Union[str, float], Dict[str, Any]],
+                   max_instances: int) -> List[Dict[str, Any]]:
+        series = self._series(master)
+        if series is None:
+            return []
+        rules, dtstart, duration, all_day = series
+        tzinfo = self._tz(master)
+
+        def localize(value: datetime) -> datetime:
+            return value.replace(tzinfo=tzinfo) if all_day else value
+
+        after = window_start - duration if window_start else None
+        if all_day and after is not None:
+            after = after.astimezone(tzinfo).replace(tzinfo=None)
+        before = window_end.astimezone(tzinfo).replace(tzinfo=None) if (all_day and window_end) else window_end
+
+        if after is not None and before is not None:
+            occurrences = rules.between(after, before, inc=True)
+        else:
+            occurrences = list(self._take(rules, max_instances, after, before))
+
+        base = {k: v for k, v in master.items() if k not in ('recurrence', 'etag', 'htmlLink', 'iCalUID')}
+        instances = []
+        for occurrence in occurrences[:max_instances]:
+            occ_start = localize(occurrence)
+            occ_end = occ_start + duration
+            if window_start and occ_end <= window_start:
+                continue
+            if window_end and occ_start >= window_end:
+                continue
+
+            if all_day:
+                original = {'date': occurrence.date().isoformat()}
+                suffix = occurrence.strftime('%Y%m%d')
+                times = {'start': {'date': original['date']},
+                         'end': {'date': (occurrence + duration).date().isoformat()}}
+            else:
+                original = {'dateTime': occurrence.isoformat(), 'timeZone': master['start'].get('timeZone')}
+                suffix = occurrence.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+                times = {'start': {'dateTime': occurrence.isoformat(), 'timeZone': master['start'].get('timeZone')},
+                         'end': {'dateTime': occ_end.isoformat(), 'timeZone': master['end'].get('timeZone')}}
+                if not original['timeZone']:
+                    del original['timeZone'], times['start']['timeZone'], times['end']['timeZone']
+
+            if self._instance_key(original) in exceptions:
+                continue
+            instances.append({
+                **base,
+                **times,
+                'id': f"{master.get('id')}_{suffix}",
+                'recurringEventId': master.get('id'),
+                'originalStartTime': original
+            })
+        return instances
+
+    @staticmethod
+    def _take(rules: rrule.rruleset, limit: int, after: Optional[datetime] = None,
+              before: Optional[datetime] = None) -> Iterable[datetime]:
+        taken = 0
+        for occurrence in rules:
+            if taken >= limit or (before is not None and occurrence > before):
+                return
+            if after is None or occurrence >= after:
+                taken += 1
+                yield occurrence
+
+    def _start_timestamp(self, event: Dict[str, Any]) -> float:
+        start = event.get('start', {})
+        value = self._to_datetime(start.get('dateTime') or start.get('date'))
+        return value.timestamp() if value is not None else float('inf')
+
+    def _overlaps(self, event: Dict[str, Any], window_start: Optional[datetime],
+                  window_end: Optional[datetime]) -> bool:
+        start, end = event.get('start', {}), event.get('end', {})
+        start_value = start.get('dateTime') or start.get('date')
+        end_value = end.get('dateTime') or end.get('date') or start_value
+        if not start_value:
+            return False
+        event_start, event_end = self._to_datetime(start_value), self._to_datetime(end_value)
+        if window_start and event_end <= window_start:
+            return False
+        if window_end and event_start >= window_end:
+            return False
+        return True
+
+    def expand(self, events: Iterable[Dict[str, Any]],
+               time_min: TimeValue = None,
+               time_max: TimeValue = None,
+               max_instances: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Expande una lista de eventos (maestros, excepciones y eventos simples).
+
+        Args:
+            events: Eventos obtenidos con `singleEvents=False`
+            time_min: Inicio de la ventana (las instancias que terminan antes se omiten)
+            time_max: Fin de la ventana (las instancias que empiezan después se omiten)
+            max_instances: Máximo de instancias por serie (para series sin fin)
+
+        Returns:
+            Instancias y eventos simples que se solapan con la ventana, ordenados por inicio
+        """
+        window_start, window_end = self._to_datetime(time_min), self._to_datetime(time_max)
+        events = list(events)
+
+        exceptions: Dict[str, Dict[Union[str, float], Dict[str, Any]]] = {}
+        for event in events:
+            if event.get('recurringEventId') and event.get('originalStartTime'):
+                key = self._instance_key(event['originalStartTime'])
+                exceptions.setdefault(event['recurringEventId'], {})[key] = event
+
+        result = []
+        for event in events:
+            if event.get('status') == 'cancelled':
+                continue
+            if event.get('recurrence'):
+                result.extend(self._instances(event, window_start, window_end,
+                                              exceptions.get(event.get('id'), {}), max_instances))
+            elif self._overlaps(event, window_start, window_end):
+                # Eventos simples y excepciones modificadas (que pueden haberse movido)
+                result.append(event)
+
+        result.sort(key=self._start_timestamp)
+        return result
+
+    def clear(self) -> None:
+        """
+        Descarta las reglas parseadas en caché.
+        """
+        self._rules.clear()
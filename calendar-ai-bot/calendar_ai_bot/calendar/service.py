@@ -0,0 +1,161 @@
+"""
+Registro de servicios de Google Calendar construidos desde el documento de descubrimiento estático.
+"""
+
+import json
+import logging
+import threading
+from typing import Dict, Any, Optional, Sequence, Tuple
+from urllib.parse import urljoin
+
+from ..utils.lazy import lazy_import
+
+# Los SDK de Google se importan en el primer uso para acelerar el arranque
+discovery = lazy_import('googleapiclient.discovery')
+discovery_cache = lazy_import('googleapiclient.discovery_cache')
+googleapiclient_http = lazy_import('googleapiclient.http')
+google_auth_httplib2 = lazy_import('google_auth_httplib2')
+oauth2_credentials = lazy_import('google.oauth2.credentials')
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_SCOPES = ('https://www.googleapis.com/auth/calendar',)
+
+class ServiceRegistry:
+    """
+    Registro de servicios de Calendar compartidos en todo el proceso.
+
+    El documento de descubrimiento se lee del paquete googleapiclient (sin
+    red) y se parsea una sola vez; cada servicio se construye a partir del
+    documento ya parseado y se reutiliza por credenciales, de modo que crear
+    una interfaz por usuario o calendario no repite el trabajo de `build`.
+
+    `httplib2.Http` no es seguro entre hilos, así que el servicio compartido
+    no fija un cliente HTTP: cada solicitud usa el `AuthorizedHttp` del hilo
+    que la crea (ver `_request_builder`).
+    """
+
+    def __init__(self, api_name: str = 'calendar', api_version: str = 'v3',
+                 root_url: Optional[str] = None):
+        """
+        Inicializa el registro vacío.
+
+        Args:
+            api_name: Nombre de la API
+            api_version: Versión de la API
+            root_url: URL raíz alternativa (p. ej. un servidor local de pruebas);
+                se aplica también a las solicitudes por lotes
+        """
+        self.api_name = api_name
+        self.api_version = api_version
+        self.root_url = root_url
+        self._lock = threading.Lock()
+        self._document: Optional[Dict[str, Any]] = None
+        self._services: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+
+    def discovery_document(self) -> Dict[str, Any]:
+        """
+        Obtiene el documento de descubrimiento parseado.
+
+        Returns:
+            Documento de descubrimiento de la API
+
+        Raises:
+            ValueError: Si el documento no está incluido en googleapiclient
+        """
+        if self._document is None:
+            with self._lock:
+                if self._document is None:
+                    content = discovery_cache.get_static_doc(self.api_name, self.api_version)
+                    if content is None:
+                        raise ValueError(
+                            f"Documento de descubrimiento estático no disponible: "
+                            f"{self.api_name} {self.api_version}"
+                        )
+                    document = json.loads(content)
+                    if self.root_url:
+                        document['rootUrl'] = self.root_url
+                        document['baseUrl'] = urljoin(self.root_url, document['servicePath'])
+                    self._document = document
+        return self._document
+
+    def build_service(self, token_path: str, scopes: Sequence[str] = CALENDAR_SCOPES) -> Any:
+        """
+        Construye un servicio nuevo (con su propio cliente HTTP) sin usar la caché.
+
+        Args:
+            token_path: Ruta al archivo de token de acceso
+            scopes: Ámbitos OAuth
+
+        Returns:
+            Servicio de Google Calendar
+        """
+        try:
+            creds = oauth2_credentials.Credentials.from_authorized_user_file(token_path, list(scopes))
+            return discovery.build_from_document(self.discovery_document(), credentials=creds,
+                                                 requestBuilder=self._request_builder(creds))
+        except Exception as e:
+            logger.error(f"Error al construir servicio de Calendar: {e}")
+            raise
+
+    @staticmethod
+    def _request_builder(credentials: Any) -> Any:
+        """
+        Crea el constructor de solicitudes de un servicio con un cliente HTTP por hilo.
+
+        Args:
+            credentials: Credenciales OAuth compartidas por los clientes del servicio
+
+        Returns:
+            Función compatible con el parámetro `requestBuilder` de googleapiclient
+        """
+        local = threading.local()
+
+        def build_request(http: Any, *args: Any, **kwargs: Any) -> Any:
+            thread_http = getattr(local, 'http', None)
+            if thread_http is None:
+                thread_http = google_auth_httplib2.AuthorizedHttp(
+                    credentials, http=googleapiclient_http.build_http()
+                )
+                local.http = thread_http
+            return googleapiclient_http.HttpRequest(thread_http, *args, **kwargs)
+
+        return build_request
+
+    def get_service(self, token_path: str, scopes: Sequence[str] = CALENDAR_SCOPES) -> Any:
+        """
+        Obtiene (o construye) el servicio compartido de unas credenciales.
+
+        Args:
+            token_path: Ruta al archivo de token de acceso
+            scopes: Ámbitos OAuth
+
+        Returns:
+            Servicio de Google Calendar
+        """
+        key = (token_path, tuple(scopes))
+        service = self._services.get(key)
+        if service is not None:
+            return service
+
+        service = self.build_service(token_path, scopes)
+        with self._lock:
+            return self._services.setdefault(key, service)
+
+    def clear(self) -> None:
+        """
+        Descarta los servicios construidos (p. ej. tras revocar credenciales).
+        """
+        with self._lock:
+            self._services.clear()
+
+    def __len__(self) -> int:
+        """
+        Obtiene el número de servicios en caché.
+
+        Returns:
+            Número de servicios construidos
+        """
+        return len(self._services)
+
+default_service_registry = ServiceRegistry()
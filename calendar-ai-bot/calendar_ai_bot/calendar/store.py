@@ -0,0 +1,399 @@
+"""
+Réplica local en SQLite de los eventos de calendario con consultas indexadas.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+
+import pytz
+
+from ..utils.timeparse import parse_event_time
+from .sync import EventChangeSet
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    calendar_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    start_ts INTEGER,
+    end_ts INTEGER,
+    all_day INTEGER NOT NULL DEFAULT 0,
+    updated TEXT,
+    status TEXT,
+    title_lower TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, event_id)
+);
+CREATE INDEX IF NOT EXISTS idx_events_calendar_start ON events (calendar_id, start_ts);
+CREATE INDEX IF NOT EXISTS idx_events_start_end ON events (start_ts, end_ts);
+CREATE INDEX IF NOT EXISTS idx_events_updated ON events (updated);
+CREATE TABLE IF NOT EXISTS attendees (
+    calendar_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    email TEXT NOT NULL,
+    PRIMARY KEY (calendar_id, event_id, email)
+);
+CREATE INDEX IF NOT EXISTS idx_attendees_email ON attendees (email);
+CREATE TABLE IF NOT EXISTS sync_state (
+    calendar_id TEXT PRIMARY KEY,
+    sync_token TEXT
+);
+"""
+
+TimeValue = Union[str, datetime, None]
+
+class _StoredIds:
+    """
+    Contenedor de IDs de eventos de un calendario respaldado por la base de datos.
+
+    Permite pasar `known_ids` a la sincronización sin cargar todos los IDs en memoria.
+    """
+
+    def __init__(self, store: 'EventStore', calendar_id: str):
+        self.store = store
+        self.calendar_id = calendar_id
+
+    def __contains__(self, event_id: object) -> bool:
+        row = self.store._fetchone(
+            "SELECT 1 FROM events WHERE calendar_id = ? AND event_id = ?",
+            (self.calendar_id, event_id)
+        )
+        return row is not None
+
+class _StoredSyncTokens:
+    """
+    Almacén de tokens de sincronización respaldado por la propia réplica.
+
+    Tiene la interfaz de `SyncTokenStore` para pasarse a `sync_events`. El token
+    nuevo no se escribe en `set`: `EventStore.apply_changes` lo guarda en la
+    misma transacción que los cambios, de modo que réplica y token no se desfasan.
+    """
+
+    def __init__(self, store: 'EventStore'):
+        self.store = store
+
+    def get(self, calendar_id: str) -> Optional[str]:
+        row = self.store._fetchone(
+            "SELECT sync_token FROM sync_state WHERE calendar_id = ?", (calendar_id,)
+        )
+        return row[0] if row is not None else None
+
+    def set(self, calendar_id: str, token: str) -> None:
+        pass
+
+    def clear(self, calendar_id: Optional[str] = None) -> None:
+        with self.store._lock, self.store._conn:
+            if calendar_id is None:
+                self.store._conn.execute("DELETE FROM sync_state")
+            else:
+                self.store._conn.execute("DELETE FROM sync_state WHERE calendar_id = ?", (calendar_id,))
+
+class EventStore:
+    """
+    Réplica persistente de eventos alimentada por CalendarInterface.
+
+    Los eventos se guardan completos (JSON) junto con columnas indexadas de
+    calendario, inicio/fin (epoch), última actualización y correos de
+    participantes, de modo que las consultas por rango, participante o título
+    se resuelven localmente sin llamar a la API.
+    """
+
+    def __init__(self, db_path: str = 'events.db', timezone: str = 'America/Santiago'):
+        """
+        Inicializa la réplica y crea el esquema si no existe.
+
+        Args:
+            db_path: Ruta del archivo SQLite (':memory:' para una réplica en memoria)
+            timezone: Zona horaria para eventos de día completo y fechas sin zona
+        """
+        self.db_path = db_path
+        self.timezone = pytz.timezone(timezone)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def _fetchone(self, query: str, params: Tuple = ()) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()
+
+    def _to_timestamp(self, value: TimeValue) -> Optional[int]:
+        """
+        Convierte un tiempo (cadena ISO o datetime) a segundos epoch.
+
+        Args:
+            value: Tiempo a convertir
+
+        Returns:
+            Segundos desde epoch o None si no puede interpretarse
+        """
+        if isinstance(value, str):
+            value = parse_event_time(value, self.timezone)
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = self.timezone.localize(value)
+        return int(value.timestamp())
+
+    def _event_bounds(self, event: Dict[str, Any]) -> Tuple[Optional[int], Optional[int], bool]:
+        """
+        Obtiene inicio y fin de un evento en segundos epoch.
+
+        Args:
+            event: Evento de Google Calendar
+
+        Returns:
+            Tupla (inicio, fin, es_día_completo)
+        """
+        start, end = event.get('start', {}), event.get('end', {})
+        if start.get('dateTime'):
+            return self._to_timestamp(start['dateTime']), self._to_timestamp(end.get('dateTime')), False
+        if start.get('date'):
+            start_ts = self._to_timestamp(start['date'])
+            end_ts = self._to_timestamp(end.get('date'))
+            if end_ts is None and start_ts is not None:
+                # Sin fin explícito, el evento dura el día de inicio (medianoche local siguiente)
+                next_day = parse_event_time(start['date']) + timedelta(days=1)
+                end_ts = self._to_timestamp(next_day)
+            return start_ts, end_ts, True
+        return None, None, False
+
+    @staticmethod
+    def _participants(event: Dict[str, Any]) -> List[str]:
+        emails = {a['email'].lower() for a in event.get('attendees', []) if a.get('email')}
+        if event.get('organizer', {}).get('email'):
+            emails.add(event['organizer']['email'].lower())
+        return sorted(emails)
+
+    def _delete_rows(self, calendar_id: str, event_ids: Iterable[str]) -> None:
+        rows = [(calendar_id, event_id) for event_id in event_ids]
+        self._conn.executemany(
+            "DELETE FROM events WHERE calendar_id = ? AND event_id = ?", rows
+        )
+        self._conn.executemany(
+            "DELETE FROM attendees WHERE calendar_id = ? AND event_id = ?", rows
+        )
+
+    def _upsert_rows(self, calendar_id: str, events: Iterable[Dict[str, Any]]) -> int:
+        count = 0
+        for event in events:
+            if not event.get('id'):
+                continue
+            if event.get('status') == 'cancelled':
+                self._delete_rows(calendar_id, [event['id']])
+                continue
+
+            start_ts, end_ts, all_day = self._event_bounds(event)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO events (calendar_id, event_id, start_ts, end_ts, all_day, "
+                "updated, status, title_lower, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (calendar_id, event['id'], start_ts, end_ts, int(all_day), event.get('updated'),
+                 event.get('status'), (event.get('summary') or '').lower(),
+                 json.dumps(event, separators=(',', ':')))
+            )
+            self._conn.execute(
+                "DELETE FROM attendees WHERE calendar_id = ? AND event_id = ?",
+                (calendar_id, event['id'])
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO attendees (calendar_id, event_id, email) VALUES (?, ?, ?)",
+                [(calendar_id, event['id'], email) for email in self._participants(event)]
+            )
+            count += 1
+        return count
+
+    def upsert_events(self, calendar_id: str, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Inserta o actualiza eventos; los eventos cancelados se eliminan.
+
+        Args:
+            calendar_id: ID del calendario
+            events: Eventos de Google Calendar
+
+        Returns:
+            Número de eventos insertados o actualizados
+        """
+        with self._lock, self._conn:
+            return self._upsert_rows(calendar_id, events)
+
+    def delete_events(self, calendar_id: str, event_ids: Iterable[str]) -> None:
+        """
+        Elimina eventos de la réplica.
+
+        Args:
+            calendar_id: ID del calendario
+            event_ids: IDs de los eventos a eliminar
+        """
+        with self._lock, self._conn:
+            self._delete_rows(calendar_id, event_ids)
+
+    def apply_changes(self, changes: EventChangeSet) -> None:
+        """
+        Aplica un conjunto de cambios de sincronización en una sola transacción.
+
+        Si el conjunto trae `sync_token`, se guarda junto con los cambios para
+        la siguiente sincronización incremental.
+
+        Args:
+            changes: Cambios devueltos por `CalendarInterface.sync_events`
+        """
+        with self._lock, self._conn:
+            if changes.full_resync:
+                self._conn.execute("DELETE FROM events WHERE calendar_id = ?", (changes.calendar_id,))
+                self._conn.execute("DELETE FROM attendees WHERE calendar_id = ?", (changes.calendar_id,))
+            self._upsert_rows(changes.calendar_id, changes.added)
+            self._upsert_rows(changes.calendar_id, changes.updated)
+            self._delete_rows(changes.calendar_id, [e['id'] for e in changes.cancelled if e.get('id')])
+            if changes.sync_token:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (calendar_id, sync_token) VALUES (?, ?)",
+                    (changes.calendar_id, changes.sync_token)
+                )
+
+    def known_ids(self, calendar_id: str) -> _StoredIds:
+        """
+        Obtiene un contenedor de los IDs almacenados de un calendario.
+
+        Args:
+            calendar_id: ID del calendario
+
+        Returns:
+            Contenedor que responde a `in` consultando la base de datos
+        """
+        return _StoredIds(self, calendar_id)
+
+    def refresh(self, interface: Any, calendar_id: str = 'primary') -> Optional[EventChangeSet]:
+        """
+        Actualiza la réplica de un calendario de forma incremental.
+
+        El token de sincronización se lee de la réplica y no del almacén de la
+        interfaz: una réplica nueva (o sin token) siempre parte de una
+        sincronización completa.
+
+        Args:
+            interface: Instancia de CalendarInterface
+            calendar_id: ID del calendario
+
+        Returns:
+            Cambios aplicados, o None si la sincronización falló
+        """
+        changes = interface.sync_events(calendar_id, token_store=_StoredSyncTokens(self),
+                                        known_ids=self.known_ids(calendar_id))
+        if changes is not None:
+            self.apply_changes(changes)
+            logger.info(f"Réplica local actualizada para {calendar_id}: {changes!r}")
+        return changes
+
+    def query_events(self,
+                     calendar_id: Optional[str] = None,
+                     start: TimeValue = None,
+                     end: TimeValue = None,
+                     participant: Optional[str] = None,
+                     title_contains: Optional[str] = None,
+                     min_duration: Optional[timedelta] = None,
+                     max_duration: Optional[timedelta] = None,
+                     overlapping: bool = False,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Consulta eventos de la réplica usando los índices.
+
+        Los criterios equivalen a los de CalendarFilter: el rango se aplica al
+        inicio del evento (inclusive) y, como en `filter_by_date_range` y
+        `filter_by_duration`, los filtros de rango y duración excluyen los
+        eventos de día completo. Con `overlapping=True` se devuelven todos los
+        eventos que se solapan con el rango, incluidos los de día completo
+        (búsqueda de espacios).
+
+        Args:
+            calendar_id: ID del calendario (None para todos)
+            start: Inicio del rango
+            end: Fin del rango
+            participant: Correo de organizador o asistente
+            title_contains: Texto contenido en el título (sin distinguir mayúsculas)
+            min_duration: Duración mínima
+            max_duration: Duración máxima
+            overlapping: Seleccionar eventos que se solapan con el rango
+            limit: Número máximo de resultados
+
+        Returns:
+            Eventos ordenados por inicio
+        """
+        clauses, params = [], []
+        start_ts, end_ts = self._to_timestamp(start), self._to_timestamp(end)
+
+        if calendar_id is not None:
+            clauses.append("e.calendar_id = ?")
+            params.append(calendar_id)
+        if overlapping:
+            if start_ts is not None:
+                clauses.append("e.end_ts > ?")
+                params.append(start_ts)
+            if end_ts is not None:
+                clauses.append("e.start_ts < ?")
+                params.append(end_ts)
+        else:
+            if start_ts is not None or end_ts is not None:
+                clauses.append("e.all_day = 0")
+            if start_ts is not None:
+                clauses.append("e.start_ts >= ?")
+                params.append(start_ts)
+            if end_ts is not None:
+                clauses.append("e.start_ts <= ?")
+                params.append(end_ts)
+        if participant:
+            clauses.append("EXISTS (SELECT 1 FROM attendees a WHERE a.calendar_id = e.calendar_id "
+                           "AND a.event_id = e.event_id AND a.email = ?)")
+            params.append(participant.lower())
+        if title_contains:
+            clauses.append("instr(e.title_lower, ?) > 0")
+            params.append(title_contains.lower())
+        if min_duration is not None or max_duration is not None:
+            clauses.append("e.all_day = 0")
+        if min_duration is not None:
+            clauses.append("e.end_ts - e.start_ts >= ?")
+            params.append(int(min_duration.total_seconds()))
+        if max_duration is not None:
+            clauses.append("e.end_ts - e.start_ts <= ?")
+            params.append(int(max_duration.total_seconds()))
+
+        query = "SELECT e.payload FROM events e"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY e.start_ts"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(row['payload']) for row in rows]
+
+    def count(self, calendar_id: Optional[str] = None) -> int:
+        """
+        Cuenta los eventos almacenados.
+
+        Args:
+            calendar_id: ID del calendario (None para todos)
+
+        Returns:
+            Número de eventos
+        """
+        if calendar_id is None:
+            row = self._fetchone("SELECT COUNT(*) FROM events")
+        else:
+            row = self._fetchone("SELECT COUNT(*) FROM events WHERE calendar_id = ?", (calendar_id,))
+        return row[0]
+
+    def close(self) -> None:
+        """
+        Cierra la conexión con la base de datos.
+        """
+        with self._lock:
+            self._conn.close()
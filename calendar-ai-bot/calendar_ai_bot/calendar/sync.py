@@ -0,0 +1,168 @@
+"""
+Soporte para sincronización incremental de eventos con syncToken.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Un candado por archivo: varias instancias del proceso pueden compartirlo
+_file_locks: Dict[str, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+def _file_lock(path: str) -> threading.Lock:
+    key = os.path.abspath(path)
+    with _file_locks_guard:
+        return _file_locks.setdefault(key, threading.Lock())
+
+class SyncTokenStore:
+    """
+    Almacén persistente de tokens de sincronización por cuenta y calendario.
+
+    Varias cuentas pueden compartir el archivo: los tokens se agrupan por
+    `account`, de modo que el calendario 'primary' de dos usuarios no se pisa.
+    Cada escritura relee el archivo, modifica solo las entradas propias y lo
+    reemplaza de forma atómica.
+    """
+
+    def __init__(self, token_file: str = 'sync_tokens.json', account: str = 'default'):
+        """
+        Inicializa el almacén de tokens.
+
+        Args:
+            token_file: Ruta del archivo JSON donde se guardan los tokens
+            account: Cuenta a la que pertenecen los tokens (p. ej. la ruta de su token OAuth)
+        """
+        self.token_file = token_file
+        self.account = account
+        self._lock = _file_lock(token_file)
+        self.tokens: Dict[str, str] = self._account_tokens(self._load_tokens())
+
+    def _load_tokens(self) -> Dict[str, Any]:
+        """
+        Carga el contenido completo del archivo JSON.
+
+        Returns:
+            Diccionario de cuenta a tokens de sincronización por calendario
+        """
+        try:
+            if os.path.exists(self.token_file):
+                with open(self.token_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            return {}
+        except Exception as e:
+            logger.error(f"Error al cargar tokens de sincronización: {e}")
+            return {}
+
+    def _account_tokens(self, data: Dict[str, Any]) -> Dict[str, str]:
+        tokens = data.get(self.account)
+        return dict(tokens) if isinstance(tokens, dict) else {}
+
+    def _save_tokens(self) -> None:
+        """
+        Guarda los tokens de la cuenta sin tocar los de otras cuentas.
+        """
+        with self._lock:
+            data = self._load_tokens()
+            data[self.account] = dict(self.tokens)
+            directory = os.path.dirname(os.path.abspath(self.token_file))
+            try:
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.sync_tokens.', suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2)
+                    os.replace(temp_path, self.token_file)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
+            except Exception as e:
+                logger.error(f"Error al guardar tokens de sincronización: {e}")
+
+    def get(self, calendar_id: str) -> Optional[str]:
+        """
+        Obtiene el token de sincronización de un calendario.
+
+        Args:
+            calendar_id: ID del calendario
+
+        Returns:
+            Token de sincronización o None si no hay
+        """
+        return self.tokens.get(calendar_id)
+
+    def set(self, calendar_id: str, token: str) -> None:
+        """
+        Guarda el token de sincronización de un calendario.
+
+        Args:
+            calendar_id: ID del calendario
+            token: Token devuelto en nextSyncToken
+        """
+        self.tokens[calendar_id] = token
+        self._save_tokens()
+
+    def clear(self, calendar_id: Optional[str] = None) -> None:
+        """
+        Elimina el token de un calendario, o todos los de la cuenta si no se indica.
+
+        Args:
+            calendar_id: ID del calendario
+        """
+        if calendar_id is None:
+            self.tokens.clear()
+        else:
+            self.tokens.pop(calendar_id, None)
+        self._save_tokens()
+
+class EventChangeSet:
+    """
+    Conjunto de cambios devuelto por una sincronización incremental.
+    """
+
+    def __init__(self, calendar_id: str, full_resync: bool = False):
+        """
+        Inicializa un conjunto de cambios vacío.
+
+        Args:
+            calendar_id: ID del calendario sincronizado
+            full_resync: True si el conjunto proviene de una sincronización completa
+                (el consumidor debe reemplazar su estado en lugar de aplicarlo)
+        """
+        self.calendar_id = calendar_id
+        self.full_resync = full_resync
+        self.added: List[Dict[str, Any]] = []
+        self.updated: List[Dict[str, Any]] = []
+        self.cancelled: List[Dict[str, Any]] = []
+        self.sync_token: Optional[str] = None
+
+    def add(self, event: Dict[str, Any], known: Optional[bool] = None) -> None:
+        """
+        Clasifica un evento recibido como agregado, actualizado o cancelado.
+
+        Args:
+            event: Evento devuelto por la API
+            known: Si el evento ya era conocido localmente; si es None se
+                deduce comparando las marcas `created` y `updated`
+        """
+        if event.get('status') == 'cancelled':
+            self.cancelled.append(event)
+        elif self.full_resync:
+            self.added.append(event)
+        elif known is None:
+            is_new = event.get('created', '')[:19] == event.get('updated', '')[:19]
+            (self.added if is_new else self.updated).append(event)
+        else:
+            (self.updated if known else self.added).append(event)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.cancelled)
+
+    def __repr__(self) -> str:
+        return (f"EventChangeSet({self.calendar_id!r}, added={len(self.added)}, "
+                f"updated={len(self.updated)}, cancelled={len(self.cancelled)}, "
+                f"full_resync={self.full_resync})")
@@ -0,0 +1,308 @@
+"""
+Sincronización dirigida por notificaciones push (canales watch) de Google Calendar.
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Duración solicitada para los canales (la API admite hasta 7 días para eventos)
+DEFAULT_CHANNEL_TTL = 7 * 24 * 3600
+
+# Fracción máxima de la vida concedida a un canal que se usa como antelación de
+# renovación, y espera mínima entre renovaciones de un mismo canal (segundos)
+RENEW_TTL_FRACTION = 0.5
+MIN_RENEW_INTERVAL = 60
+
+class SyncJobQueue:
+    """
+    Cola de trabajos de sincronización por calendario sin duplicados.
+
+    Varias notificaciones de un mismo calendario antes de que se procese su
+    trabajo se combinan en una sola sincronización.
+    """
+
+    def __init__(self):
+        """
+        Inicializa la cola vacía.
+        """
+        self._queue: 'queue.Queue[str]' = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def put(self, calendar_id: str) -> bool:
+        """
+        Encola la sincronización de un calendario.
+
+        Args:
+            calendar_id: ID del calendario
+
+        Returns:
+            True si se encoló, False si ya había un trabajo pendiente
+        """
+        with self._lock:
+            if calendar_id in self._pending:
+                return False
+            self._pending.add(calendar_id)
+        self._queue.put(calendar_id)
+        return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Obtiene el siguiente calendario a sincronizar.
+
+        Args:
+            timeout: Segundos máximos de espera (None para esperar indefinidamente)
+
+        Returns:
+            ID del calendario, o None si se agotó la espera
+        """
+        try:
+            calendar_id = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        with self._lock:
+            self._pending.discard(calendar_id)
+        return calendar_id
+
+    def __len__(self) -> int:
+        return self._queue.qsize()
+
+class NotificationReceiver:
+    """
+    Receptor HTTP local de las notificaciones de canales watch.
+
+    Google envía un POST sin cuerpo por cada cambio, con el canal y el estado
+    del recurso en cabeceras `X-Goog-*`. El receptor responde de inmediato y
+    delega el procesamiento en `on_notification`.
+    """
+
+    def __init__(self, on_notification: Callable[[Dict[str, str]], bool],
+                 host: str = '127.0.0.1', port: int = 8080):
+        """
+        Inicializa el receptor.
+
+        Args:
+            on_notification: Función que recibe las cabeceras X-Goog-* (en
+                minúsculas) y devuelve True si la notificación es válida
+            host: Dirección en la que escuchar
+            port: Puerto en el que escuchar (0 para uno libre)
+        """
+        self.on_notification = on_notification
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _handler_class(self) -> type:
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                headers = {
+                    name.lower(): value for name, value in self.headers.items()
+                    if name.lower().startswith('x-goog-')
+                }
+                try:
+                    accepted = receiver.on_notification(headers)
+                except Exception as e:
+                    logger.error(f"Error al procesar notificación de Calendar: {e}")
+                    accepted = True
+                self.send_response(200 if accepted else 404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("Receptor de notificaciones: " + format % args)
+
+        return Handler
+
+    def start(self) -> None:
+        """
+        Inicia el servidor en un hilo en segundo plano.
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Receptor de notificaciones escuchando en {self.host}:{self.port}")
+
+    def stop(self) -> None:
+        """
+        Detiene el servidor.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+class WatchManager:
+    """
+    Administra los canales watch de varios calendarios.
+
+    Abre un canal por calendario, traduce las notificaciones recibidas en
+    trabajos de sincronización y renueva cada canal antes de que expire. Los
+    calendarios cuyo canal no puede abrirse quedan en `polled_calendars` para
+    que el llamador los sincronice por sondeo.
+    """
+
+    def __init__(self,
+                 interface: Any,
+                 address: str,
+                 jobs: Optional[SyncJobQueue] = None,
+                 ttl_seconds: int = DEFAULT_CHANNEL_TTL,
+                 renew_before_seconds: int = 3600,
+                 clock: Callable[[], float] = time.time):
+        """
+        Inicializa el administrador.
+
+        Args:
+            interface: Instancia de CalendarInterface
+            address: URL HTTPS pública que recibe las notificaciones
+            jobs: Cola de trabajos de sincronización (por defecto, una nueva)
+            ttl_seconds: Duración solicitada para cada canal
+            renew_before_seconds: Antelación con la que se renuevan los canales (como
+                máximo la mitad de la vida concedida por la API)
+            clock: Reloj en segundos epoch
+        """
+        self.interface = interface
+        self.address = address
+        self.jobs = jobs if jobs is not None else SyncJobQueue()
+        self.ttl_seconds = ttl_seconds
+        self.renew_before_seconds = renew_before_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.channels: Dict[str, Dict[str, Any]] = {}
+        self._by_channel_id: Dict[str, str] = {}
+        self.polled_calendars: List[str] = []
+
+    def watch(self, calendar_id: str) -> bool:
+        """
+        Abre (o reemplaza) el canal watch de un calendario.
+
+        Args:
+            calendar_id: ID del calendario
+
+        Returns:
+            True si el canal quedó activo; si no, el calendario pasa a sondeo
+        """
+        channel_id = str(uuid.uuid4())
+        token = uuid.uuid4().hex
+        channel = self.interface.watch_events(
+            calendar_id, self.address, channel_id, token=token, ttl_seconds=self.ttl_seconds
+        )
+        if not channel:
+            with self._lock:
+                # El canal anterior (si lo había) está por expirar: se descarta para
+                # que renovaciones y cierres posteriores no apunten a él
+                stale = self.channels.pop(calendar_id, None)
+                if stale:
+                    self._by_channel_id.pop(stale['id'], None)
+                if calendar_id not in self.polled_calendars:
+                    self.polled_calendars.append(calendar_id)
+            if stale:
+                logger.error(f"No se pudo renovar el canal watch de {calendar_id}; se usará sondeo")
+            else:
+                logger.warning(f"No se pudo abrir canal watch para {calendar_id}; se usará sondeo")
+            return False
+
+        now = self._clock()
+        expiration = channel.get('expiration')
+        expiration = int(expiration) / 1000 if expiration else now + self.ttl_seconds
+        # Si la API concede menos vida que la antelación configurada, se renueva a
+        # mitad de la vida concedida; nunca antes de MIN_RENEW_INTERVAL, para no
+        # renovar en cada vuelta del bucle
+        lead = min(self.renew_before_seconds, max(0.0, expiration - now) * RENEW_TTL_FRACTION)
+        entry = {
+            'id': channel_id,
+            'resource_id': channel.get('resourceId'),
+            'token': token,
+            'expiration': expiration,
+            'renew_at': max(expiration - lead, now + MIN_RENEW_INTERVAL)
+        }
+        with self._lock:
+            previous = self.channels.get(calendar_id)
+            self.channels[calendar_id] = entry
+            self._by_channel_id[channel_id] = calendar_id
+            if calendar_id in self.polled_calendars:
+                self.polled_calendars.remove(calendar_id)
+        if previous:
+            self._stop(previous)
+        logger.info(f"Canal watch activo para {calendar_id} hasta {entry['expiration']:.0f}")
+        return True
+
+    def _stop(self, channel: Dict[str, Any]) -> None:
+        with self._lock:
+            self._by_channel_id.pop(channel['id'], None)
+        self.interface.stop_channel(channel['id'], channel['resource_id'])
+
+    def renew_expiring(self) -> List[str]:
+        """
+        Renueva los canales que expiran dentro del margen configurado.
+
+        Returns:
+            IDs de los calendarios cuyos canales se renovaron
+        """
+        now = self._clock()
+        with self._lock:
+            expiring = [cal for cal, channel in self.channels.items() if channel['renew_at'] <= now]
+        return [calendar_id for calendar_id in expiring if self.watch(calendar_id)]
+
+    def seconds_until_renewal(self) -> Optional[float]:
+        """
+        Obtiene los segundos hasta la próxima renovación necesaria.
+
+        Returns:
+            Segundos (0 si ya corresponde), o None si no hay canales
+        """
+        with self._lock:
+            if not self.channels:
+                return None
+            earliest = min(channel['renew_at'] for channel in self.channels.values())
+        return max(0.0, earliest - self._clock())
+
+    def handle_notification(self, headers: Mapping[str, str]) -> bool:
+        """
+        Procesa una notificación recibida y encola la sincronización del calendario.
+
+        Args:
+            headers: Cabeceras X-Goog-* de la notificación (en minúsculas)
+
+        Returns:
+            True si la notificación corresponde a un canal activo
+        """
+        channel_id = headers.get('x-goog-channel-id')
+        with self._lock:
+            calendar_id = self._by_channel_id.get(channel_id)
+            channel = self.channels.get(calendar_id) if calendar_id else None
+        if channel is None or headers.get('x-goog-channel-token') != channel['token']:
+            logger.warning(f"Notificación de canal desconocido: {channel_id}")
+            return False
+
+        # El mensaje 'sync' solo confirma la apertura del canal
+        if headers.get('x-goog-resource-state') != 'sync':
+            self.jobs.put(calendar_id)
+        return True
+
+    def stop_all(self) -> None:
+        """
+        Cierra todos los canales activos.
+        """
+        with self._lock:
+            channels = list(self.channels.values())
+            self.channels.clear()
+        for channel in channels:
+            self._stop(channel)
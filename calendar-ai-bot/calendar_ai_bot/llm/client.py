@@ -4,10 +4,11 @@ Cliente de Modelo de Lenguaje para Calendar AI Bot.
 
 import logging
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 
-import groq
-import openai
+from .json_stream import IncrementalJSONExtractor, extract_json
+from .pool import ClientRegistry, default_registry
+from .prompts import CompactEventEncoder, compact_text
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +29,21 @@ class LLMClient:
         self.model = config.get('model', 'llama3-70b-8192')
         self.temperature = config.get('temperature', 0.7)
         self.max_tokens = config.get('max_tokens', 1024)
-
-        # Configurar cliente según el proveedor
-        if self.provider == 'groq':
-            self.client = groq.Groq(api_key=config.get('api_key'))
-        elif self.provider == 'openai':
-            self.client = openai.OpenAI(api_key=config.get('api_key'))
-        else:
-            raise ValueError(f"Proveedor LLM no soportado: {self.provider}")
+        self.context_window = config.get('context_window', 8192)
+        self.packed_summary_tokens = config.get('packed_summary_tokens', 80)
+        self.packed_max_events = config.get('packed_max_events', 20)
+        self.compact_prompts = config.get('compact_prompts', True)
+        self.json_mode = config.get('json_mode', True)
+        self.stream_responses = config.get('stream_responses', False)
+
+        # Configurar cliente según el proveedor, reutilizando el pool de conexiones
+        registry = default_registry if config.get('share_clients', True) else ClientRegistry()
+        self.client = registry.get_client(
+            self.provider,
+            api_key=config.get('api_key'),
+            base_url=config.get('base_url'),
+            pool_config=config.get('http_pool')
+        )
 
     def generate_event_summary(self, event: Dict[str, Any]) -> str:
         """
@@ -53,7 +61,51 @@ class LLMClient:
             return response
         except Exception as e:
             logger.error(f"Error al generar resumen de evento: {e}")
-            return f"Resumen no disponible. Detalles del evento: {json.dumps(event, indent=2)}"
+            details = CompactEventEncoder([event]).encode(event)
+            return f"Resumen no disponible. Detalles del evento: {details}"
+
+    def generate_event_summaries(self,
+                                 events: List[Dict[str, Any]],
+                                 batch_size: Optional[int] = None) -> List[str]:
+        """
+        Genera resúmenes para varios eventos empaquetando K eventos por solicitud.
+
+        Cada solicitud pide al modelo un arreglo JSON con un resumen por evento.
+        Dentro del prompt los eventos se identifican por su posición en el lote
+        (#0, #1, ...), no por su ID, que puede faltar o repetirse (p. ej. en
+        instancias de una serie). Los eventos cuyo resumen no puede recuperarse
+        de la respuesta se resumen individualmente con `generate_event_summary`.
+
+        Args:
+            events: Lista de eventos de Google Calendar
+            batch_size: Número de eventos por solicitud (por defecto se calcula
+                a partir del presupuesto de tokens)
+
+        Returns:
+            Lista de resúmenes en el mismo orden que los eventos
+        """
+        size = batch_size or self._choose_packed_batch_size(events)
+        summaries: Dict[int, str] = {}
+
+        for offset in range(0, len(events), size):
+            chunk = events[offset:offset + size]
+            keys = [f"#{position}" for position in range(len(chunk))]
+            parsed: Dict[str, str] = {}
+            try:
+                prompt = self._build_packed_summary_prompt(list(zip(keys, chunk)))
+                parsed = self._parse_packed_summaries(self._generate_text(prompt))
+            except Exception as e:
+                logger.error(f"Error al generar resúmenes empaquetados: {e}")
+
+            for position, event in enumerate(chunk):
+                summary = parsed.get(keys[position])
+                if summary is None:
+                    logger.debug(f"Resumen empaquetado faltante para {event.get('id') or keys[position]}, "
+                                 f"usando solicitud individual")
+                    summary = self.generate_event_summary(event)
+                summaries[offset + position] = summary
+
+        return [summaries[index] for index in range(len(events))]
 
     def analyze_schedule(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -67,18 +119,16 @@ class LLMClient:
         """
         try:
             prompt = self._build_schedule_analysis_prompt(events)
-            response_str = self._generate_text(prompt)
-            
-            # Intentar parsear la respuesta como JSON
-            try:
-                response_json = json.loads(response_str)
+            response_str, response_json = self._generate_json(prompt)
+
+            if response_json is not None:
                 return response_json
-            except json.JSONDecodeError:
-                # Si no es JSON válido, devolver como texto plano
-                return {
-                    'analysis_text': response_str,
-                    'raw_events_count': len(events)
-                }
+
+            # Si no hay JSON recuperable, devolver como texto plano
+            return {
+                'analysis_text': response_str,
+                'raw_events_count': len(events)
+            }
         except Exception as e:
             logger.error(f"Error al analizar agenda: {e}")
             return {
@@ -89,7 +139,8 @@ class LLMClient:
     def suggest_optimal_meeting_time(self, 
                                      participants: List[str], 
                                      duration: int, 
-                                     constraints: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                                     constraints: Optional[Dict[str, Any]] = None,
+                                     busy_intervals: Optional[Dict[str, List[Dict[str, str]]]] = None) -> Dict[str, Any]:
         """
         Sugiere un tiempo óptimo para una reunión.
 
@@ -97,23 +148,23 @@ class LLMClient:
             participants: Lista de correos electrónicos de participantes
             duration: Duración de la reunión en minutos
             constraints: Restricciones adicionales para la programación
+            busy_intervals: Intervalos ocupados por participante (freeBusy)
 
         Returns:
             Sugerencia de tiempo de reunión
         """
         try:
-            prompt = self._build_meeting_time_prompt(participants, duration, constraints)
-            response_str = self._generate_text(prompt)
-            
-            try:
-                response_json = json.loads(response_str)
+            prompt = self._build_meeting_time_prompt(participants, duration, constraints, busy_intervals)
+            response_str, response_json = self._generate_json(prompt)
+
+            if response_json is not None:
                 return response_json
-            except json.JSONDecodeError:
-                return {
-                    'suggestion_text': response_str,
-                    'participants': participants,
-                    'duration_minutes': duration
-                }
+
+            return {
+                'suggestion_text': response_str,
+                'participants': participants,
+                'duration_minutes': duration
+            }
         except Exception as e:
             logger.error(f"Error al sugerir tiempo de reunión: {e}")
             return {
@@ -122,38 +173,261 @@ class LLMClient:
                 'duration_minutes': duration
             }
 
-    def _generate_text(self, prompt: str) -> str:
+    def _completion_params(self, prompt: str, json_mode: bool = False) -> Dict[str, Any]:
+        """
+        Construye los parámetros de una solicitud de chat completion.
+
+        Args:
+            prompt: Texto de entrada para el modelo
+            json_mode: Solicitar al proveedor una respuesta en modo JSON
+
+        Returns:
+            Parámetros para `chat.completions.create`
+        """
+        params = {
+            'messages': [{"role": "user", "content": prompt}],
+            'model': self.model,
+            'temperature': self.temperature,
+            'max_tokens': self.max_tokens
+        }
+        if json_mode and self.json_mode:
+            params['response_format'] = {'type': 'json_object'}
+        return params
+
+    def _create_completion(self, prompt: str, json_mode: bool = False, **kwargs: Any) -> Any:
+        """
+        Envía una solicitud de chat completion, con modo JSON solo donde está disponible.
+
+        Si el modelo rechaza `response_format` (HTTP 400), se reintenta una vez
+        sin él y el modo JSON queda desactivado para este cliente; el JSON se
+        sigue extrayendo del texto de forma tolerante.
+
+        Args:
+            prompt: Texto de entrada para el modelo
+            json_mode: Solicitar una respuesta en modo JSON
+            **kwargs: Parámetros adicionales (p. ej. `stream=True`)
+
+        Returns:
+            Respuesta (o stream) del SDK del proveedor
+        """
+        params = self._completion_params(prompt, json_mode)
+        try:
+            return self.client.chat.completions.create(**kwargs, **params)
+        except Exception as e:
+            if 'response_format' not in params or getattr(e, 'status_code', None) != 400:
+                raise
+            logger.warning(f"El modelo {self.model} no admite response_format; "
+                           f"se reintenta sin modo JSON: {e}")
+            self.json_mode = False
+            params.pop('response_format')
+            return self.client.chat.completions.create(**kwargs, **params)
+
+    def _generate_text(self, prompt: str, json_mode: bool = False) -> str:
         """
         Genera texto usando el modelo de lenguaje configurado.
 
         Args:
             prompt: Texto de entrada para el modelo
+            json_mode: Solicitar una respuesta en modo JSON
 
         Returns:
             Texto generado por el modelo
         """
         try:
-            if self.provider == 'groq':
-                chat_completion = self.client.chat.completions.create(
-                    messages=[{"role": "user", "content": prompt}],
-                    model=self.model,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens
-                )
-                return chat_completion.choices[0].message.content
-            
-            elif self.provider == 'openai':
-                chat_completion = self.client.chat.completions.create(
-                    messages=[{"role": "user", "content": prompt}],
-                    model=self.model,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens
-                )
-                return chat_completion.choices[0].message.content
+            chat_completion = self._create_completion(prompt, json_mode)
+            return chat_completion.choices[0].message.content
         except Exception as e:
             logger.error(f"Error al generar texto con LLM: {e}")
             raise
 
+    def _stream_text(self, prompt: str, json_mode: bool = False) -> Iterator[str]:
+        """
+        Genera texto en modo streaming, entregando los fragmentos a medida que llegan.
+
+        Args:
+            prompt: Texto de entrada para el modelo
+            json_mode: Solicitar una respuesta en modo JSON
+
+        Yields:
+            Fragmentos de texto generados por el modelo
+        """
+        try:
+            stream = self._create_completion(prompt, json_mode, stream=True)
+        except Exception as e:
+            logger.error(f"Error al generar texto con LLM: {e}")
+            raise
+
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            close = getattr(stream, 'close', None)
+            if close:
+                close()
+
+    def _generate_json(self, prompt: str,
+                       expected_type: type = dict) -> Tuple[str, Optional[Any]]:
+        """
+        Genera una respuesta JSON y la decodifica de forma tolerante.
+
+        En modo streaming la respuesta se analiza de forma incremental y la
+        conexión se cierra en cuanto se completa el primer valor JSON.
+
+        Args:
+            prompt: Texto de entrada para el modelo
+            expected_type: Tipo del valor JSON esperado
+
+        Returns:
+            Tupla (texto recibido, valor JSON o None si no se pudo extraer)
+        """
+        if not self.stream_responses:
+            text = self._generate_text(prompt, json_mode=True)
+            return text, extract_json(text, expected_type)
+
+        extractor = IncrementalJSONExtractor()
+        received = []
+        for chunk in self._stream_text(prompt, json_mode=True):
+            received.append(chunk)
+            for value in extractor.feed(chunk):
+                if isinstance(value, expected_type):
+                    return ''.join(received), value
+
+        return ''.join(received), None
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        Estima el número de tokens de un texto (aprox. 4 caracteres por token).
+
+        Args:
+            text: Texto a estimar
+
+        Returns:
+            Número aproximado de tokens
+        """
+        return len(text) // 4 + 1
+
+    def _choose_packed_batch_size(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Calcula cuántos eventos caben en una solicitud según el presupuesto de tokens.
+
+        El límite de entrada es la ventana de contexto menos los tokens reservados
+        para la respuesta; el de salida, `max_tokens` dividido por los tokens
+        estimados por resumen.
+
+        Args:
+            events: Eventos a resumir
+
+        Returns:
+            Número de eventos por solicitud (al menos 1)
+        """
+        if not events:
+            return 1
+
+        sample = events[:50]
+        event_tokens = sum(
+            self._estimate_tokens(self._format_packed_event('x', event)) for event in sample
+        ) / len(sample)
+        instruction_tokens = self._estimate_tokens(self._build_packed_summary_prompt([]))
+
+        input_budget = self.context_window - self.max_tokens - instruction_tokens
+        by_input = int(input_budget // max(event_tokens, 1))
+        by_output = self.max_tokens // max(self.packed_summary_tokens, 1)
+
+        return max(1, min(by_input, by_output, self.packed_max_events))
+
+    def _format_packed_event(self, key: str, event: Dict[str, Any],
+                             encoder: Optional[CompactEventEncoder] = None) -> str:
+        """
+        Formatea un evento como una entrada del prompt empaquetado.
+
+        Args:
+            key: Identificador del evento dentro del prompt
+            event: Diccionario de evento de Google Calendar
+            encoder: Codificador compacto compartido por el lote
+
+        Returns:
+            Bloque de texto del evento
+        """
+        if self.compact_prompts:
+            encoder = encoder or CompactEventEncoder([event])
+            return encoder.encode(event, key=key)
+
+        return (
+            f"[{key}] {event.get('summary', 'Sin título')} | "
+            f"{event.get('start', {}).get('dateTime', 'No especificada')} - "
+            f"{event.get('end', {}).get('dateTime', 'No especificada')} | "
+            f"{', '.join([p.get('email', '') for p in event.get('attendees', [])])} | "
+            f"{event.get('description', '')}"
+        )
+
+    def _build_packed_summary_prompt(self, items: List[Tuple[str, Dict[str, Any]]]) -> str:
+        """
+        Construye un prompt que resume varios eventos en una sola solicitud.
+
+        Args:
+            items: Pares (identificador, evento) a incluir
+
+        Returns:
+            Prompt para generación de resúmenes empaquetados
+        """
+        if self.compact_prompts:
+            encoder = CompactEventEncoder([event for _, event in items])
+            events_block = "\n".join(
+                self._format_packed_event(key, event, encoder) for key, event in items
+            )
+            return compact_text(f"""
+            Resume de forma concisa cada evento de calendario.
+            Formato: [id]título|inicio-fin|participantes|descripción
+            {encoder.header()}
+            {events_block}
+            Responde solo con un arreglo JSON [{{"id":"<id>","summary":"<resumen>"}}] con los ids dados.
+            """)
+
+        events_block = "\n".join(self._format_packed_event(key, event) for key, event in items)
+
+        return f"""
+        Genera un resumen conciso y útil para cada uno de los siguientes eventos de calendario.
+        Cada línea tiene el formato: [id] título | inicio - fin | participantes | descripción
+
+        {events_block}
+
+        Responde únicamente con un arreglo JSON de objetos {{"id": "<id>", "summary": "<resumen>"}},
+        uno por evento, usando exactamente los ids indicados entre corchetes.
+        """
+
+    @staticmethod
+    def _parse_packed_summaries(text: str) -> Dict[str, str]:
+        """
+        Extrae los resúmenes de una respuesta empaquetada.
+
+        Tolera texto alrededor del JSON y objetos mal formados: cada objeto
+        `{"id", "summary"}` que pueda decodificarse se recupera por separado.
+
+        Args:
+            text: Respuesta del modelo
+
+        Returns:
+            Diccionario de identificador de evento a resumen
+        """
+        decoder = json.JSONDecoder()
+        summaries: Dict[str, str] = {}
+        position = text.find('{')
+
+        while position != -1:
+            try:
+                item, end = decoder.raw_decode(text, position)
+            except json.JSONDecodeError:
+                position = text.find('{', position + 1)
+                continue
+
+            if isinstance(item, dict) and 'id' in item and isinstance(item.get('summary'), str):
+                summaries[str(item['id'])] = item['summary']
+            position = text.find('{', end)
+
+        return summaries
+
     def _build_event_summary_prompt(self, event: Dict[str, Any]) -> str:
         """
         Construye un prompt para generar resumen de evento.
@@ -164,6 +438,15 @@ class LLMClient:
         Returns:
             Prompt para generación de resumen
         """
+        if self.compact_prompts:
+            encoder = CompactEventEncoder([event])
+            return compact_text(f"""
+            Resume de forma concisa y clara este evento de calendario, destacando sus puntos clave.
+            Formato: título|inicio-fin|participantes|descripción
+            {encoder.header()}
+            {encoder.encode(event)}
+            """)
+
         return f"""
         Genera un resumen conciso y útil para el siguiente evento de calendario:
 
@@ -186,6 +469,20 @@ class LLMClient:
         Returns:
             Prompt para análisis de agenda
         """
+        if self.compact_prompts:
+            encoder = CompactEventEncoder(events, abbreviate_domains=False)
+            events_block = "\n".join(
+                encoder.encode(event, include_details=False) for event in events
+            )
+            return compact_text(f"""
+            Analiza esta agenda y responde en JSON con: total de eventos, distribución por tipo
+            (trabajo, personal, reuniones), tiempo total ocupado, intervalos libres y sugerencias
+            de optimización.
+            Formato: título|inicio-fin
+            {encoder.header()}
+            {events_block}
+            """)
+
         events_summary = "\n".join([
             f"- {event.get('summary', 'Sin título')} "
             f"({event.get('start', {}).get('dateTime', 'Sin hora')})"
@@ -211,7 +508,8 @@ class LLMClient:
     def _build_meeting_time_prompt(self, 
                                    participants: List[str], 
                                    duration: int, 
-                                   constraints: Optional[Dict[str, Any]] = None) -> str:
+                                   constraints: Optional[Dict[str, Any]] = None,
+                                   busy_intervals: Optional[Dict[str, List[Dict[str, str]]]] = None) -> str:
         """
         Construye un prompt para sugerir tiempo de reunión.
 
@@ -219,11 +517,13 @@ class LLMClient:
             participants: Lista de correos electrónicos
             duration: Duración de la reunión en minutos
             constraints: Restricciones adicionales
+            busy_intervals: Intervalos ocupados por participante
 
         Returns:
             Prompt para sugerencia de tiempo de reunión
         """
         constraints_str = json.dumps(constraints) if constraints else "Ninguna restricción específica"
+        busy_str = self._format_busy_intervals(busy_intervals) if busy_intervals else ''
 
         return f"""
         Sugiere un tiempo óptimo para una reunión con las siguientes características:
@@ -231,6 +531,7 @@ class LLMClient:
         Participantes: {', '.join(participants)}
         Duración: {duration} minutos
         Restricciones: {constraints_str}
+        {busy_str}
 
         La sugerencia debe ser un objeto JSON que incluya:
         1. Fecha y hora recomendadas
@@ -240,3 +541,25 @@ class LLMClient:
 
         Formato de respuesta: JSON con campos descriptivos y concisos.
         """
+
+    def _format_busy_intervals(self, busy_intervals: Dict[str, List[Dict[str, str]]]) -> str:
+        """
+        Formatea los intervalos ocupados de forma compacta para el prompt.
+
+        Args:
+            busy_intervals: Intervalos ocupados por participante
+
+        Returns:
+            Bloque de texto con la cabecera y los intervalos de cada participante
+        """
+        pseudo_events = {
+            email: [{'start': {'dateTime': i['start']}, 'end': {'dateTime': i['end']}}
+                    for i in intervals]
+            for email, intervals in busy_intervals.items()
+        }
+        encoder = CompactEventEncoder([e for events in pseudo_events.values() for e in events])
+        lines = [
+            f"{email}: {', '.join(encoder.format_times(e) for e in events) or 'libre'}"
+            for email, events in pseudo_events.items()
+        ]
+        return "\n".join([f"Ocupado ({encoder.header()}):"] + lines)
@@ -0,0 +1,135 @@
+"""
+Extracción tolerante e incremental de JSON desde respuestas de modelos de lenguaje.
+"""
+
+import json
+import logging
+from typing import Any, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class IncrementalJSONExtractor:
+    """
+    Extrae valores JSON (objetos o arreglos) de texto recibido por fragmentos.
+
+    Ignora la prosa y los bloques de código Markdown que rodean al JSON: sigue
+    la profundidad de llaves y corchetes fuera de cadenas y, cuando un valor de
+    nivel superior se cierra, lo decodifica y lo entrega. Si el candidato no es
+    JSON válido (p. ej. llaves dentro de prosa), retoma la búsqueda desde el
+    carácter siguiente a su apertura.
+    """
+
+    _OPENERS = {'{': '}', '[': ']'}
+
+    def __init__(self):
+        """
+        Inicializa el extractor con un búfer vacío.
+        """
+        self._buffer = ''
+        self._reset_scan(0)
+
+    def _reset_scan(self, position: int) -> None:
+        self._position = position
+        self._start: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Agrega un fragmento de texto y devuelve los valores JSON completados.
+
+        Args:
+            chunk: Fragmento de texto de la respuesta
+
+        Returns:
+            Lista de valores JSON de nivel superior completados con este fragmento
+        """
+        self._buffer += chunk
+        values = []
+
+        while self._position < len(self._buffer):
+            char = self._buffer[self._position]
+
+            if self._start is None:
+                if char in self._OPENERS:
+                    self._start = self._position
+                    self._stack.append(self._OPENERS[char])
+                self._position += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in self._OPENERS:
+                self._stack.append(self._OPENERS[char])
+            elif char in '}]':
+                if char != self._stack[-1]:
+                    self._reset_scan(self._start + 1)
+                    continue
+                self._stack.pop()
+                if not self._stack:
+                    candidate = self._buffer[self._start:self._position + 1]
+                    try:
+                        values.append(json.loads(candidate))
+                    except json.JSONDecodeError:
+                        self._reset_scan(self._start + 1)
+                        continue
+                    # Descartar el texto ya consumido para acotar el búfer
+                    self._buffer = self._buffer[self._position + 1:]
+                    self._reset_scan(0)
+                    continue
+
+            self._position += 1
+
+        if self._start is None:
+            self._buffer = ''
+            self._position = 0
+
+        return values
+
+    def feed_all(self, chunks: Iterable[str]) -> List[Any]:
+        """
+        Procesa una secuencia de fragmentos.
+
+        Args:
+            chunks: Fragmentos de texto en orden de llegada
+
+        Returns:
+            Todos los valores JSON extraídos
+        """
+        values = []
+        for chunk in chunks:
+            values.extend(self.feed(chunk))
+        return values
+
+def extract_json(text: str, expected_type: Optional[type] = None) -> Optional[Any]:
+    """
+    Extrae el primer valor JSON de un texto, tolerando prosa y bloques de código.
+
+    Args:
+        text: Texto de la respuesta del modelo
+        expected_type: Tipo requerido del valor (p. ej. dict); se ignoran los demás
+
+    Returns:
+        Valor JSON decodificado o None si no se encuentra
+    """
+    try:
+        value = json.loads(text)
+        if expected_type is None or isinstance(value, expected_type):
+            return value
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    for value in IncrementalJSONExtractor().feed(text or ''):
+        if expected_type is None or isinstance(value, expected_type):
+            return value
+
+    logger.debug("No se encontró JSON válido en la respuesta")
+    return None
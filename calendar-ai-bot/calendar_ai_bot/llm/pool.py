@@ -0,0 +1,157 @@
+"""
+Registro de clientes LLM compartidos con pool de conexiones HTTP persistentes.
+"""
+
+import importlib.util
+import logging
+import sys
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from ..utils.lazy import lazy_import
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONFIG = {
+    'max_connections': 100,
+    'max_keepalive_connections': 20,
+    'keepalive_expiry': 30.0,
+    'timeout': 60.0,
+    'http2': True
+}
+
+# Los SDK se importan al crear el primer cliente del proveedor
+SDK_MODULES = {
+    'groq': lazy_import('groq'),
+    'openai': lazy_import('openai')
+}
+
+class ClientRegistry:
+    """
+    Registro de clientes de proveedores LLM compartidos en todo el proceso.
+
+    Los clientes del SDK se reutilizan por (proveedor, api_key, base_url) y
+    todos los clientes de un mismo proveedor comparten un único cliente HTTP
+    con conexiones keep-alive, evitando repetir handshakes TLS.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el registro vacío.
+        """
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+        self._http_clients: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Any] = {}
+
+    @staticmethod
+    def _httpx_module(sdk: Any) -> Any:
+        """
+        Obtiene el módulo httpx sobre el que está construido el SDK.
+
+        Args:
+            sdk: Módulo del SDK del proveedor
+
+        Returns:
+            Módulo httpx (o compatible) usado por el SDK
+        """
+        base = next(
+            cls for cls in sdk.DefaultHttpxClient.__mro__ if cls.__name__ == 'Client'
+        )
+        return sys.modules[base.__module__.split('.')[0]]
+
+    def _create_http_client(self, sdk: Any, pool_config: Dict[str, Any]) -> Any:
+        """
+        Crea un cliente HTTP con límites de conexión ajustados.
+
+        Args:
+            sdk: Módulo del SDK del proveedor
+            pool_config: Configuración del pool de conexiones
+
+        Returns:
+            Cliente HTTP compatible con el SDK
+        """
+        httpx_module = self._httpx_module(sdk)
+        limits = httpx_module.Limits(
+            max_connections=pool_config['max_connections'],
+            max_keepalive_connections=pool_config['max_keepalive_connections'],
+            keepalive_expiry=pool_config['keepalive_expiry']
+        )
+        http2 = bool(pool_config['http2']) and importlib.util.find_spec('h2') is not None
+        if pool_config['http2'] and not http2:
+            logger.debug("Paquete h2 no instalado, usando HTTP/1.1 para el pool LLM")
+
+        return sdk.DefaultHttpxClient(
+            limits=limits,
+            timeout=pool_config['timeout'],
+            http2=http2
+        )
+
+    def get_client(self,
+                   provider: str,
+                   api_key: Optional[str] = None,
+                   base_url: Optional[str] = None,
+                   pool_config: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Obtiene (o crea) el cliente compartido de un proveedor.
+
+        Args:
+            provider: Proveedor LLM ('groq' u 'openai')
+            api_key: Clave de API del proveedor
+            base_url: URL base alternativa de la API
+            pool_config: Límites del pool de conexiones (ver DEFAULT_POOL_CONFIG)
+
+        Returns:
+            Cliente del SDK del proveedor
+
+        Raises:
+            ValueError: Si el proveedor no está soportado
+        """
+        sdk = SDK_MODULES.get(provider)
+        if sdk is None:
+            raise ValueError(f"Proveedor LLM no soportado: {provider}")
+
+        settings = {**DEFAULT_POOL_CONFIG, **(pool_config or {})}
+        client_key = (provider, api_key, base_url)
+        pool_key = (provider, tuple(sorted(settings.items())))
+
+        with self._lock:
+            client = self._clients.get(client_key)
+            if client is not None:
+                return client
+
+            http_client = self._http_clients.get(pool_key)
+            if http_client is None:
+                http_client = self._create_http_client(sdk, settings)
+                self._http_clients[pool_key] = http_client
+
+            kwargs = {'api_key': api_key, 'http_client': http_client}
+            if base_url:
+                kwargs['base_url'] = base_url
+            client = sdk.Groq(**kwargs) if provider == 'groq' else sdk.OpenAI(**kwargs)
+            self._clients[client_key] = client
+            logger.debug(f"Cliente LLM compartido creado para {provider}")
+            return client
+
+    def close(self) -> None:
+        """
+        Cierra los clientes HTTP compartidos y vacía el registro.
+        """
+        with self._lock:
+            for http_client in self._http_clients.values():
+                try:
+                    http_client.close()
+                except Exception as e:
+                    logger.error(f"Error al cerrar cliente HTTP: {e}")
+            self._http_clients.clear()
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        """
+        Obtiene el número de clientes registrados.
+
+        Returns:
+            Número de clientes del SDK en el registro
+        """
+        return len(self._clients)
+
+default_registry = ClientRegistry()
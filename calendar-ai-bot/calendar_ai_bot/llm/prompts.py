@@ -0,0 +1,203 @@
+"""
+Codificación compacta de eventos para prompts de modelos de lenguaje.
+"""
+
+import logging
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Any, Optional, List
+
+from ..utils.timeparse import parse_event_time
+
+logger = logging.getLogger(__name__)
+
+WEEKDAYS = ['lun', 'mar', 'mié', 'jue', 'vie', 'sáb', 'dom']
+
+def compact_text(template: str) -> str:
+    """
+    Elimina la indentación y las líneas vacías de una plantilla de prompt.
+
+    Args:
+        template: Texto de la plantilla
+
+    Returns:
+        Plantilla sin espacios superfluos
+    """
+    lines = (line.strip() for line in template.strip().splitlines())
+    return "\n".join(line for line in lines if line)
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """
+    Convierte una marca de tiempo RFC3339 de la API en datetime.
+
+    Args:
+        value: Cadena de tiempo (dateTime o date)
+
+    Returns:
+        Datetime o None si no puede interpretarse
+    """
+    return parse_event_time(value)
+
+def _format_offset(dt: datetime) -> str:
+    """
+    Formatea el desplazamiento UTC de un datetime como ±HH:MM.
+
+    Args:
+        dt: Datetime con zona horaria
+
+    Returns:
+        Desplazamiento formateado o cadena vacía si no tiene zona
+    """
+    offset = dt.utcoffset()
+    if offset is None:
+        return ''
+    minutes = int(offset.total_seconds() // 60)
+    sign = '+' if minutes >= 0 else '-'
+    return f"{sign}{abs(minutes) // 60:02d}:{abs(minutes) % 60:02d}"
+
+class CompactEventEncoder:
+    """
+    Codifica eventos en líneas compactas con una cabecera compartida.
+
+    La cabecera declara una sola vez la zona horaria dominante, la fecha base
+    y los alias de dominios de correo repetidos; cada evento se expresa con
+    días relativos a la fecha base (`D+1 09:00-10:00`) y correos abreviados
+    (`ana@a`).
+    """
+
+    def __init__(self, events: List[Dict[str, Any]], max_description_chars: int = 300,
+                 abbreviate_domains: bool = True):
+        """
+        Inicializa el codificador analizando el conjunto de eventos.
+
+        Args:
+            events: Eventos que compartirán la cabecera
+            max_description_chars: Longitud máxima de la descripción por evento
+            abbreviate_domains: Declarar alias para dominios de correo repetidos
+        """
+        self.max_description_chars = max_description_chars
+
+        starts = [_parse_time(self._time_value(e.get('start', {}))) for e in events]
+        starts = [dt for dt in starts if dt is not None]
+        offsets = Counter(_format_offset(dt) for dt in starts if dt.tzinfo is not None)
+
+        self.offset = offsets.most_common(1)[0][0] if offsets else ''
+        self.base_date: Optional[date] = min((dt.date() for dt in starts), default=None)
+
+        domains = Counter(
+            email.rsplit('@', 1)[1].lower()
+            for event in (events if abbreviate_domains else [])
+            for email in self._emails(event)
+            if '@' in email
+        )
+        repeated = [domain for domain, count in domains.most_common() if count > 1]
+        self.domain_aliases: Dict[str, str] = {
+            domain: self._alias(index) for index, domain in enumerate(repeated)
+        }
+
+    @staticmethod
+    def _alias(index: int) -> str:
+        letters = 'abcdefghijklmnopqrstuvwxyz'
+        alias = ''
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, len(letters))
+            alias = letters[remainder] + alias
+        return alias
+
+    @staticmethod
+    def _time_value(time_info: Dict[str, Any]) -> Optional[str]:
+        return time_info.get('dateTime') or time_info.get('date')
+
+    @staticmethod
+    def _emails(event: Dict[str, Any]) -> List[str]:
+        return [p.get('email', '') for p in event.get('attendees', []) if p.get('email')]
+
+    def header(self) -> str:
+        """
+        Construye la cabecera compartida por todas las líneas de eventos.
+
+        Returns:
+            Cabecera compacta o cadena vacía si no hay nada que declarar
+        """
+        parts = []
+        if self.base_date is not None:
+            parts.append(f"D={self.base_date.isoformat()}({WEEKDAYS[self.base_date.weekday()]})")
+        if self.offset:
+            parts.append(f"TZ={self.offset}")
+        if self.domain_aliases:
+            parts.append(" ".join(f"@{alias}={domain}" for domain, alias in self.domain_aliases.items()))
+        return " ".join(parts)
+
+    def _format_moment(self, dt: datetime, all_day: bool) -> str:
+        day = f"D+{(dt.date() - self.base_date).days}" if self.base_date else dt.date().isoformat()
+        if all_day:
+            return day
+        moment = f"{day} {dt.strftime('%H:%M')}"
+        offset = _format_offset(dt)
+        if offset and offset != self.offset:
+            moment += f"({offset})"
+        return moment
+
+    def format_times(self, event: Dict[str, Any]) -> str:
+        """
+        Formatea el intervalo de un evento relativo a la fecha base.
+
+        Args:
+            event: Diccionario de evento de Google Calendar
+
+        Returns:
+            Intervalo compacto, p. ej. `D+0 10:00-11:00`
+        """
+        start_info, end_info = event.get('start', {}), event.get('end', {})
+        all_day = not start_info.get('dateTime') and bool(start_info.get('date'))
+        start = _parse_time(self._time_value(start_info))
+        end = _parse_time(self._time_value(end_info))
+
+        if start is None:
+            return '?'
+
+        start_text = self._format_moment(start, all_day)
+        if all_day:
+            return f"{start_text} todo el día"
+        if end is None:
+            return start_text
+        if end.date() == start.date() and _format_offset(end) == _format_offset(start):
+            return f"{start_text}-{end.strftime('%H:%M')}"
+        return f"{start_text}-{self._format_moment(end, all_day)}"
+
+    def format_email(self, email: str) -> str:
+        """
+        Abrevia el dominio de un correo si tiene alias en la cabecera.
+
+        Args:
+            email: Correo electrónico
+
+        Returns:
+            Correo abreviado
+        """
+        local, _, domain = email.rpartition('@')
+        alias = self.domain_aliases.get(domain.lower())
+        return f"{local}@{alias}" if local and alias else email
+
+    def encode(self, event: Dict[str, Any], key: Optional[str] = None,
+               include_details: bool = True) -> str:
+        """
+        Codifica un evento en una sola línea.
+
+        Args:
+            event: Diccionario de evento de Google Calendar
+            key: Identificador opcional que antecede a la línea
+            include_details: Incluir participantes y descripción
+
+        Returns:
+            Línea compacta del evento
+        """
+        fields = [event.get('summary', 'Sin título'), self.format_times(event)]
+        if include_details:
+            fields.append(",".join(self.format_email(e) for e in self._emails(event)))
+            description = " ".join(event.get('description', '').split())
+            fields.append(description[:self.max_description_chars])
+
+        line = "|".join(fields).rstrip('|')
+        return f"[{key}]{line}" if key is not None else line
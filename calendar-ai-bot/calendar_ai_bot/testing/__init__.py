@@ -0,0 +1,11 @@
+"""
+Servidores locales que imitan APIs externas para pruebas y benchmarks.
+"""
+
+from .fake_calendar import FakeCalendarServer
+from .fake_llm import FakeLLMServer
+
+__all__ = [
+    'FakeCalendarServer',
+    'FakeLLMServer'
+]
@@ -0,0 +1,528 @@
+"""
+Servidor HTTP local que imita Google Calendar API v3 para pruebas y benchmarks.
+"""
+
+import email.parser
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = '/calendar/v3'
+BATCH_PATH = '/batch/calendar/v3'
+
+Latency = Union[float, Callable[[], float]]
+Response = Tuple[int, Optional[Dict[str, Any]], Dict[str, str]]
+
+_EVENTS_ROUTE = re.compile(r'^/calendars/([^/]+)/events(?:/([^/]+))?$')
+_EVENT_METHODS = {'GET': 'get', 'PUT': 'update', 'PATCH': 'patch', 'DELETE': 'delete'}
+
+def _now_rfc3339() -> str:
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')[:-4] + 'Z'
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+def _event_bounds(event: Dict[str, Any]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    start, end = event.get('start', {}), event.get('end', {})
+    return (_parse_time(start.get('dateTime') or start.get('date')),
+            _parse_time(end.get('dateTime') or end.get('date')))
+
+def _merge_patch(target: Dict[str, Any], changes: Dict[str, Any]) -> None:
+    for key, value in changes.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge_patch(target[key], value)
+        else:
+            target[key] = value
+
+def _error(status: int, message: str, reason: Optional[str] = None) -> Response:
+    body = {'error': {'code': status, 'message': message,
+                      'errors': [{'domain': 'global', 'reason': reason or message, 'message': message}]}}
+    return status, body, {}
+
+class FakeCalendarServer:
+    """
+    Implementación en memoria de los endpoints de Calendar API usados por el bot.
+
+    Soporta calendarList, events list/get/insert/update/patch/delete con
+    paginación, syncToken y showDeleted, freeBusy, solicitudes por lotes
+    (multipart/mixed), ETags con If-None-Match/If-Match, latencia
+    configurable e inyección de errores. El parámetro `fields` se ignora:
+    siempre se devuelve el recurso completo.
+    """
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 latency: Latency = 0.0,
+                 error_rate: float = 0.0,
+                 error_status: int = 503,
+                 seed: int = 0):
+        """
+        Inicializa el servidor (sin iniciarlo).
+
+        Args:
+            host: Dirección en la que escuchar
+            port: Puerto (0 para uno libre)
+            latency: Segundos de latencia por solicitud, o función que los devuelve
+                (p. ej. `lambda: rng.expovariate(50)`)
+            error_rate: Probabilidad de responder con `error_status`
+            error_status: Código de los errores aleatorios (429, 403 o 5xx)
+            seed: Semilla de la inyección de errores aleatorios
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._version = 0
+        self._calendar_list_version = 0
+        self._calendars: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._forced_errors: List[int] = []
+        self._valid_sync_from = 0
+        self.request_counts: Dict[str, int] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.add_calendar('primary', summary='Principal')
+
+    # Control del servidor
+
+    @property
+    def url(self) -> str:
+        """
+        URL raíz del servidor (equivalente a https://www.googleapis.com/).
+        """
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> 'FakeCalendarServer':
+        """
+        Inicia el servidor en un hilo en segundo plano.
+
+        Returns:
+            El propio servidor
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Detiene el servidor.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeCalendarServer':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def create_interface(self, directory: str, **kwargs: Any) -> Any:
+        """
+        Crea una CalendarInterface que apunta a este servidor.
+
+        Args:
+            directory: Directorio para el token ficticio y los tokens de sincronización
+            **kwargs: Argumentos adicionales para CalendarInterface
+
+        Returns:
+            Instancia de CalendarInterface
+        """
+        from ..calendar.interface import CalendarInterface
+        from ..calendar.service import ServiceRegistry
+
+        token_path = os.path.join(directory, 'fake_token.json')
+        with open(token_path, 'w', encoding='utf-8') as f:
+            json.dump({'token': 'fake-token', 'refresh_token': 'fake-refresh',
+                       'client_id': 'fake-client', 'client_secret': 'fake-secret',
+                       'expiry': '2099-01-01T00:00:00Z'}, f)
+        kwargs.setdefault('sync_token_file', os.path.join(directory, 'fake_sync_tokens.json'))
+        kwargs.setdefault('services', ServiceRegistry(root_url=self.url))
+        return CalendarInterface(os.path.join(directory, 'fake_credentials.json'), token_path, **kwargs)
+
+    # Datos y fallos
+
+    def add_calendar(self, calendar_id: str, summary: Optional[str] = None) -> None:
+        """
+        Agrega un calendario vacío.
+
+        Args:
+            calendar_id: ID del calendario
+            summary: Nombre del calendario
+        """
+        with self._lock:
+            self._version += 1
+            self._calendar_list_version = self._version
+            self._calendars[calendar_id] = {
+                'kind': 'calendar#calendarListEntry',
+                'etag': f'"{self._version}"',
+                'id': calendar_id,
+                'summary': summary or calendar_id,
+                'accessRole': 'owner'
+            }
+            self._events.setdefault(calendar_id, {})
+
+    def add_events(self, calendar_id: str, events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Carga eventos directamente en el almacenamiento (sin pasar por HTTP).
+
+        Args:
+            calendar_id: ID del calendario (se crea si no existe)
+            events: Eventos a cargar
+
+        Returns:
+            Eventos almacenados con sus campos administrados
+        """
+        with self._lock:
+            if calendar_id not in self._calendars:
+                self.add_calendar(calendar_id)
+            return [self._store(calendar_id, dict(event), created=True) for event in events]
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """
+        Hace que las próximas solicitudes respondan con un error.
+
+        Args:
+            status: Código HTTP del error
+            count: Número de solicitudes que fallarán
+        """
+        with self._lock:
+            self._forced_errors.extend([status] * count)
+
+    def expire_sync_tokens(self) -> None:
+        """
+        Invalida todos los syncToken emitidos (la API responderá 410 Gone).
+        """
+        with self._lock:
+            self._valid_sync_from = self._version + 1
+
+    def events(self, calendar_id: str = 'primary') -> List[Dict[str, Any]]:
+        """
+        Obtiene los eventos almacenados (incluidos los cancelados).
+
+        Args:
+            calendar_id: ID del calendario
+
+        Returns:
+            Copia de los eventos
+        """
+        with self._lock:
+            return [json.loads(json.dumps(e)) for e in self._events.get(calendar_id, {}).values()]
+
+    def _store(self, calendar_id: str, event: Dict[str, Any], created: bool = False) -> Dict[str, Any]:
+        self._version += 1
+        now = _now_rfc3339()
+        event.setdefault('id', uuid.uuid4().hex)
+        event.setdefault('status', 'confirmed')
+        if created:
+            event['created'] = now
+        event.update({
+            'kind': 'calendar#event',
+            'etag': f'"{self._version}"',
+            'updated': now,
+            '_version': self._version
+        })
+        self._events[calendar_id][event['id']] = event
+        return self._public(event)
+
+    @staticmethod
+    def _public(event: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in event.items() if k != '_version'}
+
+    # Despacho de solicitudes
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Cabeceras y cuerpo se escriben por separado: sin Nagle no hay
+            # esperas de ACK retrasado en conexiones keep-alive
+            disable_nagle_algorithm = True
+
+            def _handle(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                status, headers, payload = server.handle(
+                    self.command, self.path, {k.lower(): v for k, v in self.headers.items()}, body
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                if payload:
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("Fake Calendar: " + format % args)
+
+        return Handler
+
+    def _delay(self) -> None:
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def _injected_error(self) -> Optional[int]:
+        with self._lock:
+            if self._forced_errors:
+                return self._forced_errors.pop(0)
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def handle(self, method: str, raw_path: str, headers: Dict[str, str],
+               body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Procesa una solicitud HTTP completa.
+
+        Args:
+            method: Método HTTP
+            raw_path: Ruta con la cadena de consulta
+            headers: Cabeceras en minúsculas
+            body: Cuerpo de la solicitud
+
+        Returns:
+            Tupla (estado, cabeceras, cuerpo) de la respuesta
+        """
+        self._delay()
+        if urlsplit(raw_path).path == BATCH_PATH and method == 'POST':
+            self._count('batch')
+            return self._handle_batch(headers, body)
+
+        status, payload, extra = self.dispatch(method, raw_path, headers, body)
+        data = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        response_headers = {'Content-Type': 'application/json; charset=UTF-8', **extra}
+        return status, response_headers, data
+
+    def _count(self, route: str) -> None:
+        with self._lock:
+            self.request_counts[route] = self.request_counts.get(route, 0) + 1
+
+    def dispatch(self, method: str, raw_path: str, headers: Dict[str, str], body: bytes) -> Response:
+        """
+        Resuelve una solicitud individual de la API (también dentro de lotes).
+
+        Args:
+            method: Método HTTP
+            raw_path: Ruta con la cadena de consulta
+            headers: Cabeceras en minúsculas
+            body: Cuerpo de la solicitud
+
+        Returns:
+            Tupla (estado, cuerpo JSON, cabeceras adicionales)
+        """
+        parts = urlsplit(raw_path)
+        path = parts.path
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+        injected = self._injected_error()
+        if injected is not None:
+            reason = 'rateLimitExceeded' if injected in (403, 429) else 'backendError'
+            return _error(injected, reason, reason)
+
+        if not path.startswith(API_PREFIX):
+            return _error(404, 'notFound')
+        path = path[len(API_PREFIX):]
+
+        try:
+            data = json.loads(body) if body else None
+        except json.JSONDecodeError:
+            return _error(400, 'parseError')
+
+        with self._lock:
+            if path == '/users/me/calendarList' and method == 'GET':
+                self._count('calendarList.list')
+                return self._calendar_list(headers)
+            if path == '/freeBusy' and method == 'POST':
+                self._count('freebusy.query')
+                return self._freebusy(data or {})
+
+            match = _EVENTS_ROUTE.match(path)
+            if not match:
+                return _error(404, 'notFound')
+            calendar_id = unquote(match.group(1))
+            event_id = unquote(match.group(2)) if match.group(2) else None
+            if calendar_id not in self._calendars:
+                return _error(404, 'notFound')
+
+            if event_id is None:
+                if method == 'GET':
+                    self._count('events.list')
+                    return self._list_events(calendar_id, query)
+                if method == 'POST':
+                    self._count('events.insert')
+                    return 200, self._store(calendar_id, dict(data or {}), created=True), {}
+                return _error(405, 'methodNotAllowed')
+
+            self._count(f"events.{_EVENT_METHODS.get(method, method)}")
+            return self._event_resource(method, calendar_id, event_id, headers, data)
+
+    def _calendar_list(self, headers: Dict[str, str]) -> Response:
+        etag = f'"cl{self._calendar_list_version}"'
+        if headers.get('if-none-match') == etag:
+            return 304, None, {}
+        return 200, {'kind': 'calendar#calendarList', 'etag': etag,
+                     'items': list(self._calendars.values())}, {}
+
+    def _list_events(self, calendar_id: str, query: Dict[str, str]) -> Response:
+        events = list(self._events[calendar_id].values())
+        sync_token = query.get('syncToken')
+
+        if sync_token:
+            since = int(sync_token.lstrip('s')) if sync_token.lstrip('s').isdigit() else -1
+            if since < self._valid_sync_from:
+                return _error(410, 'fullSyncRequired', 'fullSyncRequired')
+            events = [e for e in events if e['_version'] > since]
+        else:
+            if query.get('showDeleted') != 'true':
+                events = [e for e in events if e.get('status') != 'cancelled']
+            time_min, time_max = _parse_time(query.get('timeMin')), _parse_time(query.get('timeMax'))
+            if time_min or time_max:
+                selected = []
+                for event in events:
+                    start, end = _event_bounds(event)
+                    if start is None:
+                        continue
+                    if time_min and (end or start) <= time_min:
+                        continue
+                    if time_max and start >= time_max:
+                        continue
+                    selected.append(event)
+                events = selected
+
+        if query.get('orderBy') == 'startTime':
+            events.sort(key=lambda e: _event_bounds(e)[0] or datetime.max.replace(tzinfo=timezone.utc))
+        else:
+            events.sort(key=lambda e: e['_version'])
+
+        page_size = min(int(query.get('maxResults', 250)), 2500)
+        offset = int(query.get('pageToken') or 0)
+        page = events[offset:offset + page_size]
+
+        response: Dict[str, Any] = {
+            'kind': 'calendar#events',
+            'summary': self._calendars[calendar_id]['summary'],
+            'items': [self._public(e) for e in page]
+        }
+        if offset + page_size < len(events):
+            response['nextPageToken'] = str(offset + page_size)
+        else:
+            response['nextSyncToken'] = f"s{self._version}"
+        return 200, response, {}
+
+    def _event_resource(self, method: str, calendar_id: str, event_id: str,
+                        headers: Dict[str, str], data: Optional[Dict[str, Any]]) -> Response:
+        event = self._events[calendar_id].get(event_id)
+        if event is None or (event.get('status') == 'cancelled' and method != 'GET'):
+            return _error(404, 'notFound')
+
+        if method == 'GET':
+            if headers.get('if-none-match') == event['etag']:
+                return 304, None, {}
+            return 200, self._public(event), {}
+
+        if_match = headers.get('if-match')
+        if if_match and if_match != event['etag']:
+            return _error(412, 'conditionNotMet')
+
+        if method == 'DELETE':
+            event['status'] = 'cancelled'
+            self._store(calendar_id, event)
+            return 204, None, {}
+        if method == 'PUT':
+            replacement = dict(data or {}, id=event_id, created=event['created'])
+            return 200, self._store(calendar_id, replacement), {}
+        if method == 'PATCH':
+            _merge_patch(event, data or {})
+            return 200, self._store(calendar_id, event), {}
+        return _error(405, 'methodNotAllowed')
+
+    def _freebusy(self, body: Dict[str, Any]) -> Response:
+        time_min, time_max = _parse_time(body.get('timeMin')), _parse_time(body.get('timeMax'))
+        calendars = {}
+        for item in body.get('items', []):
+            calendar_id = item.get('id')
+            if calendar_id not in self._calendars:
+                calendars[calendar_id] = {'errors': [{'domain': 'global', 'reason': 'notFound'}], 'busy': []}
+                continue
+            busy = []
+            for event in self._events[calendar_id].values():
+                if event.get('status') == 'cancelled' or event.get('transparency') == 'transparent':
+                    continue
+                start, end = _event_bounds(event)
+                if start is None or end is None or end <= time_min or start >= time_max:
+                    continue
+                busy.append((max(start, time_min), min(end, time_max)))
+            busy.sort()
+            calendars[calendar_id] = {'busy': [
+                {'start': s.strftime('%Y-%m-%dT%H:%M:%SZ'), 'end': e.strftime('%Y-%m-%dT%H:%M:%SZ')}
+                for s, e in ((s.astimezone(timezone.utc), e.astimezone(timezone.utc)) for s, e in busy)
+            ]}
+        return 200, {'kind': 'calendar#freeBusy', 'timeMin': body.get('timeMin'),
+                     'timeMax': body.get('timeMax'), 'calendars': calendars}, {}
+
+    def _handle_batch(self, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Procesa un lote multipart/mixed y devuelve las respuestas en el mismo formato.
+        """
+        message = email.parser.BytesParser().parsebytes(
+            f"Content-Type: {headers.get('content-type', '')}\r\n\r\n".encode('utf-8') + body
+        )
+        if not message.is_multipart():
+            status, payload, _ = _error(400, 'badRequest')
+            return status, {'Content-Type': 'application/json'}, json.dumps(payload).encode('utf-8')
+
+        boundary = f"batch_{uuid.uuid4().hex}"
+        chunks = []
+        for part in message.get_payload():
+            request_text = part.get_payload()
+            request_line, rest = request_text.split('\n', 1)
+            method, path, _ = request_line.strip().split(' ', 2)
+            inner = email.parser.Parser().parsestr(rest)
+            inner_headers = {k.lower(): v for k, v in inner.items()}
+            inner_body = inner.get_payload().encode('utf-8') if inner.get_payload() else b''
+
+            status, payload, _ = self.dispatch(method, path, inner_headers, inner_body)
+            content_id = (part['Content-ID'] or '<+0>').strip('<>')
+            response_body = json.dumps(payload) if payload is not None else ''
+            chunks.append(
+                f"--{boundary}\r\n"
+                f"Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status < 300 else 'Error'}\r\n"
+                f"Content-Type: application/json; charset=UTF-8\r\n\r\n"
+                f"{response_body}\r\n"
+            )
+        chunks.append(f"--{boundary}--\r\n")
+        return 200, {'Content-Type': f'multipart/mixed; boundary={boundary}'}, ''.join(chunks).encode('utf-8')
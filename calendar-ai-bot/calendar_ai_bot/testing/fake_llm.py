@@ -0,0 +1,289 @@
+"""
+Servidor HTTP local compatible con la API de chat de OpenAI (y Groq) para pruebas y benchmarks.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Any, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Latency = Union[float, Callable[[], float]]
+Responder = Callable[[List[Dict[str, Any]], Dict[str, Any]], str]
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+def default_responder(messages: List[Dict[str, Any]], params: Dict[str, Any]) -> str:
+    """
+    Genera una respuesta determinista a partir del prompt.
+
+    Args:
+        messages: Mensajes de la solicitud
+        params: Parámetros de la solicitud
+
+    Returns:
+        Texto de la respuesta (un objeto JSON en modo JSON)
+    """
+    prompt = '\n'.join(str(m.get('content', '')) for m in messages)
+    digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]
+    if (params.get('response_format') or {}).get('type') == 'json_object':
+        return json.dumps({'respuesta': f'simulada-{digest}', 'prompt_tokens': _estimate_tokens(prompt)})
+    return f"Respuesta simulada {digest}: el evento se resume en una línea."
+
+class FakeLLMServer:
+    """
+    Proveedor LLM local que implementa POST .../chat/completions.
+
+    Acepta tanto la ruta de OpenAI (`/v1/chat/completions`) como la de Groq
+    (`/openai/v1/chat/completions`), con respuestas completas o en streaming
+    (SSE). La latencia hasta el primer token y el throughput de tokens son
+    configurables, se pueden inyectar errores 429/503 y las respuestas son
+    deterministas para un mismo prompt.
+    """
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 latency: Latency = 0.0,
+                 tokens_per_second: Optional[float] = None,
+                 error_rate: float = 0.0,
+                 error_status: int = 429,
+                 retry_after: float = 0.0,
+                 responder: Optional[Responder] = None,
+                 seed: int = 0):
+        """
+        Inicializa el servidor (sin iniciarlo).
+
+        Args:
+            host: Dirección en la que escuchar
+            port: Puerto (0 para uno libre)
+            latency: Segundos hasta el primer token, o función que los devuelve
+                (p. ej. `lambda: rng.lognormvariate(-1.5, 0.4)`)
+            tokens_per_second: Velocidad de generación (None para instantánea)
+            error_rate: Probabilidad de responder con `error_status`
+            error_status: Código de los errores aleatorios (429 o 503)
+            retry_after: Valor de la cabecera Retry-After de los errores
+            responder: Función (mensajes, parámetros) -> texto de la respuesta
+            seed: Semilla de la inyección de errores aleatorios
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.responder = responder or default_responder
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._forced_errors: List[int] = []
+        self.requests: List[Dict[str, Any]] = []
+        self.status_counts: Dict[int, int] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        URL base para el SDK de OpenAI (`llm_config.base_url` con provider 'openai').
+        """
+        return f"http://{self.host}:{self.port}/v1"
+
+    @property
+    def groq_base_url(self) -> str:
+        """
+        URL base para el SDK de Groq (`llm_config.base_url` con provider 'groq').
+        """
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> 'FakeLLMServer':
+        """
+        Inicia el servidor en un hilo en segundo plano.
+
+        Returns:
+            El propio servidor
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Detiene el servidor.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'FakeLLMServer':
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """
+        Hace que las próximas solicitudes respondan con un error.
+
+        Args:
+            status: Código HTTP del error (p. ej. 429 o 503)
+            count: Número de solicitudes que fallarán
+        """
+        with self._lock:
+            self._forced_errors.extend([status] * count)
+
+    def _record(self, params: Dict[str, Any], status: int) -> None:
+        with self._lock:
+            self.requests.append(params)
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def _injected_error(self) -> Optional[int]:
+        with self._lock:
+            if self._forced_errors:
+                return self._forced_errors.pop(0)
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return self.error_status
+        return None
+
+    def _first_token_delay(self) -> float:
+        delay = self.latency() if callable(self.latency) else self.latency
+        return max(0.0, delay)
+
+    @staticmethod
+    def _split_tokens(text: str) -> List[str]:
+        # Fragmentos de ~4 caracteres, la misma estimación que usa LLMClient
+        return [text[i:i + 4] for i in range(0, len(text), 4)] or ['']
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def _send_json(self, status: int, payload: Dict[str, Any],
+                           headers: Optional[Dict[str, str]] = None) -> None:
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _write_chunk(self, data: bytes) -> None:
+                self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    params = json.loads(self.rfile.read(length) or b'{}')
+                except json.JSONDecodeError:
+                    self._send_json(400, {'error': {'message': 'JSON inválido', 'type': 'invalid_request_error'}})
+                    return
+
+                if not self.path.rstrip('/').endswith('/chat/completions'):
+                    self._send_json(404, {'error': {'message': f'Ruta desconocida: {self.path}'}})
+                    return
+
+                time.sleep(server._first_token_delay())
+                error = server._injected_error()
+                if error is not None:
+                    server._record(params, error)
+                    kind = 'rate_limit_exceeded' if error == 429 else 'service_unavailable'
+                    self._send_json(error, {'error': {'message': kind, 'type': kind, 'code': kind}},
+                                    {'Retry-After': str(server.retry_after)})
+                    return
+
+                server._record(params, 200)
+                messages = params.get('messages', [])
+                text = server.responder(messages, params)
+                if params.get('stream'):
+                    self._stream(params, text)
+                else:
+                    self._complete(params, messages, text)
+
+            def _complete(self, params: Dict[str, Any], messages: List[Dict[str, Any]], text: str) -> None:
+                completion_tokens = _estimate_tokens(text)
+                if server.tokens_per_second:
+                    time.sleep(completion_tokens / server.tokens_per_second)
+                prompt_tokens = sum(_estimate_tokens(str(m.get('content', ''))) for m in messages)
+                self._send_json(200, {
+                    'id': f'chatcmpl-{uuid.uuid4().hex}',
+                    'object': 'chat.completion',
+                    'created': int(time.time()),
+                    'model': params.get('model', 'fake-model'),
+                    'choices': [{
+                        'index': 0,
+                        'message': {'role': 'assistant', 'content': text},
+                        'finish_reason': 'stop'
+                    }],
+                    'usage': {
+                        'prompt_tokens': prompt_tokens,
+                        'completion_tokens': completion_tokens,
+                        'total_tokens': prompt_tokens + completion_tokens
+                    }
+                })
+
+            def _stream(self, params: Dict[str, Any], text: str) -> None:
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+
+                completion_id = f'chatcmpl-{uuid.uuid4().hex}'
+                delay = 1 / server.tokens_per_second if server.tokens_per_second else 0
+                pieces = [{'role': 'assistant', 'content': ''}] + [
+                    {'content': token} for token in server._split_tokens(text)
+                ]
+                try:
+                    for index, delta in enumerate(pieces):
+                        if delay and index:
+                            time.sleep(delay)
+                        self._write_event(completion_id, params, delta, None)
+                    self._write_event(completion_id, params, {}, 'stop')
+                    self._write_chunk(b'data: [DONE]\n\n')
+                    self._write_chunk(b'')
+                except (BrokenPipeError, ConnectionResetError):
+                    # El cliente cerró el stream antes de terminar (p. ej. JSON ya completo)
+                    self.close_connection = True
+
+            def _write_event(self, completion_id: str, params: Dict[str, Any],
+                             delta: Dict[str, Any], finish_reason: Optional[str]) -> None:
+                chunk = {
+                    'id': completion_id,
+                    'object': 'chat.completion.chunk',
+                    'created': int(time.time()),
+                    'model': params.get('model', 'fake-model'),
+                    'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}]
+                }
+                self._write_chunk(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+
+            def handle_one_request(self) -> None:
+                try:
+                    super().handle_one_request()
+                except (BrokenPipeError, ConnectionResetError):
+                    # El cliente cerró una conexión keep-alive: no es un error del servidor
+                    self.close_connection = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("Fake LLM: " + format % args)
+
+        return Handler
@@ -71,11 +71,27 @@ class ConfigManager:
                 "max_results": 100,
                 "timezone": "America/Santiago"
             },
+            "watch_config": {
+                "enabled": False,
+                "address": None,
+                "host": "0.0.0.0",
+                "port": 8080,
+                "calendars": ["primary"],
+                "renew_before_seconds": 3600
+            },
             "llm_config": {
                 "provider": "groq",
                 "model": "llama3-70b-8192",
                 "temperature": 0.7,
                 "max_tokens": 1024,
+                "context_window": 8192,
+                "base_url": None,
+                "http_pool": {
+                    "max_connections": 100,
+                    "max_keepalive_connections": 20,
+                    "keepalive_expiry": 30,
+                    "http2": True
+                },
                 "api_key": None
             },
             "cache_config": {
@@ -5,11 +5,17 @@ Módulo de gestión de credenciales para Calendar AI Bot.
 import json
 import logging
 import os
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from .lazy import lazy_import
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+# Los SDK de Google se importan en el primer uso para acelerar el arranque
+oauth2_credentials = lazy_import('google.oauth2.credentials')
+oauth_flow = lazy_import('google_auth_oauthlib.flow')
+auth_requests = lazy_import('google.auth.transport.requests')
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +45,7 @@ class CredentialsManager:
         
         self.credentials = self._load_credentials()
 
-    def _load_credentials(self) -> Optional[Credentials]:
+    def _load_credentials(self) -> Optional['Credentials']:
         """
         Carga las credenciales, refrescándolas si es necesario.
 
@@ -49,14 +55,14 @@ class CredentialsManager:
         try:
             # Intentar cargar token existente
             if os.path.exists(self.token_path):
-                credentials = Credentials.from_authorized_user_file(
+                credentials = oauth2_credentials.Credentials.from_authorized_user_file(
                     self.token_path, 
                     self.scopes
                 )
                 
                 # Refrescar token si está caducado
                 if credentials.expired and credentials.refresh_token:
-                    credentials.refresh(Request())
+                    credentials.refresh(auth_requests.Request())
                     self._save_credentials(credentials)
                 
                 return credentials
@@ -66,7 +72,7 @@ class CredentialsManager:
             logger.error(f"Error al cargar credenciales: {e}")
             return None
 
-    def _save_credentials(self, credentials: Credentials) -> None:
+    def _save_credentials(self, credentials: 'Credentials') -> None:
         """
         Guarda las credenciales en un archivo.
 
@@ -80,7 +86,7 @@ class CredentialsManager:
         except Exception as e:
             logger.error(f"Error al guardar credenciales: {e}")
 
-    def authenticate(self) -> Optional[Credentials]:
+    def authenticate(self) -> Optional['Credentials']:
         """
         Realiza el proceso de autenticación OAuth.
 
@@ -98,7 +104,7 @@ class CredentialsManager:
                 return None
 
             # Iniciar flujo de autenticación
-            flow = InstalledAppFlow.from_client_secrets_file(
+            flow = oauth_flow.InstalledAppFlow.from_client_secrets_file(
                 self.credentials_path, 
                 self.scopes
             )
@@ -124,7 +130,7 @@ class CredentialsManager:
         try:
             # Revocar token si existe
             if self.credentials:
-                self.credentials.revoke(Request())
+                self.credentials.revoke(auth_requests.Request())
             
             # Eliminar archivos de token
             if os.path.exists(self.token_path):
@@ -154,7 +160,7 @@ class CredentialsManager:
             
             # Intentar refrescar token
             if self.credentials.refresh_token:
-                self.credentials.refresh(Request())
+                self.credentials.refresh(auth_requests.Request())
                 self._save_credentials(self.credentials)
             
             return True
@@ -162,7 +168,7 @@ class CredentialsManager:
             logger.error(f"Error al validar credenciales: {e}")
             return False
 
-    def get_credentials(self) -> Optional[Credentials]:
+    def get_credentials(self) -> Optional['Credentials']:
         """
         Obtiene las credenciales, autenticándose si es necesario.
 
@@ -173,7 +179,25 @@ class CredentialsManager:
             return self.authenticate()
         return self.credentials
 
-    def update_scopes(self, new_scopes: list) -> Optional[Credentials]:
+    def get_auth_headers(self) -> Dict[str, str]:
+        """
+        Obtiene las cabeceras de autorización, refrescando el token si caducó.
+
+        Returns:
+            Cabeceras HTTP con el token de acceso, o vacío si no hay credenciales
+        """
+        try:
+            if not self.credentials:
+                return {}
+            if not self.credentials.valid and self.credentials.refresh_token:
+                self.credentials.refresh(auth_requests.Request())
+                self._save_credentials(self.credentials)
+            return {'Authorization': f'Bearer {self.credentials.token}'}
+        except Exception as e:
+            logger.error(f"Error al obtener cabeceras de autorización: {e}")
+            return {}
+
+    def update_scopes(self, new_scopes: list) -> Optional['Credentials']:
         """
         Actualiza los ámbitos de las credenciales.
 
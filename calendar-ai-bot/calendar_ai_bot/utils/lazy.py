@@ -0,0 +1,72 @@
+"""
+Importación diferida de dependencias pesadas.
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+class LazyModule:
+    """
+    Proxy de módulo que importa el módulo real en el primer acceso a un atributo.
+
+    Permite que los SDK de proveedores y de Google no se carguen al importar el
+    paquete, sino solo cuando se usan por primera vez.
+    """
+
+    def __init__(self, name: str):
+        """
+        Inicializa el proxy sin importar el módulo.
+
+        Args:
+            name: Nombre completo del módulo a importar
+        """
+        self._name = name
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Any:
+        """
+        Importa el módulo real si aún no se ha importado.
+
+        Returns:
+            Módulo importado
+        """
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    logger.debug(f"Importando módulo diferido: {self._name}")
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Indica si el módulo real ya fue importado.
+
+        Returns:
+            True si el módulo está cargado
+        """
+        return self._module is not None
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = 'cargado' if self.is_loaded else 'diferido'
+        return f"<LazyModule {self._name} ({state})>"
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Crea un proxy que importa un módulo en su primer uso.
+
+    Args:
+        name: Nombre completo del módulo
+
+    Returns:
+        Proxy del módulo
+    """
+    return LazyModule(name)
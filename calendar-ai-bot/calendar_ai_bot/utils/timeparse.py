@@ -0,0 +1,86 @@
+"""
+Parseo rápido de marcas de tiempo ISO 8601 / RFC 3339.
+"""
+
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+from dateutil.parser import parse as dateutil_parse
+
+logger = logging.getLogger(__name__)
+
+# Cadenas distintas que se mantienen parseadas (los eventos repiten mucho sus horas)
+PARSE_CACHE_SIZE = 8192
+
+def parse_iso_datetime(time_str: str) -> datetime:
+    """
+    Parsea una marca de tiempo sin caché.
+
+    Las cadenas estrictas que devuelve Calendar API ('2025-03-10T10:00:00-03:00',
+    '2025-03-10T13:00:00Z', '2025-03-10') se resuelven con `datetime.fromisoformat`;
+    el resto (formatos legibles, fracciones no admitidas en Python < 3.11)
+    recurre a `dateutil`.
+
+    Args:
+        time_str: Cadena de tiempo
+
+    Returns:
+        Datetime (sin zona si la cadena no la indica)
+
+    Raises:
+        ValueError: Si la cadena no es una fecha válida
+    """
+    try:
+        if time_str[-1:] in ('Z', 'z'):
+            return datetime.fromisoformat(time_str[:-1] + '+00:00')
+        return datetime.fromisoformat(time_str)
+    except ValueError:
+        return dateutil_parse(time_str)
+
+_parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(parse_iso_datetime)
+
+def parse_event_time(time_str: Optional[str], timezone: Any = None) -> Optional[datetime]:
+    """
+    Convierte una cadena de tiempo a datetime, con caché de las cadenas ya vistas.
+
+    Args:
+        time_str: Cadena de tiempo en formato ISO o legible
+        timezone: Zona horaria (pytz o tzinfo) para cadenas sin zona
+
+    Returns:
+        Datetime (con zona horaria si se indicó `timezone`) o None
+    """
+    if not time_str:
+        return None
+
+    try:
+        dt = _parse_cached(time_str)
+    except (ValueError, OverflowError, TypeError) as e:
+        logger.error(f"Error al parsear tiempo: {e}")
+        return None
+
+    if dt.tzinfo is None and timezone is not None:
+        dt = timezone.localize(dt) if hasattr(timezone, 'localize') else dt.replace(tzinfo=timezone)
+    return dt
+
+def parse_event_timestamp(time_str: Optional[str], timezone: Any = None) -> Optional[int]:
+    """
+    Convierte una cadena de tiempo a segundos epoch.
+
+    Args:
+        time_str: Cadena de tiempo en formato ISO o legible
+        timezone: Zona horaria para cadenas sin zona (si no, se usa la local)
+
+    Returns:
+        Segundos epoch o None
+    """
+    dt = parse_event_time(time_str, timezone)
+    return int(dt.timestamp()) if dt is not None else None
+
+def clear_parse_cache() -> None:
+    """
+    Vacía la caché de cadenas parseadas.
+    """
+    _parse_cached.cache_clear()
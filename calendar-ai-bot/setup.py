@@ -44,6 +44,9 @@ setup(
             "isort",
             "flake8",
             "mypy"
+        ],
+        "analytics": [
+            "numpy>=1.22"
         ]
     },
     keywords="calendar ai bot google automation scheduling",
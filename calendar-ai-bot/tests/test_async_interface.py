@@ -0,0 +1,144 @@
+"""
+Pruebas para la interfaz asíncrona de Google Calendar.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock
+
+import httpx
+from calendar_ai_bot.calendar.async_interface import AsyncCalendarInterface
+
+def _credentials():
+    manager = MagicMock()
+    manager.credentials.valid = True
+    manager.credentials.token = 'token-de-prueba'
+    return manager
+
+def _interface(handler, **kwargs):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncCalendarInterface(_credentials(), client=client, backoff_seconds=0, **kwargs)
+
+def test_iter_events_follows_pages():
+    """
+    Prueba la paginación asíncrona, la proyección de campos y la cabecera de autorización.
+    """
+    seen = []
+    pages = {
+        None: {'items': [{'id': 'e1'}, {'id': 'e2'}], 'nextPageToken': 'p2'},
+        'p2': {'items': [{'id': 'e3'}]}
+    }
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=pages[request.url.params.get('pageToken')])
+
+    async def run():
+        interface = _interface(handler)
+        return [event async for event in interface.iter_events('equipo@example.com', fields='timing')]
+
+    events = asyncio.run(run())
+
+    assert [event['id'] for event in events] == ['e1', 'e2', 'e3']
+    assert seen[0].url.raw_path.startswith(b'/calendar/v3/calendars/equipo%40example.com/events?')
+    assert seen[0].url.params['fields'] == 'nextPageToken,nextSyncToken,items(id,status,start,end)'
+    assert seen[0].headers['Authorization'] == 'Bearer token-de-prueba'
+
+def test_write_operations_and_retries():
+    """
+    Prueba crear, parchear y eliminar, reintentando un límite de tasa.
+    """
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.method == 'POST' and len(calls) == 1:
+            return httpx.Response(403, content=b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}')
+        if request.method == 'DELETE':
+            return httpx.Response(204)
+        if request.method == 'PATCH' and request.url.path.endswith('/missing'):
+            return httpx.Response(404, json={'error': {'code': 404}})
+        body = json.loads(request.content)
+        return httpx.Response(200, json={'id': 'e1', **body})
+
+    async def run():
+        interface = _interface(handler)
+        created = await interface.create_event('primary', {'summary': 'Reunión'})
+        patched = await interface.patch_event('primary', 'e1', {'summary': 'Otra'})
+        missing = await interface.patch_event('primary', 'missing', {'summary': 'x'})
+        deleted = await interface.delete_event('primary', 'e1')
+        return created, patched, missing, deleted
+
+    created, patched, missing, deleted = asyncio.run(run())
+
+    assert created == {'id': 'e1', 'summary': 'Reunión'}
+    assert patched['summary'] == 'Otra'
+    assert missing is None
+    assert deleted is True
+    assert [method for method, _ in calls] == ['POST', 'POST', 'PATCH', 'PATCH', 'DELETE']
+
+def test_concurrent_calls_overlap():
+    """
+    Prueba que muchas llamadas pequeñas se solapan en lugar de ejecutarse en serie.
+    """
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={'id': request.url.path.rsplit('/', 1)[-1]})
+
+    async def run():
+        interface = _interface(handler)
+        return await asyncio.gather(*(interface.get_event('primary', f'e{i}') for i in range(20)))
+
+    started = time.perf_counter()
+    events = asyncio.run(run())
+
+    assert [event['id'] for event in events] == [f'e{i}' for i in range(20)]
+    assert time.perf_counter() - started < 0.5
+
+def test_expired_token_refreshed_through_manager():
+    """
+    Prueba que con el token caducado se piden las cabeceras al gestor de credenciales.
+    """
+    manager = MagicMock()
+    manager.credentials.valid = False
+    manager.get_auth_headers.return_value = {'Authorization': 'Bearer nuevo'}
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers['Authorization'])
+        return httpx.Response(200, json={'items': [{'id': 'primary'}]})
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncCalendarInterface(manager, client=client) as interface:
+            return await interface.list_calendars()
+
+    assert asyncio.run(run()) == [{'id': 'primary'}]
+    assert seen == ['Bearer nuevo']
+
+def test_concurrent_refresh_happens_once():
+    """
+    Prueba que las corrutinas que esperan el candado reutilizan el token ya refrescado.
+    """
+    manager = MagicMock()
+    manager.credentials.valid = False
+
+    def refresh():
+        time.sleep(0.05)
+        manager.credentials.valid = True
+        manager.credentials.token = 'nuevo'
+        return {'Authorization': 'Bearer nuevo'}
+
+    manager.get_auth_headers.side_effect = refresh
+    client = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json={'items': []})
+    ))
+    # Se crea fuera del bucle de eventos, como al construirla en el arranque
+    interface = AsyncCalendarInterface(manager, client=client)
+
+    async def run():
+        await asyncio.gather(*(interface.list_calendars() for _ in range(5)))
+
+    asyncio.run(run())
+    assert manager.get_auth_headers.call_count == 1
@@ -0,0 +1,76 @@
+"""
+Pruebas para el lote columnar de eventos.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from calendar_ai_bot.calendar.batch import EventBatch  # noqa: E402
+from calendar_ai_bot.calendar.filters import CalendarFilter  # noqa: E402
+
+EVENTS = {
+    'trabajo@example.com': [
+        {'id': 'a', 'summary': 'Reunión de proyecto',
+         'start': {'dateTime': '2025-03-10T10:00:00-03:00'}, 'end': {'dateTime': '2025-03-10T11:00:00-03:00'}},
+        {'id': 'b', 'summary': 'Revisión',
+         'start': {'dateTime': '2025-03-12T09:00:00-03:00'}, 'end': {'dateTime': '2025-03-12T09:30:00-03:00'}},
+        {'id': 'c', 'summary': 'Sin hora'}
+    ],
+    'personal@example.com': [
+        {'id': 'd', 'summary': 'Cumpleaños', 'start': {'date': '2025-03-11'}, 'end': {'date': '2025-03-12'}},
+        {'id': 'e', 'summary': 'Reunión de proyecto', 'recurrence': ['RRULE:FREQ=WEEKLY'],
+         'start': {'dateTime': '2025-03-20T18:00:00-03:00'}, 'end': {'dateTime': '2025-03-20T20:00:00-03:00'}}
+    ]
+}
+
+@pytest.fixture
+def batch():
+    """
+    Fixture con un lote de dos calendarios.
+    """
+    return EventBatch.from_calendars(EVENTS, keep_source=True)
+
+def test_batch_filters_match_calendar_filter(batch):
+    """
+    Prueba que los filtros vectorizados coinciden con los de CalendarFilter.
+    """
+    calendar_filter = CalendarFilter()
+    flat = [event for events in EVENTS.values() for event in events]
+
+    for args in [('2025-03-11T00:00:00-03:00', None), (None, '2025-03-12T09:00:00-03:00'), (None, None)]:
+        expected = [e['id'] for e in calendar_filter.filter_by_date_range(flat, *args)]
+        assert list(calendar_filter.filter_by_date_range(batch, *args).ids) == expected
+
+    expected = [e['id'] for e in calendar_filter.filter_by_duration(flat, min_duration=timedelta(hours=1))]
+    assert list(batch.filter_by_duration(min_duration=timedelta(hours=1)).ids) == expected
+    assert [e['id'] for e in batch.filter_by_duration(max_duration=timedelta(minutes=45)).to_events()] == ['b']
+
+def test_batch_string_tables_and_categories(batch):
+    """
+    Prueba que los títulos se guardan una sola vez y las categorías como bits.
+    """
+    assert len(batch) == 5
+    assert batch.titles.count('Reunión de proyecto') == 1
+    assert batch.title[0] == batch.title[4]
+    assert list(batch.filter_by_category('meetings').ids) == ['a', 'e']
+    assert list(batch.filter_by_category('all_day').ids) == ['d']
+    assert list(batch.filter_by_category('recurring').ids) == ['e']
+    assert list(batch.filter_by_calendar('personal@example.com').ids) == ['d', 'e']
+
+def test_batch_duration_stats(batch):
+    """
+    Prueba las estadísticas de duración globales y por calendario.
+    """
+    stats = batch.duration_stats()
+    by_calendar = batch.duration_stats_by_calendar()
+
+    assert stats['count'] == 3
+    assert stats['total'] == 3.5 * 3600
+    assert stats['median'] == 3600
+    assert stats['min'] == 1800 and stats['max'] == 7200
+    assert by_calendar['trabajo@example.com'] == {'count': 2, 'total': 5400.0, 'mean': 2700.0}
+    assert by_calendar['personal@example.com']['count'] == 1
+    assert EventBatch.from_events([]).duration_stats()['count'] == 0
@@ -0,0 +1,93 @@
+"""
+Pruebas de integración de CalendarInterface contra el servidor local de Calendar.
+"""
+
+import pytest
+from calendar_ai_bot.calendar.interface import CalendarInterface
+from calendar_ai_bot.calendar.quota import QuotaScheduler
+from calendar_ai_bot.calendar.store import EventStore
+from calendar_ai_bot.testing import FakeCalendarServer
+
+def _event(i):
+    return {
+        'summary': f'Reunión {i}',
+        'start': {'dateTime': f'2025-03-10T{8 + i % 10:02d}:00:00-03:00'},
+        'end': {'dateTime': f'2025-03-10T{9 + i % 10:02d}:00:00-03:00'}
+    }
+
+@pytest.fixture
+def fake_calendar(tmp_path):
+    """
+    Fixture que inicia el servidor local y una interfaz apuntando a él.
+    """
+    with FakeCalendarServer() as server:
+        quota = QuotaScheduler(is_retryable=CalendarInterface._is_retryable_error, backoff_seconds=0.01)
+        yield server, server.create_interface(str(tmp_path), quota=quota)
+
+def test_pagination_and_incremental_sync(fake_calendar):
+    """
+    Prueba la paginación, la sincronización incremental y la resincronización ante 410.
+    """
+    server, interface = fake_calendar
+    server.add_events('primary', [_event(i) for i in range(25)])
+
+    assert len(list(interface.iter_events(page_size=10))) == 25
+    assert server.request_counts['events.list'] == 3
+
+    initial = interface.sync_events()
+    created = interface.create_event('primary', _event(99))
+    assert interface.delete_event('primary', server.events()[0]['id'])
+    changes = interface.sync_events()
+
+    assert initial.full_resync and len(initial.added) == 25
+    assert [e['id'] for e in changes.added] == [created['id']]
+    assert len(changes.cancelled) == 1
+
+    server.expire_sync_tokens()
+    assert interface.sync_events().full_resync
+
+def test_new_store_refresh_ignores_interface_token(fake_calendar):
+    """
+    Prueba que una réplica nueva se sincroniza completa aunque la interfaz ya tenga token.
+    """
+    server, interface = fake_calendar
+    server.add_events('primary', [_event(i) for i in range(3)])
+    assert interface.sync_events().full_resync
+
+    store = EventStore(':memory:')
+    first = store.refresh(interface)
+    assert first.full_resync and store.count('primary') == 3
+
+    interface.create_event('primary', _event(9))
+    second = store.refresh(interface)
+    assert not second.full_resync and len(second.added) == 1
+    assert store.count('primary') == 4
+    store.close()
+
+def test_writes_batches_and_conflicts(fake_calendar):
+    """
+    Prueba lotes, parches condicionales y disponibilidad contra el servidor local.
+    """
+    server, interface = fake_calendar
+
+    results = interface.batch_create_events('primary', [_event(i) for i in range(3)])
+    assert all(result['ok'] for result in results)
+    assert server.request_counts['batch'] == 1
+    assert len(server.events()) == 3
+
+    event = results[0]['response']
+    assert interface.patch_event('primary', event['id'], {'summary': 'x'}, etag='"viejo"') is None
+    assert interface.patch_event_from('primary', event, dict(event, summary='Nueva'))['summary'] == 'Nueva'
+
+    busy = interface.get_busy_intervals(['primary'], '2025-03-10T00:00:00Z', '2025-03-11T00:00:00Z')
+    assert {'start': '2025-03-10T11:00:00Z', 'end': '2025-03-10T12:00:00Z'} in busy['primary']
+
+def test_error_injection_is_retried(fake_calendar):
+    """
+    Prueba que los errores inyectados se reintentan a través del planificador de cuota.
+    """
+    server, interface = fake_calendar
+    server.fail_next(403, count=2)
+
+    assert [c['id'] for c in interface.list_calendars()] == ['primary']
+    assert interface.quota.metrics()['interactive']['retries'] == 2
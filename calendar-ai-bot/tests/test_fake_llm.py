@@ -0,0 +1,73 @@
+"""
+Pruebas de LLMClient contra el proveedor LLM local.
+"""
+
+import json
+
+import pytest
+from calendar_ai_bot.llm.client import LLMClient
+from calendar_ai_bot.testing import FakeLLMServer
+
+@pytest.fixture
+def fake_llm():
+    """
+    Fixture que inicia el proveedor LLM local.
+    """
+    with FakeLLMServer() as server:
+        yield server
+
+@pytest.mark.parametrize('provider', ['groq', 'openai'])
+def test_base_url_routes_both_providers(fake_llm, provider):
+    """
+    Prueba que `base_url` dirige ambos SDK al servidor local con respuestas deterministas.
+    """
+    url = fake_llm.groq_base_url if provider == 'groq' else fake_llm.base_url
+    client = LLMClient({'provider': provider, 'api_key': 'test-key', 'base_url': url,
+                        'model': 'modelo-local', 'share_clients': False})
+
+    first = client._generate_text('Resume la reunión de planificación')
+    second = client._generate_text('Resume la reunión de planificación')
+
+    assert first == second
+    assert first.startswith('Respuesta simulada')
+    assert fake_llm.requests[-1]['model'] == 'modelo-local'
+
+def test_streaming_json_and_error_injection(fake_llm):
+    """
+    Prueba el streaming SSE y que el SDK reintenta los 503 inyectados.
+    """
+    fake_llm.responder = lambda messages, params: json.dumps({'fecha': '2025-03-10'}) + ' ' + 'texto ' * 50
+    client = LLMClient({'provider': 'openai', 'api_key': 'test-key', 'base_url': fake_llm.base_url,
+                        'stream_responses': True, 'share_clients': False})
+    fake_llm.fail_next(503)
+
+    text, value = client._generate_json('¿Cuándo nos reunimos?')
+
+    assert value == {'fecha': '2025-03-10'}
+    assert fake_llm.status_counts == {503: 1, 200: 1}
+    assert fake_llm.requests[-1]['stream'] is True
+    assert fake_llm.requests[-1]['response_format'] == {'type': 'json_object'}
+
+def test_reset_keep_alive_connection_is_silent(fake_llm, capsys):
+    """
+    Prueba que un cliente que reinicia una conexión keep-alive no produce trazas del servidor.
+    """
+    import socket
+    import struct
+    import time
+    from urllib.parse import urlparse
+
+    address = urlparse(fake_llm.base_url)
+    body = json.dumps({'model': 'modelo-local', 'messages': [{'role': 'user', 'content': 'hola'}]})
+    request = (f"POST /v1/chat/completions HTTP/1.1\r\nHost: {address.netloc}\r\n"
+               f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n{body}")
+
+    with socket.create_connection((address.hostname, address.port)) as sock:
+        sock.sendall(request.encode('utf-8'))
+        assert sock.recv(65536).startswith(b'HTTP/1.1 200')
+        # SO_LINGER en cero cierra con RST en lugar de FIN
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+    time.sleep(0.2)
+
+    assert 'Traceback' not in capsys.readouterr().err
+    assert len(fake_llm.requests) == 1
@@ -0,0 +1,43 @@
+"""
+Pruebas de regresión del tiempo de importación del paquete.
+"""
+
+import json
+import subprocess
+import sys
+
+# Presupuesto holgado para evitar falsos positivos en máquinas lentas;
+# benchmarks/bench_import_time.py aplica el presupuesto estricto.
+IMPORT_BUDGET_SECONDS = 0.5
+
+HEAVY_MODULES = ['groq', 'openai', 'googleapiclient.discovery', 'google.oauth2.credentials',
+                 'google_auth_oauthlib.flow', 'google.auth.transport.requests']
+
+def _run(code):
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+def test_package_import_does_not_load_sdks():
+    """
+    Prueba que importar el paquete no carga los SDK de proveedores ni de Google.
+    """
+    loaded = _run(
+        "import json, sys\n"
+        "import calendar_ai_bot, calendar_ai_bot.calendar, calendar_ai_bot.llm, calendar_ai_bot.utils\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+
+    assert loaded == []
+
+def test_package_import_time_budget():
+    """
+    Prueba que la importación del paquete se mantiene dentro del presupuesto.
+    """
+    elapsed = _run(
+        "import json, time\n"
+        "start = time.perf_counter()\n"
+        "import calendar_ai_bot, calendar_ai_bot.calendar, calendar_ai_bot.llm, calendar_ai_bot.utils\n"
+        "print(json.dumps(time.perf_counter() - start))"
+    )
+
+    assert elapsed < IMPORT_BUDGET_SECONDS
@@ -6,7 +6,20 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
-from calendar_ai_bot.calendar.interface import CalendarInterface
+from calendar_ai_bot.calendar.interface import CalendarInterface, default_quota_scheduler
+from calendar_ai_bot.calendar.quota import QuotaScheduler
+
+def _bare_interface():
+    """
+    Crea una interfaz sin inicializar con un servicio simulado y un planificador propio.
+    """
+    interface = CalendarInterface.__new__(CalendarInterface)
+    interface.service = MagicMock()
+    interface.quota = QuotaScheduler(requests_per_second=1000,
+                                     is_retryable=CalendarInterface._is_retryable_error,
+                                     sleep=lambda delay: None)
+    interface.quota_user = 'token.json'
+    return interface
 
 def test_calendar_interface_initialization():
     """
@@ -42,8 +55,7 @@ def test_list_calendars():
     Prueba el método de listado de calendarios.
     """
     # Create a mock interface with a mock service
-    interface = CalendarInterface.__new__(CalendarInterface)
-    interface.service = MagicMock()
+    interface = _bare_interface()
     
     # Configure the mock service response
     mock_calendar_list = MagicMock()
@@ -79,3 +91,442 @@ def test_list_calendars():
     finally:
         # Restore the original method
         CalendarInterface.list_calendars = original_list_calendars
+
+def _paged_interface(pages):
+    """
+    Crea una interfaz cuyo servicio simulado devuelve páginas por pageToken.
+    """
+    interface = _bare_interface()
+    requested = []
+
+    def list_events(**kwargs):
+        requested.append(kwargs)
+        request = MagicMock()
+        request.execute.return_value = pages[kwargs.get('pageToken')]
+        return request
+
+    interface.service.events.return_value.list.side_effect = list_events
+    return interface, requested
+
+def test_iter_events_follows_pages_lazily():
+    """
+    Prueba que iter_events sigue nextPageToken y solicita cada página bajo demanda.
+    """
+    interface, requested = _paged_interface({
+        None: {'items': [{'id': 'a'}, {'id': 'b'}], 'nextPageToken': 'p2'},
+        'p2': {'items': [{'id': 'c'}]}
+    })
+
+    events = interface.iter_events('primary')
+
+    assert next(events)['id'] == 'a'
+    assert len(requested) == 1
+    assert [event['id'] for event in events] == ['b', 'c']
+    assert len(requested) == 2
+    assert requested[0]['maxResults'] == 2500
+    assert requested[1]['pageToken'] == 'p2'
+
+def test_get_events_limits_results_across_pages():
+    """
+    Prueba que get_events respeta max_results y ya no trunca en la primera página.
+    """
+    interface, requested = _paged_interface({
+        None: {'items': [{'id': 'a'}, {'id': 'b'}], 'nextPageToken': 'p2'},
+        'p2': {'items': [{'id': 'c'}, {'id': 'd'}]}
+    })
+
+    assert [event['id'] for event in interface.get_events(max_results=3)] == ['a', 'b', 'c']
+    assert requested[0]['maxResults'] == 3
+
+def test_sync_events_incremental_and_gone(tmp_path):
+    """
+    Prueba la sincronización incremental y la resincronización completa ante 410 Gone.
+    """
+    from googleapiclient.errors import HttpError
+    from calendar_ai_bot.calendar.sync import SyncTokenStore
+
+    store = SyncTokenStore(str(tmp_path / 'sync_tokens.json'))
+    interface, requested = _paged_interface({
+        None: {'items': [{'id': 'a'}, {'id': 'b'}], 'nextSyncToken': 'tok1'}
+    })
+
+    changes = interface.sync_events('primary', token_store=store)
+
+    assert changes.full_resync is True
+    assert [event['id'] for event in changes.added] == ['a', 'b']
+    assert SyncTokenStore(store.token_file).get('primary') == 'tok1'
+
+    def list_events(**kwargs):
+        requested.append(kwargs)
+        request = MagicMock()
+        if kwargs.get('syncToken') == 'tok1':
+            request.execute.return_value = {
+                'items': [
+                    {'id': 'a', 'status': 'confirmed'},
+                    {'id': 'b', 'status': 'cancelled'},
+                    {'id': 'c', 'status': 'confirmed'}
+                ],
+                'nextSyncToken': 'tok2'
+            }
+        else:
+            request.execute.side_effect = HttpError(MagicMock(status=410), b'Gone')
+        return request
+
+    interface.service.events.return_value.list.side_effect = list_events
+
+    changes = interface.sync_events('primary', token_store=store, known_ids={'a', 'b'})
+
+    assert changes.full_resync is False
+    assert [event['id'] for event in changes.updated] == ['a']
+    assert [event['id'] for event in changes.cancelled] == ['b']
+    assert [event['id'] for event in changes.added] == ['c']
+    assert store.get('primary') == 'tok2'
+    assert 'timeMin' not in requested[-1]
+
+    store.set('primary', 'expired')
+    interface.service.events.return_value.list.side_effect = lambda **kwargs: MagicMock(
+        execute=MagicMock(side_effect=HttpError(MagicMock(status=410), b'Gone'))
+    ) if kwargs.get('syncToken') else MagicMock(
+        execute=MagicMock(return_value={'items': [{'id': 'z'}], 'nextSyncToken': 'tok3'})
+    )
+
+    changes = interface.sync_events('primary', token_store=store)
+
+    assert changes.full_resync is True
+    assert [event['id'] for event in changes.added] == ['z']
+    assert store.get('primary') == 'tok3'
+
+def test_sync_tokens_are_kept_per_account(tmp_path):
+    """
+    Prueba que dos cuentas comparten el archivo de tokens sin pisar su calendario 'primary'.
+    """
+    from calendar_ai_bot.calendar.sync import SyncTokenStore
+
+    path = str(tmp_path / 'sync_tokens.json')
+    ana = SyncTokenStore(path, account='ana_token.json')
+    luis = SyncTokenStore(path, account='luis_token.json')
+
+    ana.set('primary', 'tok-ana')
+    luis.set('primary', 'tok-luis')
+    luis.clear()
+
+    assert SyncTokenStore(path, account='ana_token.json').get('primary') == 'tok-ana'
+    assert SyncTokenStore(path, account='luis_token.json').get('primary') is None
+    assert [p.name for p in tmp_path.iterdir()] == ['sync_tokens.json']
+
+def test_batch_delete_retries_only_failed_items():
+    """
+    Prueba que los lotes respetan el límite por lote y el planificador reintenta solo los fallos transitorios.
+    """
+    from googleapiclient.errors import HttpError
+
+    interface = _bare_interface()
+    interface.service.events.return_value.delete.side_effect = lambda **kwargs: kwargs['eventId']
+    attempts = {}
+    batch_sizes = []
+
+    def new_batch(callback):
+        added = []
+        batch = MagicMock()
+        batch.add.side_effect = lambda request, request_id: added.append((request, request_id))
+
+        def execute():
+            batch_sizes.append(len(added))
+            for event_id, request_id in added:
+                attempts[event_id] = attempts.get(event_id, 0) + 1
+                if event_id == 'e1' and attempts[event_id] == 1:
+                    callback(request_id, None, HttpError(MagicMock(status=503), b'Unavailable'))
+                elif event_id == 'e2':
+                    callback(request_id, None, HttpError(MagicMock(status=404), b'Not Found'))
+                else:
+                    callback(request_id, '', None)
+
+        batch.execute.side_effect = execute
+        return batch
+
+    interface.service.new_batch_http_request.side_effect = new_batch
+    event_ids = [f'e{i}' for i in range(60)]
+
+    results = interface.batch_delete_events('primary', event_ids)
+
+    assert batch_sizes == [50, 1, 10]
+    assert attempts['e1'] == 2 and attempts['e2'] == 1 and attempts['e3'] == 1
+    assert interface.quota.metrics()['interactive']['retries'] == 1
+    assert results[1]['ok'] is True
+    assert results[2] == {'ok': False, 'response': None, 'status': 404, 'error': results[2]['error']}
+    assert all(result['ok'] for index, result in enumerate(results) if index != 2)
+
+def test_get_events_field_presets():
+    """
+    Prueba que los presets de campos se traducen al parámetro fields.
+    """
+    interface, requested = _paged_interface({None: {'items': [{'id': 'a'}]}})
+
+    interface.get_events(fields='timing')
+    interface.get_events(fields='full')
+    interface.get_events(fields='id,summary')
+
+    assert requested[0]['fields'] == 'nextPageToken,nextSyncToken,items(id,status,start,end)'
+    assert 'fields' not in requested[1]
+    assert requested[2]['fields'] == 'nextPageToken,nextSyncToken,items(id,summary)'
+
+def test_get_events_for_calendars_merges_by_start(monkeypatch):
+    """
+    Prueba que la descarga paralela usa un servicio por hilo y mezcla por hora de inicio.
+    """
+    import threading
+
+    pages = {
+        'trabajo': [
+            {'id': 't1', 'start': {'dateTime': '2025-03-10T09:00:00-03:00'}},
+            {'id': 't2', 'start': {'dateTime': '2025-03-10T15:00:00Z'}}
+        ],
+        'personal': [
+            {'id': 'p1', 'start': {'date': '2025-03-10'}},
+            {'id': 'p2', 'start': {'dateTime': '2025-03-10T11:00:00-03:00'}}
+        ]
+    }
+    built_in_threads = []
+
+    def build_service():
+        built_in_threads.append(threading.get_ident())
+        service = MagicMock()
+        service.events.return_value.list.side_effect = lambda **kwargs: MagicMock(
+            execute=MagicMock(return_value={'items': pages[kwargs['calendarId']]})
+        )
+        return service
+
+    interface = _bare_interface()
+    interface._thread_local = threading.local()
+    interface._build_service = build_service
+
+    events = interface.get_events_for_calendars(['trabajo', 'personal'], max_workers=2)
+
+    assert [event['id'] for event in events] == ['p1', 't1', 'p2', 't2']
+    assert threading.get_ident() not in built_in_threads
+
+def test_get_busy_intervals_chunks_and_caches():
+    """
+    Prueba que freeBusy se consulta de a 50 calendarios y reutiliza resultados recientes.
+    """
+    interface = _bare_interface()
+    interface.busy_cache_ttl = 60
+    interface._busy_cache = {}
+    bodies = []
+
+    def query(body):
+        bodies.append(body)
+        return MagicMock(execute=MagicMock(return_value={'calendars': {
+            item['id']: {'busy': [{'start': '2025-03-10T13:00:00Z', 'end': '2025-03-10T14:00:00Z'}]}
+            for item in body['items']
+        }}))
+
+    interface.service.freebusy.return_value.query.side_effect = query
+    emails = [f'persona{i}@example.com' for i in range(60)]
+
+    busy = interface.get_busy_intervals(emails, '2025-03-10T00:00:00Z', '2025-03-11T00:00:00Z')
+    again = interface.get_busy_intervals(emails[:5], '2025-03-10T00:00:00Z', '2025-03-11T00:00:00Z')
+
+    assert [len(body['items']) for body in bodies] == [50, 10]
+    assert len(busy) == 60
+    assert again['persona0@example.com'][0]['start'] == '2025-03-10T13:00:00Z'
+    assert len(bodies) == 2
+
+def test_get_busy_intervals_reports_unknown_calendars():
+    """
+    Prueba que los calendarios con error se omiten y se informan, en vez de figurar libres.
+    """
+    interface = _bare_interface()
+    interface.busy_cache_ttl = 60
+    interface._busy_cache = {}
+    interface.service.freebusy.return_value.query.return_value.execute.return_value = {'calendars': {
+        'ana@example.com': {'busy': []},
+        'luis@example.com': {'errors': [{'domain': 'global', 'reason': 'notFound'}]}
+    }}
+    failures = {}
+
+    busy = interface.get_busy_intervals(['ana@example.com', 'luis@example.com'],
+                                        '2025-03-10T00:00:00Z', '2025-03-11T00:00:00Z', failures=failures)
+
+    assert busy == {'ana@example.com': []}
+    assert failures == {'luis@example.com': [{'domain': 'global', 'reason': 'notFound'}]}
+
+def test_get_busy_intervals_skips_failed_queries():
+    """
+    Prueba que un error HTTP de freeBusy se registra y deja los calendarios como desconocidos.
+    """
+    from googleapiclient.errors import HttpError
+
+    interface = _bare_interface()
+    interface.busy_cache_ttl = 60
+    interface._busy_cache = {}
+    error = HttpError(MagicMock(status=404), b'Not Found')
+    interface.service.freebusy.return_value.query.return_value.execute.side_effect = error
+    failures = {}
+
+    assert interface.get_busy_intervals(['ana@example.com'], '2025-03-10T00:00:00Z',
+                                        '2025-03-11T00:00:00Z') == {}
+    assert interface.get_busy_intervals(['ana@example.com'], '2025-03-10T00:00:00Z',
+                                        '2025-03-11T00:00:00Z', failures=failures) == {}
+    assert failures == {'ana@example.com': error}
+
+def test_conditional_reads_reuse_cached_body():
+    """
+    Prueba que las lecturas envían If-None-Match y reutilizan el cuerpo ante 304.
+    """
+    from googleapiclient.errors import HttpError
+    from calendar_ai_bot.calendar.etags import ETagStore
+
+    interface = _bare_interface()
+    interface.etags = ETagStore()
+    sent_headers = []
+    responses = [
+        {'etag': '"v1"', 'items': [{'id': 'primary'}]},
+        HttpError(MagicMock(status=304), b''),
+        {'etag': '"v2"', 'items': [{'id': 'primary'}, {'id': 'nuevo'}]}
+    ]
+
+    def make_request():
+        request = MagicMock()
+        request.headers = {}
+        sent_headers.append(request.headers)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            request.execute.side_effect = response
+        else:
+            request.execute.return_value = response
+        return request
+
+    interface.service.calendarList.return_value.list.side_effect = make_request
+
+    first = interface.list_calendars()
+    second = interface.list_calendars()
+    third = interface.list_calendars()
+
+    assert 'If-None-Match' not in sent_headers[0]
+    assert sent_headers[1]['If-None-Match'] == '"v1"'
+    assert second == first
+    assert [calendar['id'] for calendar in third] == ['primary', 'nuevo']
+    assert interface.etags.get('calendarList')['etag'] == '"v2"'
+
+def test_compute_event_patch():
+    """
+    Prueba que el parche contiene solo los campos cambiados o borrados explícitamente.
+    """
+    from calendar_ai_bot.calendar.patch import DELETED, compute_event_patch
+
+    old = {
+        'id': 'e1', 'etag': '"1"', 'summary': 'Reunión', 'location': 'Sala 1',
+        'start': {'dateTime': '2025-03-10T10:00:00-03:00', 'timeZone': 'America/Santiago'},
+        'end': {'dateTime': '2025-03-10T11:00:00-03:00', 'timeZone': 'America/Santiago'},
+        'attendees': [{'email': 'ana@example.com'}]
+    }
+    new = {
+        'summary': 'Reunión',
+        'start': {'dateTime': '2025-03-10T12:00:00-03:00', 'timeZone': 'America/Santiago'},
+        'end': {'dateTime': '2025-03-10T13:00:00-03:00', 'timeZone': 'America/Santiago'},
+        'attendees': [{'email': 'ana@example.com'}, {'email': 'luis@example.com'}]
+    }
+
+    assert compute_event_patch(old, new) == {
+        'start': {'dateTime': '2025-03-10T12:00:00-03:00'},
+        'end': {'dateTime': '2025-03-10T13:00:00-03:00'},
+        'attendees': [{'email': 'ana@example.com'}, {'email': 'luis@example.com'}]
+    }
+    assert compute_event_patch(old, dict(old)) == {}
+    assert compute_event_patch(old, {'summary': 'Otra'}) == {'summary': 'Otra'}
+    assert compute_event_patch(old, {
+        'location': DELETED, 'description': DELETED,
+        'start': {'date': '2025-03-10', 'dateTime': DELETED, 'timeZone': DELETED}
+    }) == {'location': None, 'start': {'date': '2025-03-10', 'dateTime': None, 'timeZone': None}}
+
+def test_patch_event_sends_if_match():
+    """
+    Prueba que patch_event envía If-Match y descarta el parche ante 412.
+    """
+    from googleapiclient.errors import HttpError
+    from calendar_ai_bot.calendar.etags import ETagStore
+
+    interface = _bare_interface()
+    interface.etags = ETagStore()
+    request = MagicMock()
+    request.headers = {}
+    request.execute.side_effect = HttpError(MagicMock(status=412), b'Precondition Failed')
+    interface.service.events.return_value.patch.return_value = request
+
+    old = {'id': 'e1', 'etag': '"7"', 'summary': 'Antes'}
+    result = interface.patch_event_from('primary', old, {'summary': 'Después'})
+
+    assert result is None
+    assert request.headers['If-Match'] == '"7"'
+    interface.service.events.return_value.patch.assert_called_once_with(
+        calendarId='primary', eventId='e1', body={'summary': 'Después'}
+    )
+
+def test_execute_retries_rate_limit_through_scheduler():
+    """
+    Prueba que un 403 rateLimitExceeded se reintenta en lugar de descartar resultados.
+    """
+    from googleapiclient.errors import HttpError
+
+    interface = _bare_interface()
+    interface.service.events.return_value.list.return_value.execute.side_effect = [
+        HttpError(MagicMock(status=403), b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}'),
+        {'items': [{'id': 'e1'}]}
+    ]
+
+    assert [e['id'] for e in interface.get_events()] == ['e1']
+    assert interface.quota.metrics()['interactive']['retries'] == 1
+
+def test_services_shared_per_credentials(tmp_path, monkeypatch):
+    """
+    Prueba que el documento de descubrimiento se parsea una vez y el servicio se comparte.
+    """
+    import json
+    from googleapiclient import discovery
+    from calendar_ai_bot.calendar.service import ServiceRegistry
+
+    token_file = tmp_path / 'token.json'
+    token_file.write_text(json.dumps({
+        'token': 'x', 'refresh_token': 'r', 'client_id': 'c', 'client_secret': 's'
+    }))
+    monkeypatch.setattr(discovery, 'build', MagicMock(side_effect=AssertionError('sin build dinámico')))
+    registry = ServiceRegistry()
+
+    first = CalendarInterface('cred.json', str(token_file), str(tmp_path / 'sync.json'), services=registry)
+    second = CalendarInterface('cred.json', str(token_file), str(tmp_path / 'sync.json'), services=registry)
+    own = first._build_service()
+
+    assert first.service is second.service
+    assert first.quota is second.quota is default_quota_scheduler
+    assert own is not first.service
+    assert len(registry) == 1
+    assert registry.discovery_document() is registry.discovery_document()
+    assert hasattr(first.service, 'events')
+
+def test_shared_service_uses_one_http_client_per_thread(tmp_path):
+    """
+    Prueba que las solicitudes del servicio compartido no comparten httplib2.Http entre hilos.
+    """
+    import json
+    import threading
+    from calendar_ai_bot.calendar.service import ServiceRegistry
+
+    token_file = tmp_path / 'token.json'
+    token_file.write_text(json.dumps({
+        'token': 'x', 'refresh_token': 'r', 'client_id': 'c', 'client_secret': 's'
+    }))
+    service = ServiceRegistry().get_service(str(token_file))
+
+    def request_http():
+        return service.events().list(calendarId='primary').http
+
+    main_http = request_http()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(request_http()))
+    thread.start()
+    thread.join()
+
+    assert request_http() is main_http
+    assert other[0] is not main_http
+    assert other[0].credentials is main_http.credentials
@@ -0,0 +1,26 @@
+"""
+Pruebas para la extracción incremental de JSON.
+"""
+
+from calendar_ai_bot.llm.json_stream import IncrementalJSONExtractor, extract_json
+
+def test_extract_json_with_prose_and_fences():
+    """
+    Prueba la extracción de JSON rodeado de prosa y bloques de código.
+    """
+    text = 'Claro, aquí tienes {el análisis}:\n```json\n{"total": 3, "notas": "usa {llaves}"}\n```'
+
+    assert extract_json(text) == {'total': 3, 'notas': 'usa {llaves}'}
+    assert extract_json('sin json') is None
+    assert extract_json('[1, 2] y {"a": 1}', expected_type=dict) == {'a': 1}
+
+def test_incremental_extractor_across_chunks():
+    """
+    Prueba que los valores se entregan apenas se completan entre fragmentos.
+    """
+    extractor = IncrementalJSONExtractor()
+
+    assert extractor.feed('Respuesta: {"a": [1, 2') == []
+    assert extractor.feed(', "}"], "b": "x\\"y"') == []
+    assert extractor.feed('} sobra {"c"') == [{'a': [1, 2, '}'], 'b': 'x"y'}]
+    assert extractor.feed(': true}') == [{'c': True}]
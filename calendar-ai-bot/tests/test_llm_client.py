@@ -0,0 +1,201 @@
+"""
+Pruebas para el cliente de Modelo de Lenguaje.
+"""
+
+import json
+
+import pytest
+from calendar_ai_bot.llm.client import LLMClient
+
+@pytest.fixture
+def llm_client():
+    """
+    Fixture para crear un cliente LLM sin llamadas reales a la API.
+    """
+    return LLMClient({'provider': 'groq', 'api_key': 'test-key'})
+
+def _make_events(count):
+    return [
+        {
+            'id': f'evt{i}',
+            'summary': f'Reunión {i}',
+            'start': {'dateTime': '2025-03-10T10:00:00-03:00'},
+            'end': {'dateTime': '2025-03-10T11:00:00-03:00'}
+        }
+        for i in range(count)
+    ]
+
+def test_generate_event_summaries_packed(llm_client, monkeypatch):
+    """
+    Prueba que varios eventos se resumen en una sola solicitud.
+    """
+    prompts = []
+
+    def fake_generate(prompt):
+        prompts.append(prompt)
+        return 'Aquí están:\n```json\n' + json.dumps([
+            {'id': '#1', 'summary': 'Resumen 1'},
+            {'id': '#0', 'summary': 'Resumen 0'},
+            {'id': '#2', 'summary': 'Resumen 2'}
+        ]) + '\n```'
+
+    monkeypatch.setattr(llm_client, '_generate_text', fake_generate)
+
+    summaries = llm_client.generate_event_summaries(_make_events(3))
+
+    assert summaries == ['Resumen 0', 'Resumen 1', 'Resumen 2']
+    assert len(prompts) == 1
+
+def test_generate_event_summaries_fallback(llm_client, monkeypatch):
+    """
+    Prueba que los eventos no recuperados se resumen individualmente.
+    """
+    def fake_generate(prompt):
+        if '[#0]' in prompt:
+            return '[{"id": "#0", "summary": "Resumen 0"}, {"id": "#1", "summ'
+        return 'Resumen individual'
+
+    monkeypatch.setattr(llm_client, '_generate_text', fake_generate)
+
+    summaries = llm_client.generate_event_summaries(_make_events(2), batch_size=2)
+
+    assert summaries == ['Resumen 0', 'Resumen individual']
+
+def test_generate_event_summaries_duplicate_ids(llm_client, monkeypatch):
+    """
+    Prueba que eventos con el mismo ID o sin ID reciben cada uno su propio resumen.
+    """
+    events = _make_events(3)
+    events[1]['id'] = events[0]['id']
+    del events[2]['id']
+
+    def fake_generate(prompt):
+        return json.dumps([{'id': f'#{i}', 'summary': f'Resumen {i}'} for i in (2, 0, 1)])
+
+    monkeypatch.setattr(llm_client, '_generate_text', fake_generate)
+
+    assert llm_client.generate_event_summaries(events) == ['Resumen 0', 'Resumen 1', 'Resumen 2']
+
+def test_choose_packed_batch_size(llm_client):
+    """
+    Prueba que el tamaño de lote respeta el presupuesto de tokens de salida.
+    """
+    llm_client.max_tokens = 400
+    llm_client.packed_summary_tokens = 100
+
+    assert llm_client._choose_packed_batch_size(_make_events(50)) == 4
+    assert llm_client._choose_packed_batch_size([]) == 1
+
+def test_compact_prompt_encoding(llm_client):
+    """
+    Prueba que el prompt compacto declara zona horaria y dominios una sola vez.
+    """
+    events = [
+        {
+            'summary': 'Planificación',
+            'start': {'dateTime': '2025-03-10T09:00:00-03:00'},
+            'end': {'dateTime': '2025-03-10T10:00:00-03:00'},
+            'attendees': [{'email': 'ana@example.com'}, {'email': 'luis@example.com'}]
+        },
+        {
+            'summary': 'Revisión',
+            'start': {'dateTime': '2025-03-11T15:30:00-03:00'},
+            'end': {'dateTime': '2025-03-11T16:00:00-03:00'},
+            'attendees': [{'email': 'ana@example.com'}]
+        }
+    ]
+
+    compact = llm_client._build_packed_summary_prompt([('1', events[0]), ('2', events[1])])
+    llm_client.compact_prompts = False
+    verbose = llm_client._build_packed_summary_prompt([('1', events[0]), ('2', events[1])])
+
+    assert 'TZ=-03:00' in compact
+    assert '-03:00' not in compact.replace('TZ=-03:00', '')
+    assert '[1]Planificación|D+0 09:00-10:00|ana@a,luis@a' in compact
+    assert '[2]Revisión|D+1 15:30-16:00|ana@a' in compact
+    assert '  ' not in compact
+    assert len(compact) < len(verbose)
+
+def test_analyze_schedule_json_mode(llm_client, monkeypatch):
+    """
+    Prueba que el análisis solicita modo JSON y tolera texto alrededor del JSON.
+    """
+    requests = []
+
+    class FakeCompletions:
+        def create(self, **params):
+            requests.append(params)
+            message = type('Message', (), {'content': 'Análisis:\n```json\n{"total_events": 1}\n```'})
+            choice = type('Choice', (), {'message': message})
+            return type('Completion', (), {'choices': [choice]})
+
+    fake_chat = type('Chat', (), {'completions': FakeCompletions()})
+    monkeypatch.setattr(llm_client, 'client', type('Client', (), {'chat': fake_chat}))
+
+    analysis = llm_client.analyze_schedule(_make_events(1))
+
+    assert analysis == {'total_events': 1}
+    assert requests[0]['response_format'] == {'type': 'json_object'}
+
+def test_json_mode_dropped_when_model_rejects_it(llm_client, monkeypatch):
+    """
+    Prueba que un 400 por response_format se reintenta una vez sin modo JSON.
+    """
+    requests = []
+
+    class BadRequest(Exception):
+        status_code = 400
+
+    class FakeCompletions:
+        def create(self, **params):
+            requests.append(params)
+            if 'response_format' in params:
+                raise BadRequest('response_format no soportado')
+            message = type('Message', (), {'content': '{"total_events": 1}'})
+            choice = type('Choice', (), {'message': message})
+            return type('Completion', (), {'choices': [choice]})
+
+    fake_chat = type('Chat', (), {'completions': FakeCompletions()})
+    monkeypatch.setattr(llm_client, 'client', type('Client', (), {'chat': fake_chat}))
+
+    assert llm_client.analyze_schedule(_make_events(1)) == {'total_events': 1}
+    assert llm_client.analyze_schedule(_make_events(1)) == {'total_events': 1}
+    assert ['response_format' in params for params in requests] == [True, False, False]
+
+def test_generate_json_streaming_stops_early(llm_client, monkeypatch):
+    """
+    Prueba que en streaming se devuelve el primer objeto JSON sin consumir el resto.
+    """
+    consumed = []
+
+    def fake_stream(prompt, json_mode=False):
+        for chunk in ['{"fecha": "2025-', '03-10"}', ' texto adicional', ' que no se lee']:
+            consumed.append(chunk)
+            yield chunk
+
+    llm_client.stream_responses = True
+    monkeypatch.setattr(llm_client, '_stream_text', fake_stream)
+
+    text, value = llm_client._generate_json('prompt')
+
+    assert value == {'fecha': '2025-03-10'}
+    assert len(consumed) == 2
+
+def test_clients_share_connection_pool():
+    """
+    Prueba que los clientes con la misma clave reutilizan el cliente del SDK.
+    """
+    first = LLMClient({'provider': 'groq', 'api_key': 'shared-key'})
+    second = LLMClient({'provider': 'groq', 'api_key': 'shared-key'})
+    other = LLMClient({'provider': 'groq', 'api_key': 'other-key'})
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert other.client._client is first.client._client
+
+def test_unsupported_provider():
+    """
+    Prueba que un proveedor desconocido produce un error.
+    """
+    with pytest.raises(ValueError):
+        LLMClient({'provider': 'desconocido', 'api_key': 'x'})
@@ -0,0 +1,80 @@
+"""
+Pruebas para el modelo compacto de eventos.
+"""
+
+from datetime import timedelta
+
+from calendar_ai_bot.calendar.filters import CalendarFilter
+from calendar_ai_bot.calendar.models import Event, to_events
+from calendar_ai_bot.calendar.organizer import EventOrganizer
+from calendar_ai_bot.calendar.processor import EventProcessor
+
+API_EVENTS = [
+    {
+        'id': 'e1',
+        'summary': 'Reunión de Proyecto',
+        'start': {'dateTime': '2025-03-10T10:00:00-03:00'},
+        'end': {'dateTime': '2025-03-10T11:30:00-03:00'},
+        'organizer': {'email': 'ana@example.com'},
+        'attendees': [{'email': 'ana@example.com'}, {'email': 'luis@example.com'}, {'displayName': 'Sala'}],
+        'recurrence': ['RRULE:FREQ=WEEKLY']
+    },
+    {
+        'id': 'e2',
+        'summary': 'Cumpleaños',
+        'start': {'date': '2025-03-10'},
+        'end': {'date': '2025-03-11'}
+    },
+    {
+        'id': 'e3',
+        'summary': 'Llamada',
+        'start': {'dateTime': '2025-03-10T11:00:00-03:00'},
+        'end': {'dateTime': '2025-03-10T12:00:00-03:00'}
+    }
+]
+
+def test_event_from_api_normalizes_fields():
+    """
+    Prueba que el modelo guarda tiempos epoch, participantes sin duplicados y título en minúsculas.
+    """
+    event, all_day, _ = to_events(API_EVENTS)
+
+    assert event.start == 1741611600
+    assert event.end - event.start == 5400
+    assert event.title_lower == 'reunión de proyecto'
+    assert event.participants == ('ana@example.com', 'luis@example.com')
+    assert event.recurring is True
+    assert event.raw is None
+    assert not hasattr(event, '__dict__')
+    assert all_day.all_day is True
+    assert all_day.end - all_day.start == 86400
+
+def test_components_accept_events_and_dicts():
+    """
+    Prueba que filtros, procesador y organizador dan el mismo resultado con Event y con diccionarios.
+    """
+    events = to_events(API_EVENTS, keep_raw=True)
+    calendar_filter, processor, organizer = CalendarFilter(), EventProcessor(), EventOrganizer()
+
+    for batch in (API_EVENTS, events):
+        ids = lambda items: [e['id'] if isinstance(e, dict) else e.id for e in items]
+        assert ids(calendar_filter.filter_by_title(batch, 'reunión')) == ['e1']
+        assert ids(calendar_filter.filter_by_participants(batch, 'luis@example.com')) == ['e1']
+        assert ids(calendar_filter.filter_by_duration(batch, min_duration=timedelta(hours=1, minutes=15))) == ['e1']
+        assert ids(calendar_filter.filter_by_date_range(batch, '2025-03-10T10:30:00-03:00')) == ['e3']
+        assert [ids(pair) for pair in processor.detect_event_conflicts(batch)] == [['e1', 'e3']]
+        assert ids(organizer.group_events_by_category(batch)['all_day']) == ['e2']
+
+    analyzed = processor.analyze_event(events[0])
+    assert analyzed['start_time'].hour == 10
+    assert analyzed['duration'] == timedelta(hours=1, minutes=30)
+
+def test_event_without_times():
+    """
+    Prueba que un evento sin inicio ni fin no tiene duración.
+    """
+    event = Event.from_api({'id': 'x'})
+
+    assert event.start is None
+    assert event.duration is None
+    assert event.title == ''
@@ -149,3 +149,44 @@ def test_find_optimal_time_slot_no_events(event_organizer):
     end_time = datetime.fromisoformat(optimal_slot['end'])
     
     assert (end_time - start_time) == duration
+
+def test_find_optimal_time_slot_from_busy(event_organizer):
+    """
+    Prueba la búsqueda de espacios a partir de intervalos freeBusy.
+    """
+    busy = {
+        'ana@example.com': [{'start': '2025-03-10T10:00:00-03:00', 'end': '2025-03-10T11:00:00-03:00'}],
+        'luis@example.com': [{'start': '2025-03-10T14:00:00-03:00', 'end': '2025-03-10T15:30:00-03:00'}]
+    }
+
+    optimal_slot = event_organizer.find_optimal_time_slot_from_busy(busy, timedelta(hours=1))
+
+    assert optimal_slot is not None
+    start_time = datetime.fromisoformat(optimal_slot['start'])
+    end_time = datetime.fromisoformat(optimal_slot['end'])
+    assert (end_time - start_time) == timedelta(hours=1)
+
+def test_find_optimal_time_slot_from_busy_merges_overlaps(event_organizer):
+    """
+    Prueba que un intervalo contenido en otro no abre un hueco falso.
+    """
+    tz = event_organizer.timezone
+    today = datetime.now(tz).date()
+    tomorrow = today + timedelta(days=1)
+
+    def at(day, hour, minute=0):
+        return tz.localize(datetime(day.year, day.month, day.day, hour, minute)).isoformat()
+
+    busy = {
+        'ana@example.com': [
+            {'start': at(today, 10), 'end': at(today, 15)},
+            {'start': at(tomorrow, 10), 'end': at(tomorrow, 13)}
+        ],
+        'luis@example.com': [{'start': at(tomorrow, 10, 30), 'end': at(tomorrow, 11)}]
+    }
+
+    optimal_slot = event_organizer.find_optimal_time_slot_from_busy(
+        busy, timedelta(hours=1), days_ahead=2, min_time='10:00', max_time='15:00'
+    )
+
+    assert optimal_slot == {'start': at(tomorrow, 13), 'end': at(tomorrow, 14), 'date': tomorrow.isoformat()}
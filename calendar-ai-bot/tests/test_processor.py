@@ -2,6 +2,8 @@
 Pruebas para el procesador de eventos de calendario.
 """
 
+import random
+
 import pytest
 from datetime import datetime, timedelta
 from calendar_ai_bot.calendar.processor import EventProcessor
@@ -65,6 +67,55 @@ def test_detect_event_conflicts(event_processor):
     assert conflicts[0][0] == events[0]
     assert conflicts[0][1] == events[1]
 
+def test_detect_event_conflicts_matches_pairwise(event_processor):
+    """
+    Prueba que el barrido encuentra los mismos conflictos que comparar todos los pares.
+    """
+    rng = random.Random(7)
+    base = datetime(2025, 3, 10, 8)
+    events = []
+    for i in range(300):
+        start = base + timedelta(minutes=15 * rng.randint(0, 400))
+        end = start + timedelta(minutes=15 * rng.randint(0, 12))
+        events.append({
+            'id': f'e{i}',
+            'start': {'dateTime': start.isoformat() + '-03:00'},
+            'end': {'dateTime': end.isoformat() + '-03:00'}
+        })
+
+    times = {e['id']: (e['start']['dateTime'], e['end']['dateTime']) for e in events}
+    expected = set()
+    for i, a in enumerate(events):
+        for j, b in enumerate(events):
+            (start_a, end_a), (start_b, _) = times[a['id']], times[b['id']]
+            if (start_a, i) < (start_b, j) and start_b < end_a:
+                expected.add((a['id'], b['id']))
+
+    conflicts = event_processor.detect_event_conflicts(events)
+
+    assert {(a['id'], b['id']) for a, b in conflicts} == expected
+    assert len(conflicts) == len(expected)
+
+def test_iter_event_conflicts_with_all_day_events(event_processor):
+    """
+    Prueba que los eventos de día completo se comparan entre sí y, opcionalmente, con los eventos con hora.
+    """
+    events = [
+        {'id': 'vacaciones', 'start': {'date': '2025-03-10'}, 'end': {'date': '2025-03-15'}},
+        {'id': 'reunion', 'start': {'dateTime': '2025-03-10T10:00:00-03:00'},
+         'end': {'dateTime': '2025-03-10T11:00:00-03:00'}},
+        {'id': 'feriado', 'start': {'date': '2025-03-12'}, 'end': {'date': '2025-03-13'}},
+        {'id': 'sin_hora', 'summary': 'Pendiente'}
+    ]
+
+    conflicts = event_processor.iter_event_conflicts(events)
+
+    assert next(conflicts)[1]['id'] == 'feriado'
+    assert list(conflicts) == []
+    assert {(a['id'], b['id']) for a, b in event_processor.detect_event_conflicts(events, include_all_day=True)} == {
+        ('vacaciones', 'reunion'), ('vacaciones', 'feriado')
+    }
+
 def test_categorize_events(event_processor):
     """
     Prueba la categorización de eventos.
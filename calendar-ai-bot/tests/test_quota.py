@@ -0,0 +1,98 @@
+"""
+Pruebas para el planificador de cuota de Calendar API.
+"""
+
+import threading
+import time
+
+import pytest
+from calendar_ai_bot.calendar.quota import BACKGROUND, INTERACTIVE, QuotaScheduler, TokenBucket
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_token_bucket_refills_at_rate():
+    """
+    Prueba que la cubeta limita ráfagas y se recarga con el tiempo.
+    """
+    clock = _Clock()
+    bucket = TokenBucket(rate=2.0, capacity=2.0, clock=clock)
+
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    clock.now = 0.5
+    assert bucket.try_acquire() == 0
+
+def test_submit_retries_rate_limit_errors():
+    """
+    Prueba que los errores de límite de tasa se reintentan con backoff.
+    """
+    delays = []
+    calls = []
+
+    class RateLimited(Exception):
+        pass
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RateLimited()
+        return 'ok'
+
+    scheduler = QuotaScheduler(is_retryable=lambda e: isinstance(e, RateLimited),
+                               backoff_seconds=1.0, sleep=delays.append)
+
+    assert scheduler.submit(flaky, 'ana') == 'ok'
+    assert len(delays) == 2
+    assert 1.0 <= delays[0] < 2.0 and 2.0 <= delays[1] < 3.0
+    assert scheduler.metrics()['interactive']['retries'] == 2
+
+    with pytest.raises(ValueError):
+        scheduler.submit(lambda: (_ for _ in ()).throw(ValueError()), 'ana')
+    assert scheduler.metrics()['interactive']['failures'] == 1
+
+def test_interactive_requests_jump_background_queue():
+    """
+    Prueba que, con la cuota agotada, las solicitudes interactivas se atienden primero.
+    """
+    scheduler = QuotaScheduler(requests_per_second=20, burst=1)
+    scheduler.acquire('ana')
+    order = []
+
+    def worker(name, priority):
+        scheduler.acquire('ana', priority)
+        order.append(name)
+
+    background = [threading.Thread(target=worker, args=(f'bg{i}', BACKGROUND)) for i in range(3)]
+    for thread in background:
+        thread.start()
+    time.sleep(0.01)
+    interactive = threading.Thread(target=worker, args=('ui', INTERACTIVE))
+    interactive.start()
+
+    for thread in background + [interactive]:
+        thread.join(timeout=2)
+
+    assert order.index('ui') <= 1
+    metrics = scheduler.metrics()
+    assert metrics['background']['requests'] == 3
+    assert metrics['background']['max_wait'] > 0
+    assert metrics['background']['queued'] == 0
+
+def test_users_have_independent_buckets():
+    """
+    Prueba que la cuota de un usuario no frena a otro.
+    """
+    scheduler = QuotaScheduler(requests_per_second=1, burst=1)
+    scheduler.acquire('ana')
+
+    started = time.monotonic()
+    scheduler.acquire('luis')
+
+    assert time.monotonic() - started < 0.1
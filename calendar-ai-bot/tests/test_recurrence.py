@@ -0,0 +1,129 @@
+"""
+Pruebas para la expansión local de eventos recurrentes.
+"""
+
+from unittest.mock import MagicMock
+
+from calendar_ai_bot.calendar.interface import CalendarInterface
+from calendar_ai_bot.calendar.quota import QuotaScheduler
+from calendar_ai_bot.calendar.recurrence import RecurrenceExpander
+
+def _weekly_master():
+    return {
+        'id': 'serie',
+        'summary': 'Reunión semanal',
+        'attendees': [{'email': 'ana@example.com'}],
+        'start': {'dateTime': '2025-03-03T09:00:00-03:00', 'timeZone': 'America/Santiago'},
+        'end': {'dateTime': '2025-03-03T10:00:00-03:00', 'timeZone': 'America/Santiago'},
+        'recurrence': [
+            'RRULE:FREQ=WEEKLY;BYDAY=MO;COUNT=6',
+            'EXDATE;TZID=America/Santiago:20250310T090000',
+            'RDATE;TZID=America/Santiago:20250305T150000'
+        ]
+    }
+
+def test_expand_applies_exdate_rdate_and_exceptions():
+    """
+    Prueba que la expansión aplica EXDATE, RDATE y las instancias modificadas o canceladas.
+    """
+    events = [
+        _weekly_master(),
+        {
+            'id': 'serie_20250317T120000Z',
+            'recurringEventId': 'serie',
+            'originalStartTime': {'dateTime': '2025-03-17T09:00:00-03:00'},
+            'summary': 'Reunión semanal (movida)',
+            'start': {'dateTime': '2025-03-18T11:00:00-03:00'},
+            'end': {'dateTime': '2025-03-18T12:00:00-03:00'}
+        },
+        {
+            'id': 'serie_20250324T120000Z',
+            'recurringEventId': 'serie',
+            'originalStartTime': {'dateTime': '2025-03-24T12:00:00Z'},
+            'status': 'cancelled'
+        },
+        {
+            'id': 'simple',
+            'start': {'dateTime': '2025-03-04T09:00:00-03:00'},
+            'end': {'dateTime': '2025-03-04T09:30:00-03:00'}
+        }
+    ]
+
+    expanded = RecurrenceExpander().expand(events, '2025-03-01T00:00:00-03:00', '2025-03-26T00:00:00-03:00')
+
+    assert [event['id'] for event in expanded] == [
+        'serie_20250303T120000Z', 'simple', 'serie_20250305T180000Z', 'serie_20250317T120000Z'
+    ]
+    first = expanded[0]
+    assert first['end']['dateTime'] == '2025-03-03T10:00:00-03:00'
+    assert first['recurringEventId'] == 'serie'
+    assert 'recurrence' not in first
+    assert first['attendees'] is events[0]['attendees']
+    assert expanded[2]['start']['dateTime'] == '2025-03-05T15:00:00-03:00'
+    assert expanded[3]['summary'] == 'Reunión semanal (movida)'
+
+def test_expand_keeps_wall_clock_across_dst():
+    """
+    Prueba que las instancias conservan la hora local al cambiar el horario de verano.
+    """
+    master = _weekly_master()
+    master['recurrence'] = ['RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20250415T000000Z']
+    master['start']['dateTime'] = '2025-03-31T09:00:00-03:00'
+    master['end']['dateTime'] = '2025-03-31T10:00:00-03:00'
+
+    expanded = RecurrenceExpander().expand([master], '2025-03-30T00:00:00-03:00', '2025-04-30T00:00:00-04:00')
+
+    assert [event['start']['dateTime'] for event in expanded] == [
+        '2025-03-31T09:00:00-03:00', '2025-04-07T09:00:00-04:00', '2025-04-14T09:00:00-04:00'
+    ]
+
+def test_expand_all_day_and_reuses_parsed_rules():
+    """
+    Prueba la expansión de eventos de día completo en ventanas distintas con las mismas reglas.
+    """
+    master = {
+        'id': 'cumple',
+        'etag': '"1"',
+        'start': {'date': '2024-05-20'},
+        'end': {'date': '2024-05-21'},
+        'recurrence': ['RRULE:FREQ=YEARLY']
+    }
+    expander = RecurrenceExpander()
+
+    first = expander.expand([master], '2025-01-01T00:00:00-03:00', '2026-01-01T00:00:00-03:00')
+    second = expander.expand([master], '2030-01-01T00:00:00-03:00', '2031-01-01T00:00:00-03:00')
+
+    assert [(e['id'], e['start'], e['end']) for e in first] == [
+        ('cumple_20250520', {'date': '2025-05-20'}, {'date': '2025-05-21'})
+    ]
+    assert second[0]['originalStartTime'] == {'date': '2030-05-20'}
+    assert len(expander._rules) == 1
+
+def test_get_expanded_events_requests_masters():
+    """
+    Prueba que get_expanded_events pide los maestros sin expandir y los expande localmente.
+    """
+    interface = CalendarInterface.__new__(CalendarInterface)
+    interface.service = MagicMock()
+    interface.quota = QuotaScheduler(is_retryable=CalendarInterface._is_retryable_error)
+    interface.quota_user = 'token.json'
+    requested = []
+
+    def list_events(**kwargs):
+        requested.append(kwargs)
+        request = MagicMock()
+        request.execute.return_value = {'items': [_weekly_master()]}
+        return request
+
+    interface.service.events.return_value.list.side_effect = list_events
+
+    events = interface.get_expanded_events('primary', '2025-03-01T00:00:00-03:00',
+                                           '2025-04-01T00:00:00-03:00', fields='timing')
+
+    assert len(events) == 5
+    assert requested[0]['singleEvents'] is False
+    assert 'orderBy' not in requested[0]
+    assert requested[0]['fields'] == (
+        'nextPageToken,nextSyncToken,items(id,status,start,end,'
+        'recurrence,recurringEventId,originalStartTime)'
+    )
@@ -0,0 +1,92 @@
+"""
+Pruebas para la réplica local de eventos.
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from calendar_ai_bot.calendar.store import EventStore
+from calendar_ai_bot.calendar.sync import EventChangeSet
+
+@pytest.fixture
+def event_store():
+    """
+    Fixture para crear una réplica en memoria con eventos de prueba.
+    """
+    store = EventStore(':memory:')
+    store.upsert_events('primary', [
+        {
+            'id': 'e1',
+            'summary': 'Reunión de trabajo',
+            'start': {'dateTime': '2025-03-10T10:00:00-03:00'},
+            'end': {'dateTime': '2025-03-10T11:00:00-03:00'},
+            'attendees': [{'email': 'Usuario1@example.com'}]
+        },
+        {
+            'id': 'e2',
+            'summary': 'Cumpleaños',
+            'start': {'date': '2025-03-15'},
+            'end': {'date': '2025-03-16'}
+        },
+        {
+            'id': 'e3',
+            'summary': 'Llamada de proyecto',
+            'start': {'dateTime': '2025-03-20T14:00:00-03:00'},
+            'end': {'dateTime': '2025-03-20T14:15:00-03:00'},
+            'organizer': {'email': 'usuario1@example.com'}
+        }
+    ])
+    yield store
+    store.close()
+
+def test_query_events(event_store):
+    """
+    Prueba las consultas por rango, participante, título y duración.
+    """
+    def ids(events):
+        return [event['id'] for event in events]
+
+    assert ids(event_store.query_events('primary')) == ['e1', 'e2', 'e3']
+    assert ids(event_store.query_events(start='2025-03-12', end='2025-03-31')) == ['e3']
+    assert ids(event_store.query_events(participant='usuario1@example.com')) == ['e1', 'e3']
+    assert ids(event_store.query_events(title_contains='PROYECTO')) == ['e3']
+    assert ids(event_store.query_events(min_duration=timedelta(minutes=30))) == ['e1']
+    assert ids(event_store.query_events(
+        start='2025-03-10T10:30:00-03:00', end='2025-03-10T12:00:00-03:00', overlapping=True
+    )) == ['e1']
+    assert ids(event_store.query_events(start='2025-03-15', end='2025-03-16', overlapping=True)) == ['e2']
+
+    event_store.upsert_events('primary', [{'id': 'e4', 'summary': None, 'start': {'date': '2025-03-18'}}])
+    assert ids(event_store.query_events('primary')) == ['e1', 'e2', 'e4', 'e3']
+
+def test_refresh_applies_incremental_changes(event_store):
+    """
+    Prueba que refresh aplica agregados, actualizaciones y cancelaciones.
+    """
+    interface = MagicMock()
+
+    def sync_events(calendar_id, token_store=None, known_ids=None):
+        changes = EventChangeSet(calendar_id)
+        for event in [
+            {'id': 'e1', 'summary': 'Reunión movida',
+             'start': {'dateTime': '2025-03-11T10:00:00-03:00'},
+             'end': {'dateTime': '2025-03-11T11:00:00-03:00'}},
+            {'id': 'e2', 'status': 'cancelled'},
+            {'id': 'e4', 'summary': 'Nuevo',
+             'start': {'dateTime': '2025-03-21T09:00:00-03:00'},
+             'end': {'dateTime': '2025-03-21T10:00:00-03:00'}}
+        ]:
+            changes.add(event, known=event['id'] in known_ids)
+        return changes
+
+    interface.sync_events.side_effect = sync_events
+
+    changes = event_store.refresh(interface, 'primary')
+
+    assert [event['id'] for event in changes.updated] == ['e1']
+    assert [event['id'] for event in changes.added] == ['e4']
+    assert event_store.count('primary') == 3
+    assert [event['id'] for event in event_store.query_events(participant='usuario1@example.com')] == ['e3']
+    assert event_store.query_events(start='2025-03-11', end='2025-03-12')[0]['summary'] == 'Reunión movida'
+    assert event_store.query_events(title_contains='cumpleaños') == []
@@ -0,0 +1,49 @@
+"""
+Pruebas para el parseo rápido de marcas de tiempo.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytz
+
+from calendar_ai_bot.utils import timeparse
+from calendar_ai_bot.utils.timeparse import parse_event_time, parse_event_timestamp, parse_iso_datetime
+
+def test_parse_rfc3339_without_dateutil():
+    """
+    Prueba que las cadenas de la API se resuelven con fromisoformat, incluida la 'Z'.
+    """
+    with patch.object(timeparse, 'dateutil_parse', side_effect=AssertionError):
+        with_offset = parse_iso_datetime('2025-03-10T10:00:00-03:00')
+        utc = parse_iso_datetime('2025-03-10T13:00:00Z')
+
+    assert with_offset == utc
+    assert with_offset.utcoffset() == timedelta(hours=-3)
+    assert utc.tzinfo == timezone.utc
+
+def test_parse_falls_back_to_dateutil_and_localizes():
+    """
+    Prueba la recuperación con dateutil y la localización de cadenas sin zona.
+    """
+    santiago = pytz.timezone('America/Santiago')
+
+    readable = parse_event_time('March 10 2025 10:00', santiago)
+    naive = parse_event_time('2025-03-10T10:00:00', santiago)
+
+    assert readable == naive == santiago.localize(datetime(2025, 3, 10, 10))
+    assert parse_event_timestamp('2025-03-10T13:00:00Z') == 1741611600
+    assert parse_event_time('no es una fecha') is None
+    assert parse_event_time(None) is None
+
+def test_parse_event_time_caches_strings():
+    """
+    Prueba que las cadenas repetidas se sirven desde la caché.
+    """
+    timeparse.clear_parse_cache()
+
+    first = parse_event_time('2025-03-10T10:00:00-03:00')
+    second = parse_event_time('2025-03-10T10:00:00-03:00')
+
+    assert first is second
+    assert timeparse._parse_cached.cache_info().hits == 1
@@ -0,0 +1,173 @@
+"""
+Pruebas para la sincronización dirigida por notificaciones push.
+"""
+
+import urllib.error
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+from calendar_ai_bot.calendar.watch import NotificationReceiver, SyncJobQueue, WatchManager
+
+class _Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def _fake_interface(expiration_seconds):
+    interface = MagicMock()
+    interface.watch_events.side_effect = lambda calendar_id, address, channel_id, token=None, ttl_seconds=None: {
+        'id': channel_id,
+        'resourceId': f'res-{calendar_id}',
+        'expiration': str(int(expiration_seconds * 1000))
+    }
+    return interface
+
+def _notify(port, headers):
+    request = urllib.request.Request(f'http://127.0.0.1:{port}/notifications', data=b'',
+                                     headers=headers, method='POST')
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+@pytest.fixture
+def receiver_setup():
+    manager = WatchManager(_fake_interface(10_000), 'https://bot.example.com/notifications',
+                           clock=_Clock(0))
+    receiver = NotificationReceiver(manager.handle_notification, port=0)
+    receiver.start()
+    yield manager, receiver
+    receiver.stop()
+
+def test_notifications_enqueue_sync_jobs(receiver_setup):
+    """
+    Prueba que las notificaciones se convierten en trabajos de sincronización sin duplicados.
+    """
+    manager, receiver = receiver_setup
+    assert manager.watch('primary')
+    channel = manager.channels['primary']
+
+    def headers(state, token=channel['token']):
+        return {
+            'X-Goog-Channel-ID': channel['id'],
+            'X-Goog-Channel-Token': token,
+            'X-Goog-Resource-ID': channel['resource_id'],
+            'X-Goog-Resource-State': state
+        }
+
+    assert _notify(receiver.port, headers('sync')) == 200
+    assert len(manager.jobs) == 0
+
+    assert _notify(receiver.port, headers('exists')) == 200
+    assert _notify(receiver.port, headers('exists')) == 200
+    assert _notify(receiver.port, headers('exists', token='falso')) == 404
+
+    assert manager.jobs.get(timeout=1) == 'primary'
+    assert manager.jobs.get(timeout=0.01) is None
+
+def test_channels_renewed_before_expiry():
+    """
+    Prueba que los canales próximos a expirar se reemplazan y el anterior se cierra.
+    """
+    clock = _Clock(0)
+    interface = _fake_interface(7200)
+    manager = WatchManager(interface, 'https://bot.example.com/notifications',
+                           renew_before_seconds=3600, clock=clock)
+    manager.watch('primary')
+    old_channel = manager.channels['primary']
+
+    assert manager.renew_expiring() == []
+    assert manager.seconds_until_renewal() == 3600
+
+    clock.now = 3700
+    assert manager.renew_expiring() == ['primary']
+    assert manager.channels['primary']['id'] != old_channel['id']
+    interface.stop_channel.assert_called_once_with(old_channel['id'], 'res-primary')
+    assert not manager.handle_notification({
+        'x-goog-channel-id': old_channel['id'],
+        'x-goog-channel-token': old_channel['token'],
+        'x-goog-resource-state': 'exists'
+    })
+
+def test_failed_watch_falls_back_to_polling():
+    """
+    Prueba que un calendario sin canal queda marcado para sondeo.
+    """
+    interface = MagicMock()
+    interface.watch_events.return_value = None
+    manager = WatchManager(interface, 'https://bot.example.com/notifications')
+
+    assert not manager.watch('equipo@example.com')
+    assert manager.polled_calendars == ['equipo@example.com']
+
+def test_short_granted_ttl_does_not_renew_continuously():
+    """
+    Prueba que un canal concedido con vida menor que la antelación no se renueva en cada vuelta.
+    """
+    clock = _Clock(0)
+    interface = MagicMock()
+    interface.watch_events.side_effect = lambda calendar_id, address, channel_id, token=None, ttl_seconds=None: {
+        'id': channel_id, 'resourceId': 'res', 'expiration': str(int((clock.now + 600) * 1000))
+    }
+    manager = WatchManager(interface, 'https://bot.example.com/notifications',
+                           renew_before_seconds=3600, clock=clock)
+    manager.watch('primary')
+
+    assert manager.seconds_until_renewal() == 300
+    assert manager.renew_expiring() == []
+
+    clock.now = 300
+    assert manager.renew_expiring() == ['primary']
+    assert manager.seconds_until_renewal() == 300
+    assert manager.renew_expiring() == []
+
+    interface.watch_events.side_effect = lambda calendar_id, address, channel_id, token=None, ttl_seconds=None: {
+        'id': channel_id, 'resourceId': 'res', 'expiration': str(int(clock.now * 1000))
+    }
+    assert manager.renew_expiring() == []
+    clock.now = 600
+    assert manager.renew_expiring() == ['primary']
+    assert manager.seconds_until_renewal() == 60
+    assert interface.watch_events.call_count == 3
+
+def test_failed_renewal_drops_stale_channel():
+    """
+    Prueba que una renovación fallida descarta el canal anterior y pasa a sondeo.
+    """
+    clock = _Clock(0)
+    interface = _fake_interface(7200)
+    manager = WatchManager(interface, 'https://bot.example.com/notifications',
+                           renew_before_seconds=3600, clock=clock)
+    manager.watch('primary')
+    old_channel = manager.channels['primary']
+
+    interface.watch_events.side_effect = None
+    interface.watch_events.return_value = None
+    clock.now = 3700
+
+    assert manager.renew_expiring() == []
+    assert manager.channels == {}
+    assert manager.polled_calendars == ['primary']
+    assert manager.seconds_until_renewal() is None
+    assert not manager.handle_notification({
+        'x-goog-channel-id': old_channel['id'],
+        'x-goog-channel-token': old_channel['token'],
+        'x-goog-resource-state': 'exists'
+    })
+    manager.stop_all()
+    interface.stop_channel.assert_not_called()
+
+def test_sync_job_queue_deduplicates():
+    """
+    Prueba que un calendario pendiente no se encola dos veces.
+    """
+    jobs = SyncJobQueue()
+    assert jobs.put('a')
+    assert not jobs.put('a')
+    assert jobs.put('b')
+    assert jobs.get(timeout=0) == 'a'
+    assert jobs.put('a')